@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite for the breeding path finder
+
+Times every stage of a path query separately over a fixed set of (start, target) pairs from the real
+breeding CSV: loading the data, find_shortest_paths, group_paths_with_prefixes and JSON serialization.
+Each query runs cold (memoized tables are dropped between repeats), like a fresh sidecar call.
+Results are written as JSON and compared against a stored baseline; the exit code is 1 on a regression.
+
+Usage:
+    python benchmarks/bench_path_finder.py                    # Run, write results and compare to the baseline
+    python benchmarks/bench_path_finder.py --update-baseline  # Accept the current numbers as the new baseline
+    python benchmarks/bench_path_finder.py --engine iddfs --repeats 10
+    python benchmarks/bench_path_finder.py --pairs benchmarks/worst_queries.json   # Pairs from find_worst_queries.py
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from shortest_breeding_path import BreedingPathFinder, dataset_hash
+
+DEFAULT_CSV = os.path.join(os.path.dirname(BENCHMARK_DIR), "palworld_breeding_combinations.csv")
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results", "latest.json")
+
+# (label, start, target, max_paths): everyday queries, the deepest pairs in the data, the largest
+# path sets (route guides) and pairs the condensation proves unreachable
+BENCHMARK_PAIRS = [
+    ("typical", "Lamball", "Anubis", 20),
+    ("typical-wide", "Foxparks", "Penking", 20),
+    ("one-step", "Depresso", "Lovander", 20),
+    ("deep-7", "Blazamut", "Teafant", 20),
+    ("deep-6", "Whalaska", "Teafant", 20),
+    ("route-guide", "Cattiva", "Jormuntide", 10000),
+    ("route-guide-deep", "Blazamut", "Teafant", 10000),
+    ("unreachable", "Lamball", "Jetragon", 20),
+    ("unreachable-legendary", "Chikipi", "Frostallion", 20),
+]
+
+STAGES = ["find_shortest_paths", "group_paths_with_prefixes", "json_serialization"]
+
+
+def time_call(function: Callable, repeats: int, setup: Optional[Callable] = None) -> dict:
+    """Median and minimum wall time of a call in seconds, running setup (untimed) before each repeat"""
+    samples = []
+    result = None
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        result = function()
+        samples.append(time.perf_counter() - started)
+    return {"median": statistics.median(samples), "min": min(samples), "result": result}
+
+
+def load_pairs(fixture_file: str) -> List[tuple]:
+    """(label, start, target, max_paths) pairs from a fixture written by find_worst_queries.py"""
+    with open(fixture_file, 'r', encoding='utf-8') as f:
+        fixture = json.load(f)
+    return [(pair["label"], pair["start"], pair["target"], pair["max_paths"]) for pair in fixture["pairs"]]
+
+
+def run_benchmarks(csv_file: str, engine: str, repeats: int, benchmark_pairs: List[tuple] = BENCHMARK_PAIRS) -> dict:
+    """Run every stage for every benchmark pair and return the machine-readable results"""
+    load = time_call(lambda: BreedingPathFinder(csv_file, json_mode=True), repeats)
+    finder = load.pop("result")
+
+    pairs = {}
+    for label, start, target, max_paths in benchmark_pairs:
+        search = time_call(lambda: finder.find_shortest_paths(start, target, max_paths, engine=engine), repeats,
+                           setup=finder.clear_caches)
+        paths = search.pop("result")
+        search_info = finder.last_search_info
+
+        structured = [finder.structure_path(i, path, target) for i, path in enumerate(paths)]
+        grouping = time_call(lambda: finder.group_paths_with_prefixes(structured), repeats)
+        grouping.pop("result")
+
+        finder.clear_caches()
+        response = finder.format_expandable_paths(start, target, max_paths, engine=engine)
+        serialization = time_call(lambda: json.dumps(response, indent=2), repeats)
+        payload = serialization.pop("result")
+
+        pairs[label] = {
+            "start": start,
+            "target": target,
+            "max_paths": max_paths,
+            "engine": search_info.get("engine", engine),
+            "paths": len(paths),
+            "steps": len(paths[0]) - 1 if paths else None,
+            "json_bytes": len(payload.encode('utf-8')),
+            "find_shortest_paths": search,
+            "group_paths_with_prefixes": grouping,
+            "json_serialization": serialization
+        }
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "dataset": os.path.basename(csv_file),
+            "dataset_hash": dataset_hash(csv_file),
+            "pals": len(finder.pal_names),
+            "engine": engine,
+            "repeats": repeats
+        },
+        "load_breeding_data": load,
+        "pairs": pairs
+    }
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float, min_delta: float) -> List[str]:
+    """List regressions: stages whose median grew past threshold x baseline (and by min_delta seconds),
+    and pairs whose result size changed"""
+    regressions = []
+
+    def check(name: str, current: dict, previous: dict):
+        if current["median"] > previous["median"] * threshold and current["median"] - previous["median"] > min_delta:
+            regressions.append(f"{name}: {previous['median'] * 1000:.2f} ms -> {current['median'] * 1000:.2f} ms "
+                               f"({current['median'] / previous['median']:.2f}x)")
+
+    check("load_breeding_data", results["load_breeding_data"], baseline["load_breeding_data"])
+    for label, pair in results["pairs"].items():
+        previous = baseline["pairs"].get(label)
+        if previous is None:
+            continue
+        if (pair["paths"], pair["steps"]) != (previous["paths"], previous["steps"]):
+            regressions.append(f"{label}: result changed from {previous['paths']} path(s) of {previous['steps']} "
+                               f"step(s) to {pair['paths']} path(s) of {pair['steps']} step(s)")
+        for stage in STAGES:
+            check(f"{label}.{stage}", pair[stage], previous[stage])
+    return regressions
+
+
+def print_results(results: dict, baseline: Optional[dict]):
+    """Print a table of median timings, with the baseline medians alongside when available"""
+    def cell(current: dict, previous: Optional[dict]) -> str:
+        text = f"{current['median'] * 1000:9.2f}"
+        if previous:
+            text += f" ({current['median'] / max(previous['median'], 1e-9):4.2f}x)"
+        return text
+
+    load_baseline = baseline["load_breeding_data"] if baseline else None
+    print(f"load_breeding_data: {cell(results['load_breeding_data'], load_baseline)} ms")
+    print(f"{'pair':<24}{'paths':>7}  " + "  ".join(f"{stage + ' ms':>26}" for stage in STAGES))
+    for label, pair in results["pairs"].items():
+        previous = baseline["pairs"].get(label) if baseline else None
+        cells = [f"{cell(pair[stage], previous[stage] if previous else None):>26}" for stage in STAGES]
+        print(f"{label:<24}{pair['paths']:>7}  " + "  ".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the breeding path finder stage by stage')
+    parser.add_argument('--csv', type=str, default=DEFAULT_CSV,
+                       help='Breeding combinations CSV to benchmark against')
+    parser.add_argument('--engine', type=str, default='auto',
+                       help='Search engine passed to find_shortest_paths (default: auto)')
+    parser.add_argument('--repeats', type=int, default=5,
+                       help='Timed repeats per stage; the median is compared (default: 5)')
+    parser.add_argument('--pairs', type=str, default=None,
+                       help='Fixture of pairs to run instead of the built-in ones (e.g. from find_worst_queries.py)')
+    parser.add_argument('--output', type=str, default=DEFAULT_OUTPUT,
+                       help='Where to write the results JSON')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE,
+                       help='Baseline results JSON to compare against')
+    parser.add_argument('--update-baseline', action='store_true',
+                       help='Write the results as the new baseline instead of comparing')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                       help='Flag stages whose median exceeds this multiple of the baseline (default: 1.5)')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0,
+                       help='Ignore slowdowns smaller than this many milliseconds (default: 1.0)')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.csv, args.engine, args.repeats,
+                             load_pairs(args.pairs) if args.pairs else BENCHMARK_PAIRS)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print_results(results, None)
+        print(f"\n✅ Baseline updated: {args.baseline}")
+        return
+
+    baseline: Optional[Dict] = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+    print(f"\n📄 Results written to {args.output}")
+    if baseline is None:
+        print("⚠️  No baseline found; run with --update-baseline to store one")
+        return
+
+    for key in ("dataset_hash", "engine", "machine"):
+        if baseline["meta"].get(key) != results["meta"][key]:
+            print(f"⚠️  Baseline {key} differs ({baseline['meta'].get(key)} vs {results['meta'][key]}); "
+                  f"timings may not be comparable")
+    regressions = compare_to_baseline(results, baseline, args.threshold, args.min_delta_ms / 1000)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) against the baseline:")
+        for regression in regressions:
+            print(f"   {regression}")
+        sys.exit(1)
+    print("✅ No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
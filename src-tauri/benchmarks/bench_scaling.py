@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scaling benchmark for the breeding path finder
+
+Generates synthetic breeding tables (see generate_breeding_table.py) from a few hundred up to 10,000
+species and measures, per roster size, loading the data and cold path queries with every engine:
+median wall time per query and tracemalloc peak memory. Memory is measured in a separate pass, since
+tracemalloc slows the code it traces. The NumPy engine's dense tables are rebuilt by every cold query, as
+in the sidecar; building them is also reported as a stage of its own, next to the one-off NumPy import. The
+log-log slope between the smallest and largest size estimates the growth exponent of each stage.
+
+Usage:
+    python benchmarks/bench_scaling.py                                # 200 ... 10,000 species
+    python benchmarks/bench_scaling.py --sizes 200,1000,2000 --engines iddfs,numpy --queries 5
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from shortest_breeding_path import BreedingPathFinder, numpy_available
+from generate_breeding_table import STRUCTURES, generate_breeding_table, write_breeding_csv
+
+DEFAULT_SIZES = "200,500,1000,2000,5000,10000"
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results", "scaling.json")
+
+
+def measure_peak(function: Callable) -> int:
+    """tracemalloc peak (bytes) allocated while running the function"""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def sample_queries(finder: BreedingPathFinder, count: int, seed: int) -> List[Tuple[str, str]]:
+    """Random (start, target) pairs the condensation says are reachable, plus one unreachable pair if any"""
+    rng = random.Random(seed)
+    pal_count = len(finder.pal_names)
+    queries, unreachable = [], None
+    for _ in range(count * 50):
+        if len(queries) >= count:
+            break
+        start_id, target_id = rng.sample(range(pal_count), 2)
+        if finder.can_reach(start_id, target_id):
+            queries.append((finder.pal_names[start_id], finder.pal_names[target_id]))
+        elif unreachable is None:
+            unreachable = (finder.pal_names[start_id], finder.pal_names[target_id])
+    return queries + ([unreachable] if unreachable else [])
+
+
+def benchmark_size(species: int, args, engines: List[str]) -> dict:
+    """Measure loading and every engine on one synthetic roster"""
+    rows = generate_breeding_table(species, args.fanout, args.structure, args.seed)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_file = os.path.join(temp_dir, f"synthetic_{species}.csv")
+        write_breeding_csv(rows, csv_file)
+
+        started = time.perf_counter()
+        finder = BreedingPathFinder(csv_file, json_mode=True)
+        load_seconds = time.perf_counter() - started
+        load_peak = measure_peak(lambda: BreedingPathFinder(csv_file, json_mode=True)) if args.memory else None
+
+    queries = sample_queries(finder, args.queries, args.seed)
+    result = {
+        "species": species,
+        "rows": len(rows),
+        "edges": finder.edge_count,
+        "queries": len(queries),
+        "load": {"seconds": load_seconds, "peak_bytes": load_peak},
+        "engines": {}
+    }
+
+    if "numpy" in engines and numpy_available():
+        def build_tables():
+            finder.clear_caches()
+            finder._numpy_tables()
+        started = time.perf_counter()
+        build_tables()
+        result["numpy_tables"] = {"seconds": time.perf_counter() - started,
+                                  "peak_bytes": measure_peak(build_tables) if args.memory else None}
+
+    for engine in engines:
+        timings, steps, timeouts = [], [], 0
+        for start, target in queries:
+            finder.clear_caches()
+            started = time.perf_counter()
+            paths = finder.find_shortest_paths(start, target, args.max_paths, args.max_seconds, engine=engine)
+            timings.append(time.perf_counter() - started)
+            steps.append(len(paths[0]) - 1 if paths else None)
+            if args.max_seconds is not None and timings[-1] >= args.max_seconds:
+                timeouts += 1
+
+        peak = None
+        if args.memory:
+            def run_all():
+                for start, target in queries:
+                    finder.clear_caches()
+                    finder.find_shortest_paths(start, target, args.max_paths, args.max_seconds, engine=engine)
+            peak = measure_peak(run_all)
+
+        result["engines"][engine] = {
+            "median_seconds": statistics.median(timings),
+            "max_seconds": max(timings),
+            "peak_bytes": peak,
+            "timeouts": timeouts,
+            "steps": steps
+        }
+    return result
+
+
+def growth_exponent(results: List[dict], value: Callable[[dict], float]) -> float:
+    """log-log slope of a measurement between the smallest and largest roster"""
+    first, last = results[0], results[-1]
+    first_value, last_value = value(first), value(last)
+    if not first_value or not last_value or first["species"] == last["species"]:
+        return float('nan')
+    return math.log(last_value / first_value) / math.log(last["species"] / first["species"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure how the path finder scales with the number of species')
+    parser.add_argument('--sizes', type=str, default=DEFAULT_SIZES,
+                       help=f'Comma-separated roster sizes (default: {DEFAULT_SIZES})')
+    parser.add_argument('--engines', type=str, default=None,
+                       help='Comma-separated engines (default: bfs,iddfs,bidirectional and numpy when installed)')
+    parser.add_argument('--fanout', type=int, default=40, help='Partners per species (default: 40)')
+    parser.add_argument('--structure', type=str, choices=STRUCTURES, default='power',
+                       help='Synthetic graph structure (default: power)')
+    parser.add_argument('--queries', type=int, default=10, help='Reachable queries per size (default: 10)')
+    parser.add_argument('--max-paths', type=int, default=20, help='Paths per query (default: 20)')
+    parser.add_argument('--max-seconds', type=float, default=10.0,
+                       help='Time budget per query; queries that hit it are counted as timeouts (default: 10)')
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                       help='Skip the tracemalloc pass')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for tables and queries (default: 0)')
+    parser.add_argument('--output', type=str, default=DEFAULT_OUTPUT, help='Where to write the results JSON')
+    args = parser.parse_args()
+
+    engines = args.engines.split(',') if args.engines else ["bfs", "iddfs", "bidirectional"] + (
+        ["numpy"] if numpy_available() else [])
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    # Paid once per process, so it is not part of any per-size timing
+    numpy_import_seconds = None
+    if "numpy" in engines and numpy_available():
+        started = time.perf_counter()
+        import numpy  # noqa: F401
+        numpy_import_seconds = time.perf_counter() - started
+        print(f"🔢 NumPy import {numpy_import_seconds * 1000:.0f} ms")
+
+    results = []
+    for species in sizes:
+        print(f"🔬 {species} species...", flush=True)
+        results.append(benchmark_size(species, args, engines))
+        entry = results[-1]
+        print(f"   load {entry['load']['seconds'] * 1000:.0f} ms"
+              + (f", peak {entry['load']['peak_bytes'] / 2 ** 20:.1f} MB" if args.memory else ""))
+        if "numpy_tables" in entry:
+            print(f"   numpy tables {entry['numpy_tables']['seconds'] * 1000:.0f} ms"
+                  + (f", peak {entry['numpy_tables']['peak_bytes'] / 2 ** 20:.1f} MB" if args.memory else ""))
+        for engine, stats in entry["engines"].items():
+            memory = f", peak {stats['peak_bytes'] / 2 ** 20:.1f} MB" if args.memory else ""
+            timeouts = f", {stats['timeouts']} timeout(s)" if stats["timeouts"] else ""
+            print(f"   {engine:<14} median {stats['median_seconds'] * 1000:9.2f} ms{memory}{timeouts}")
+
+    exponents = {"load_time": growth_exponent(results, lambda r: r["load"]["seconds"])}
+    if args.memory:
+        exponents["load_memory"] = growth_exponent(results, lambda r: r["load"]["peak_bytes"])
+    if numpy_import_seconds is not None:
+        exponents["numpy_tables_time"] = growth_exponent(results, lambda r: r["numpy_tables"]["seconds"])
+        if args.memory:
+            exponents["numpy_tables_memory"] = growth_exponent(results, lambda r: r["numpy_tables"]["peak_bytes"])
+    for engine in engines:
+        exponents[f"{engine}_time"] = growth_exponent(results, lambda r: r["engines"][engine]["median_seconds"])
+        if args.memory:
+            exponents[f"{engine}_memory"] = growth_exponent(results, lambda r: r["engines"][engine]["peak_bytes"])
+
+    print("\n📈 Growth exponents (cost ~ species^k):")
+    for name, exponent in exponents.items():
+        print(f"   {name:<24} k = {exponent:.2f}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({
+            "settings": {key: value for key, value in vars(args).items() if key != "output"},
+            "engines": engines,
+            "numpy_import_seconds": numpy_import_seconds,
+            "sizes": results,
+            "growth_exponents": exponents
+        }, f, indent=2)
+    print(f"\n📄 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cold-start latency benchmark for the breeding path sidecar
+
+Measures, for every query mode, the end-to-end latency the app sees: from spawning the sidecar to the first
+byte of its JSON on stdout (and to process exit). It runs the script with this interpreter and, when it has
+been built by build_all_python.py, the PyInstaller binary. Each mode is compared against a warm in-process call
+(finder already loaded, caches cleared, result serialized the same way), so the difference is the start-up
+overhead: interpreter and imports, unpacking the onefile binary, and loading the breeding data.
+
+Usage:
+    python benchmarks/bench_startup.py                                 # Script, plus the binary if built
+    python benchmarks/bench_startup.py --binary binaries/breeding-path-x86_64-pc-windows-msvc.exe --repeats 20
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, List, Optional
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SIDECAR_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, SIDECAR_DIR)
+
+from shortest_breeding_path import BreedingPathFinder
+
+SCRIPT = os.path.join(SIDECAR_DIR, "shortest_breeding_path.py")
+DEFAULT_BINARY = os.path.join(SIDECAR_DIR, "binaries", "breeding-path" + (".exe" if os.name == "nt" else ""))
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results", "startup.json")
+
+INVENTORY = ["Lamball", "Cattiva", "Chikipi", "Foxparks", "Depresso"]
+TARGETS = ["Anubis", "Penking", "Relaxaurus"]
+
+# (mode, sidecar arguments before --json, the same query on a loaded finder), one per query mode of the
+# CLI; --export-index is left out, as it writes a file rather than answering a query
+QUERY_MODES = [
+    ("child", ["-p1", "Lamball", "-p2", "Cattiva"],
+     lambda finder: finder.find_child_from_parents("Lamball", "Cattiva")),
+    ("paths", ["-p1", "Lamball", "-c", "Anubis"],
+     lambda finder: finder.format_expandable_paths("Lamball", "Anubis", 20)),
+    ("parent-pairs", ["-c", "Anubis"],
+     lambda finder: finder.find_parent_pairs("Anubis")),
+    ("plan", ["-c", "Anubis", "--inventory", ",".join(INVENTORY), "--plan"],
+     lambda finder: finder.plan_breeding("Anubis", INVENTORY)),
+    ("plan-collection", ["--targets", ",".join(TARGETS), "--inventory", ",".join(INVENTORY), "--plan"],
+     lambda finder: finder.plan_collection(TARGETS, INVENTORY)),
+    ("targets", ["-p1", "Lamball", "--targets", ",".join(TARGETS)],
+     lambda finder: finder.format_multi_target_paths("Lamball", TARGETS, 20)),
+    ("radius", ["-p1", "Lamball", "--radius", "2"],
+     lambda finder: finder.find_neighbourhood("Lamball", 2)),
+    ("breedable", ["--inventory", ",".join(INVENTORY), "--breedable"],
+     lambda finder: finder.breedable_from(INVENTORY)),
+]
+
+
+def time_spawn(command: List[str], repeats: int) -> dict:
+    """Median and minimum seconds from spawn to the first stdout byte and to exit"""
+    first_byte, total = [], []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0)
+        first = process.stdout.read(1)
+        first_byte.append(time.perf_counter() - started)
+        process.stdout.read()
+        if process.wait() != 0 or first != b"{":
+            raise RuntimeError(f"{' '.join(command)} failed (exit code {process.returncode})")
+        total.append(time.perf_counter() - started)
+    return {
+        "first_byte": {"median": statistics.median(first_byte), "min": min(first_byte)},
+        "exit": {"median": statistics.median(total), "min": min(total)}
+    }
+
+
+def time_warm(finder: BreedingPathFinder, query: Callable, repeats: int) -> dict:
+    """Median and minimum seconds of the query on a loaded finder, including JSON serialization"""
+    samples = []
+    for _ in range(repeats):
+        finder.clear_caches()
+        started = time.perf_counter()
+        json.dumps(query(finder), indent=2)
+        samples.append(time.perf_counter() - started)
+    return {"median": statistics.median(samples), "min": min(samples)}
+
+
+def run_benchmarks(commands: dict, repeats: int) -> dict:
+    """Time every query mode through every sidecar command and warm in-process"""
+    started = time.perf_counter()
+    finder = BreedingPathFinder(json_mode=True)
+    load_seconds = time.perf_counter() - started
+
+    interpreter = time_spawn([sys.executable, "-c", "print('{}')"], repeats)
+    modes = {}
+    for mode, arguments, query in QUERY_MODES:
+        modes[mode] = {"warm": time_warm(finder, query, repeats)}
+        for name, command in commands.items():
+            modes[mode][name] = time_spawn(command + arguments + ["--json"], repeats)
+            modes[mode][name]["overhead"] = modes[mode][name]["first_byte"]["median"] - modes[mode]["warm"]["median"]
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "commands": commands,
+            "repeats": repeats
+        },
+        "in_process_load_seconds": load_seconds,
+        "interpreter_start": interpreter,
+        "modes": modes
+    }
+
+
+def print_results(results: dict, commands: dict):
+    """Print first-byte medians per mode and sidecar, with the warm call and the start-up overhead"""
+    print(f"Interpreter start: {results['interpreter_start']['first_byte']['median'] * 1000:.0f} ms, "
+          f"in-process data load: {results['in_process_load_seconds'] * 1000:.0f} ms")
+    header = f"{'mode':<18}{'warm ms':>10}"
+    for name in commands:
+        header += f"{name + ' first byte ms':>26}{'overhead ms':>14}"
+    print(header)
+    for mode, entry in results["modes"].items():
+        line = f"{mode:<18}{entry['warm']['median'] * 1000:10.1f}"
+        for name in commands:
+            line += f"{entry[name]['first_byte']['median'] * 1000:26.1f}{entry[name]['overhead'] * 1000:14.1f}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure sidecar start-up latency against warm in-process calls')
+    parser.add_argument('--binary', type=str, default=DEFAULT_BINARY,
+                       help='PyInstaller binary to time as well (default: binaries/breeding-path; skipped if missing)')
+    parser.add_argument('--repeats', type=int, default=10,
+                       help='Spawns (and warm calls) per mode; medians are reported (default: 10)')
+    parser.add_argument('--output', type=str, default=DEFAULT_OUTPUT,
+                       help='Where to write the results JSON')
+    args = parser.parse_args()
+
+    commands = {"script": [sys.executable, SCRIPT]}
+    binary: Optional[str] = args.binary
+    if binary and os.path.exists(binary):
+        commands["binary"] = [os.path.abspath(binary)]
+    else:
+        print(f"⚠️  No binary at {binary}; run build_all_python.py to include it")
+
+    results = run_benchmarks(commands, args.repeats)
+    print_results(results, commands)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n📄 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
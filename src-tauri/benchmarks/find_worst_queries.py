@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Adversarial search for the slowest path queries
+
+Searches the (start, target, max_paths) space of a breeding CSV for the queries that make find_shortest_paths
+expand the most nodes, run the longest and allocate the most memory, and writes the worst ones as a benchmark
+fixture (run it with bench_path_finder.py --pairs).
+
+The search is guided by statistics that are cheap to get for every pair at once: one reverse BFS per target
+gives the distance from every start, and a DP over those distance tables counts the shortest paths. Seeds are
+the pairs with the most shortest paths, the deepest pairs and a random sample (for the cases nobody would
+guess); each round then measures cold queries and moves from the worst ones so far to their neighbours: more
+paths, other starts at the same distance from the target, other targets at the same distance from the start.
+Once no new neighbours are left, rounds continue with fresh random samples until the budget is spent.
+Finalists are measured again with repeats and a tracemalloc pass.
+
+Usage:
+    python benchmarks/find_worst_queries.py                            # 120 s budget, auto engine
+    python benchmarks/find_worst_queries.py --engine iddfs --budget-seconds 600 --top 10
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from shortest_breeding_path import BreedingPathFinder
+
+DEFAULT_CSV = os.path.join(os.path.dirname(BENCHMARK_DIR), "palworld_breeding_combinations.csv")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "worst_queries.json")
+
+# max_paths values tried: the app's default, then larger route guides
+MAX_PATHS_STEPS = [20, 200, 2000, 10000]
+
+# Measured metric -> fixture label prefix
+METRICS = {"nodes_expanded": "worst-nodes", "seconds": "worst-time", "peak_bytes": "worst-memory"}
+
+Query = Tuple[int, int, int]  # (start_id, target_id, max_paths)
+
+
+def screen_pairs(finder: BreedingPathFinder) -> Dict[Tuple[int, int], Tuple[int, int]]:
+    """(start_id, target_id) -> (distance, number of shortest paths) for every reachable pair of distinct Pals"""
+    pal_count = len(finder.pal_names)
+    breeding_edges = finder.breeding_edges
+    screened = {}
+    for target_id in range(pal_count):
+        distances = finder.distances_to_target(target_id)
+        reaching = sorted((pal_id for pal_id in range(pal_count) if distances[pal_id] < float('inf')),
+                          key=lambda pal_id: distances[pal_id])
+        # Same count as count_shortest_paths, for all starts in one pass in order of distance
+        counts = [0] * pal_count
+        counts[target_id] = 1
+        for pal_id in reaching:
+            if pal_id == target_id:
+                continue
+            counts[pal_id] = sum(counts[child_id] for _, child_id in breeding_edges[pal_id]
+                                 if distances[child_id] == distances[pal_id] - 1)
+            screened[(pal_id, target_id)] = (int(distances[pal_id]), counts[pal_id])
+    finder.clear_caches()
+    return screened
+
+
+def seed_queries(screened: Dict[Tuple[int, int], Tuple[int, int]], seeds: int, rng: random.Random) -> List[Query]:
+    """Most shortest paths (at the default and the largest max_paths), deepest pairs, and a random sample"""
+    pairs = list(screened)
+    by_paths = sorted(pairs, key=lambda pair: -screened[pair][1])[:seeds]
+    by_distance = sorted(pairs, key=lambda pair: (-screened[pair][0], -screened[pair][1]))[:seeds]
+    queries = [(start_id, target_id, MAX_PATHS_STEPS[0]) for start_id, target_id in by_paths + by_distance]
+    queries += [(start_id, target_id, MAX_PATHS_STEPS[-1]) for start_id, target_id in by_paths]
+    queries += [(start_id, target_id, MAX_PATHS_STEPS[0]) for start_id, target_id in rng.sample(pairs, seeds)]
+    return list(dict.fromkeys(queries))
+
+
+def neighbour_queries(query: Query, screened: Dict[Tuple[int, int], Tuple[int, int]],
+                      by_target: Dict[int, List[int]], by_start: Dict[int, List[int]], width: int) -> List[Query]:
+    """More paths for the same pair, and the pairs sharing its start or target at the same distance with the
+    most shortest paths"""
+    start_id, target_id, max_paths = query
+    distance = screened[(start_id, target_id)][0]
+    neighbours = [(start_id, target_id, steps) for steps in MAX_PATHS_STEPS if steps > max_paths][:1]
+    starts = [other for other in by_target[target_id] if screened[(other, target_id)][0] == distance]
+    neighbours += [(other, target_id, max_paths) for other in starts[:width]]
+    targets = [other for other in by_start[start_id] if screened[(start_id, other)][0] == distance]
+    neighbours += [(start_id, other, max_paths) for other in targets[:width]]
+    return neighbours
+
+
+def measure(finder: BreedingPathFinder, query: Query, engine: str, max_seconds: float) -> dict:
+    """Run one cold query and return its wall time, search counters and result size"""
+    start_id, target_id, max_paths = query
+    finder.clear_caches()
+    started = time.perf_counter()
+    paths = finder.find_shortest_paths(finder.pal_names[start_id], finder.pal_names[target_id], max_paths,
+                                       max_seconds, engine=engine)
+    return {
+        "seconds": time.perf_counter() - started,
+        "nodes_expanded": finder.search_stats["nodes_expanded"],
+        "edges_examined": finder.search_stats["edges_examined"],
+        "timed_out": finder.search_stats["time_limited"],
+        "engine": finder.last_search_info.get("engine", engine),
+        "paths": len(paths)
+    }
+
+
+def measure_finalist(finder: BreedingPathFinder, query: Query, engine: str, max_seconds: float,
+                     repeats: int) -> dict:
+    """Median of repeated cold runs, plus the tracemalloc peak of one more run"""
+    runs = [measure(finder, query, engine, max_seconds) for _ in range(repeats)]
+    result = dict(runs[-1])
+    result["seconds"] = statistics.median(run["seconds"] for run in runs)
+    tracemalloc.start()
+    try:
+        measure(finder, query, engine, max_seconds)
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find the queries that are slowest for find_shortest_paths')
+    parser.add_argument('--csv', type=str, default=DEFAULT_CSV, help='Breeding combinations CSV to search')
+    parser.add_argument('--engine', type=str, default='auto', help='Search engine to attack (default: auto)')
+    parser.add_argument('--budget-seconds', type=float, default=120.0,
+                       help='Wall time for the guided search, before the finalists are re-measured (default: 120)')
+    parser.add_argument('--max-seconds', type=float, default=10.0,
+                       help='Time limit per query; queries that hit it are reported as timed out (default: 10)')
+    parser.add_argument('--seeds', type=int, default=15, help='Pairs per seed group (default: 15)')
+    parser.add_argument('--width', type=int, default=3,
+                       help='Neighbours per start/target tried around each of the worst queries (default: 3)')
+    parser.add_argument('--top', type=int, default=5, help='Queries kept per metric in the fixture (default: 5)')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed repeats per finalist (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the exploration sample (default: 0)')
+    parser.add_argument('--output', type=str, default=DEFAULT_OUTPUT, help='Fixture file to write')
+    args = parser.parse_args()
+
+    finder = BreedingPathFinder(args.csv, json_mode=True)
+    pal_names = finder.pal_names
+    started = time.perf_counter()
+    screened = screen_pairs(finder)
+    print(f"🔎 Screened {len(screened)} reachable pairs in {time.perf_counter() - started:.1f} s")
+
+    # Candidate neighbours, most shortest paths first
+    by_target: Dict[int, List[int]] = {}
+    by_start: Dict[int, List[int]] = {}
+    for start_id, target_id in sorted(screened, key=lambda pair: -screened[pair][1]):
+        by_target.setdefault(target_id, []).append(start_id)
+        by_start.setdefault(start_id, []).append(target_id)
+
+    rng = random.Random(args.seed)
+    pairs = list(screened)
+    measured: Dict[Query, dict] = {}
+    pending = seed_queries(screened, args.seeds, rng)
+    deadline = time.perf_counter() + args.budget_seconds
+    rounds = 0
+    while pending and time.perf_counter() < deadline:
+        rounds += 1
+        for query in pending:
+            if time.perf_counter() >= deadline:
+                break
+            measured[query] = measure(finder, query, args.engine, args.max_seconds)
+        # Climb from the worst queries so far, by time and by nodes expanded
+        worst = set()
+        for metric in ("seconds", "nodes_expanded"):
+            worst.update(sorted(measured, key=lambda query: -measured[query][metric])[:args.top])
+        pending = [neighbour for query in worst
+                   for neighbour in neighbour_queries(query, screened, by_target, by_start, args.width)
+                   if neighbour not in measured]
+        pending = list(dict.fromkeys(pending))
+        if not pending:
+            # The climb has converged; keep exploring elsewhere
+            pending = [(start_id, target_id, rng.choice(MAX_PATHS_STEPS))
+                       for start_id, target_id in rng.sample(pairs, args.seeds)]
+            pending = [query for query in pending if query not in measured]
+        print(f"   round {rounds}: {len(measured)} queries measured, {len(pending)} neighbours next")
+
+    # Re-measure the leaders of every metric; memory is only known after this pass
+    finalists = set()
+    for metric in ("seconds", "nodes_expanded"):
+        finalists.update(sorted(measured, key=lambda query: -measured[query][metric])[:args.top])
+    finalists.update(sorted(measured, key=lambda query: -measured[query]["edges_examined"])[:args.top])
+    print(f"📏 Re-measuring {len(finalists)} finalists")
+    final = {query: measure_finalist(finder, query, args.engine, args.max_seconds, args.repeats)
+             for query in finalists}
+
+    pairs, labelled = [], {}
+    for metric, label in METRICS.items():
+        ranked = sorted(final, key=lambda query: -final[query][metric])[:args.top]
+        print(f"\n{label}:")
+        for rank, query in enumerate(ranked, 1):
+            start_id, target_id, max_paths = query
+            entry = final[query]
+            distance, shortest_paths = screened[(start_id, target_id)]
+            print(f"   {pal_names[start_id]} -> {pal_names[target_id]} (max_paths {max_paths}): "
+                  f"{entry['seconds'] * 1000:.1f} ms, {entry['nodes_expanded']} nodes, "
+                  f"{entry['peak_bytes'] / 2 ** 20:.1f} MB{', timed out' if entry['timed_out'] else ''}")
+            if query in labelled:
+                continue
+            labelled[query] = f"{label}-{rank}"
+            pairs.append({
+                "label": labelled[query],
+                "start": pal_names[start_id],
+                "target": pal_names[target_id],
+                "max_paths": max_paths,
+                "distance": distance,
+                "shortest_paths": shortest_paths,
+                **entry
+            })
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "dataset": os.path.basename(args.csv),
+                "dataset_hash": finder.dataset_hash(),
+                "engine": args.engine,
+                "queries_measured": len(measured),
+                "max_seconds": args.max_seconds
+            },
+            "pairs": pairs
+        }, f, indent=2)
+    print(f"\n📄 Fixture with {len(pairs)} queries written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
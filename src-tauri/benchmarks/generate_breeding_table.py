@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic breeding table generator
+
+Writes breeding tables in the same child,parent1,parent2 CSV schema as palworld_breeding_combinations.csv,
+with a controllable number of species, partners per species and graph structure:
+
+- power:     game-like; every species has a breeding power and a pair breeds the species whose power is
+             closest to the parents' average (long chains, many equivalent routes)
+- uniform:   each pair breeds a uniformly random species (short paths, little structure)
+- clustered: children mostly stay in the first parent's cluster, so distances grow between clusters
+
+A fraction of species are "legendaries" that only breed from two of their own kind, like Jetragon in the
+real data, so unreachable queries are represented too. Output is deterministic for a given seed.
+
+Usage:
+    python benchmarks/generate_breeding_table.py --species 1000 --fanout 40 --structure power -o synthetic.csv
+"""
+
+import argparse
+import csv
+import random
+from typing import List, Tuple
+
+STRUCTURES = ["power", "uniform", "clustered"]
+
+
+def generate_breeding_table(species: int, fanout: int = 40, structure: str = "power", seed: int = 0,
+                            legendary_fraction: float = 0.03, clusters: int = 8,
+                            cross_cluster: float = 0.1) -> List[Tuple[str, str, str]]:
+    """Generate (child, parent1, parent2) rows for a synthetic roster.
+
+    Each species is paired with about fanout random partners (pairs are unordered and listed once) and with
+    itself, so there are roughly species * (fanout / 2 + 1) rows.
+    """
+    if structure not in STRUCTURES:
+        raise ValueError(f"Unknown structure: {structure}")
+    rng = random.Random(seed)
+    names = [f"Pal{i:05d}" for i in range(species)]
+    legendary_count = int(species * legendary_fraction)
+    legendaries = set(rng.sample(range(species), legendary_count))
+    breedable = [i for i in range(species) if i not in legendaries]
+
+    # Distinct powers, so "closest power" always has a single answer among the breedable species
+    powers = rng.sample(range(species * 10), species)
+    by_power = sorted(breedable, key=lambda i: powers[i])
+    sorted_powers = [powers[i] for i in by_power]
+    cluster_of = [rng.randrange(clusters) for _ in range(species)]
+    cluster_members = [[i for i in breedable if cluster_of[i] == cluster] or breedable for cluster in range(clusters)]
+
+    def child_of(parent1: int, parent2: int) -> int:
+        if parent1 == parent2:
+            return parent1
+        if structure == "uniform":
+            return rng.choice(breedable)
+        if structure == "clustered":
+            if rng.random() < cross_cluster:
+                return rng.choice(breedable)
+            return rng.choice(cluster_members[cluster_of[parent1]])
+        # Binary search for the breedable species with the power nearest the parents' average
+        average = (powers[parent1] + powers[parent2]) // 2
+        low, high = 0, len(sorted_powers) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if sorted_powers[middle] < average:
+                low = middle + 1
+            else:
+                high = middle
+        if low > 0 and average - sorted_powers[low - 1] <= sorted_powers[low] - average:
+            low -= 1
+        return by_power[low]
+
+    pairs = set()
+    for parent1 in range(species):
+        pairs.add((parent1, parent1))
+        for parent2 in rng.sample(range(species), min(fanout // 2, species)):
+            pairs.add((min(parent1, parent2), max(parent1, parent2)))
+
+    return [(names[child_of(parent1, parent2)], names[parent1], names[parent2]) for parent1, parent2 in sorted(pairs)]
+
+
+def write_breeding_csv(rows: List[Tuple[str, str, str]], output_file: str):
+    """Write rows in the child,parent1,parent2 schema read by BreedingPathFinder"""
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["child", "parent1", "parent2"])
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic breeding table CSV')
+    parser.add_argument('--species', type=int, required=True, help='Number of species')
+    parser.add_argument('--fanout', type=int, default=40, help='Partners per species (default: 40)')
+    parser.add_argument('--structure', type=str, choices=STRUCTURES, default='power',
+                       help='How children are chosen for a pair (default: power)')
+    parser.add_argument('--legendary-fraction', type=float, default=0.03,
+                       help='Fraction of species that only breed from their own kind (default: 0.03)')
+    parser.add_argument('--clusters', type=int, default=8, help='Clusters for --structure clustered (default: 8)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('-o', '--output', type=str, required=True, help='CSV file to write')
+    args = parser.parse_args()
+
+    rows = generate_breeding_table(args.species, args.fanout, args.structure, args.seed,
+                                   args.legendary_fraction, args.clusters)
+    write_breeding_csv(rows, args.output)
+    print(f"✅ Wrote {len(rows)} breeding combinations for {args.species} species to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Replay a recorded query log against the current path finder
+
+Reads a JSONL log written with --query-log (or the BREEDING_PATH_QUERY_LOG environment variable) and reruns
+every query through the sidecar script, the way the app spawns it. Reports latency percentiles per mode, both
+end to end and for the search phase next to the recorded search times, and lists every query whose result
+differs from the recorded one. The exit code is 1 when any result changed. Logged --export-index runs are not
+replayed, since they rewrite the exported index. Logs record absolute --csv and --costs paths; relative paths
+in older logs are resolved against the current directory, as the sidecar resolves them.
+
+Usage:
+    python benchmarks/replay_query_log.py queries.jsonl
+    python benchmarks/replay_query_log.py queries.jsonl --mode paths --repeats 3
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SIDECAR_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, SIDECAR_DIR)
+
+from shortest_breeding_path import QUERY_LOG_ENV, dataset_hash, result_digest
+
+SCRIPT = os.path.join(SIDECAR_DIR, "shortest_breeding_path.py")
+DEFAULT_CSV = os.path.join(SIDECAR_DIR, "palworld_breeding_combinations.csv")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results", "replay.json")
+
+PERCENTILES = [50, 90, 99]
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """Nearest-rank percentile, or None for no values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def summarize(values: List[float]) -> dict:
+    """Percentiles and maximum of a list of milliseconds"""
+    summary = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+    summary["max"] = max(values) if values else None
+    return summary
+
+
+def read_log(log_file: str) -> List[Tuple[int, dict]]:
+    """(line number, entry) for each query in a log, skipping lines that are not valid JSON (e.g. a line cut off
+    by a crash)"""
+    entries = []
+    with open(log_file, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entries.append((number, json.loads(line)))
+            except json.JSONDecodeError:
+                print(f"⚠️  Skipping malformed line {number}")
+    return entries
+
+
+def logged_csv(argv: List[str]) -> str:
+    """The breeding CSV a logged command line reads; a bare file name is looked up next to the script"""
+    csv_file = DEFAULT_CSV
+    for i, token in enumerate(argv):
+        if token == "--csv" and i + 1 < len(argv):
+            csv_file = argv[i + 1]
+        elif token.startswith("--csv="):
+            csv_file = token.split('=', 1)[1]
+    if not os.path.dirname(csv_file):
+        csv_file = os.path.join(SIDECAR_DIR, csv_file)
+    return csv_file
+
+
+def current_hash(csv_file: str, cache: Dict[str, str]) -> str:
+    """dataset_hash of a CSV as it is now, or "missing" if it cannot be read"""
+    if csv_file not in cache:
+        try:
+            cache[csv_file] = dataset_hash(csv_file)
+        except OSError:
+            cache[csv_file] = "missing"
+    return cache[csv_file]
+
+
+def replay(entry: dict, command: List[str], environment: dict) -> dict:
+    """Rerun one logged query with --stats; wall time in ms, the result's stats and its digest"""
+    started = time.perf_counter()
+    completed = subprocess.run(command + entry["argv"] + ["--stats"], capture_output=True, text=True,
+                               env=environment)
+    wall_ms = (time.perf_counter() - started) * 1000
+    try:
+        result = json.loads(completed.stdout)
+    except json.JSONDecodeError:
+        return {"wall_ms": wall_ms, "error": f"exit code {completed.returncode}, no JSON result"}
+    return {
+        "wall_ms": wall_ms,
+        "stats": result.get("stats", {}),
+        "digest": result_digest(result),
+        "total_paths": result.get("total_paths")
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a recorded query log and compare latency and results')
+    parser.add_argument('log', type=str, help='Query log (JSONL) written with --query-log')
+    parser.add_argument('--mode', type=str, default=None, help='Only replay queries of this mode (e.g. paths)')
+    parser.add_argument('--limit', type=int, default=None, help='Replay at most this many queries')
+    parser.add_argument('--repeats', type=int, default=1, help='Runs per query; all count towards the percentiles')
+    parser.add_argument('--output', type=str, default=DEFAULT_OUTPUT, help='Where to write the replay results JSON')
+    args = parser.parse_args()
+
+    entries = [(line, entry) for line, entry in read_log(args.log) if args.mode is None or entry.get("mode") == args.mode]
+    exports = sum(entry.get("mode") == "export" for _, entry in entries)
+    if exports:
+        print(f"⏭️  Skipping {exports} --export-index runs, which would overwrite the exported index")
+        entries = [(line, entry) for line, entry in entries if entry.get("mode") != "export"]
+    if args.limit is not None:
+        entries = entries[:args.limit]
+    if not entries:
+        print("❌ No queries to replay")
+        sys.exit(1)
+
+    # The replayed runs must not append to the log they are read from
+    environment = {key: value for key, value in os.environ.items() if key != QUERY_LOG_ENV}
+    command = [sys.executable, SCRIPT]
+    hashes: Dict[str, str] = {}
+
+    wall = defaultdict(list)
+    search = defaultdict(list)
+    recorded_search = defaultdict(list)
+    differences, errors, stale = [], [], 0
+    for number, (line, entry) in enumerate(entries, 1):
+        mode = entry.get("mode", "unknown")
+        recorded_search[mode].append(entry["stats"]["timings_ms"]["search"])
+        same_data = entry.get("dataset_hash") == current_hash(logged_csv(entry["argv"]), hashes)
+        stale += not same_data
+        for _ in range(args.repeats):
+            run = replay(entry, command, environment)
+            if "error" in run:
+                errors.append({"line": line, "argv": entry["argv"], "error": run["error"]})
+                break
+            wall[mode].append(run["wall_ms"])
+            search[mode].append(run["stats"]["timings_ms"]["search"])
+            # A cancelled recording or a different dataset cannot be expected to match
+            if run["digest"] != entry["result_digest"] and same_data and not entry.get("partial"):
+                differences.append({
+                    "line": line,
+                    "mode": mode,
+                    "argv": entry["argv"],
+                    "recorded": {"bytes": entry["result_bytes"], "total_paths": entry.get("total_paths")},
+                    "current": {"total_paths": run["total_paths"]}
+                })
+                break
+        print(f"\r🔁 {number}/{len(entries)} queries replayed", end="", flush=True)
+    print()
+
+    modes = sorted(set(wall) | set(recorded_search))
+    summary = {
+        mode: {
+            "queries": len(recorded_search[mode]),
+            "wall_ms": summarize(wall[mode]),
+            "search_ms": summarize(search[mode]),
+            "recorded_search_ms": summarize(recorded_search[mode])
+        }
+        for mode in modes
+    }
+    summary["all"] = {
+        "queries": len(entries),
+        "wall_ms": summarize([value for values in wall.values() for value in values]),
+        "search_ms": summarize([value for values in search.values() for value in values]),
+        "recorded_search_ms": summarize([value for values in recorded_search.values() for value in values])
+    }
+
+    def cell(value: Optional[float]) -> str:
+        return f"{value:9.1f}" if value is not None else f"{'-':>9}"
+
+    print(f"{'mode':<16}{'queries':>8}" + "".join(f"{'wall p' + str(p):>11}" for p in PERCENTILES)
+          + f"{'search p50':>12}{'recorded p50':>14}")
+    for mode, entry in summary.items():
+        print(f"{mode:<16}{entry['queries']:>8}" + "".join(f"  {cell(entry['wall_ms'][f'p{p}'])}" for p in PERCENTILES)
+              + f"   {cell(entry['search_ms']['p50'])}     {cell(entry['recorded_search_ms']['p50'])}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({"log": os.path.abspath(args.log), "repeats": args.repeats, "summary": summary,
+                   "differences": differences, "errors": errors}, f, indent=2)
+    print(f"\n📄 Results written to {args.output}")
+
+    if stale:
+        print(f"⚠️  {stale} queries were recorded against a different dataset; their results were not compared")
+    for error in errors:
+        print(f"❌ Line {error['line']} failed ({error['error']}): {' '.join(error['argv'])}")
+    if differences:
+        print(f"\n❌ {len(differences)} result(s) differ from the recording:")
+        for difference in differences:
+            print(f"   line {difference['line']} ({difference['mode']}): {' '.join(difference['argv'])}")
+        sys.exit(1)
+    if errors:
+        sys.exit(1)
+    print("✅ All replayed results match the recording")
+
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,12 @@ class PythonBinaryBuilder:
                 "binary_name": "breeding-scraper",
                 "description": "Breeding combinations scraper",
                 "primary": False
+            },
+            {
+                "source": "palworld_sidecar.py",
+                "binary_name": "palworld-sidecar",
+                "description": "Single entry point for path queries and every scraper (subcommands)",
+                "primary": False
             }
             # Note: PalworldBreedingCalc.py is empty, so skipping it
         ]
@@ -225,6 +231,17 @@ class PythonBinaryBuilder:
         else:
             print(f"⚠️  CSV file not found: {csv_file}")
             print(f"   💡 Run the scraper scripts to generate it")
+            return
+        
+        # Export the lookup tables the frontend reads instead of parsing the CSV
+        dest_index = self.binaries_dir / "palworld_breeding_index.json"
+        try:
+            subprocess.run([sys.executable, str(self.script_dir / "shortest_breeding_path.py"),
+                            '--csv', str(csv_file), '--export-index', str(dest_index)],
+                           capture_output=True, text=True, check=True)
+            print(f"✅ Exported lookup tables: {dest_index.name}")
+        except subprocess.CalledProcessError as e:
+            print(f"⚠️  Could not export lookup tables: {e.stderr.strip() or e}")
     
     def cleanup(self):
         """Clean up build artifacts"""
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Palworld Sidecar
+
+One entry point for every Python tool the app runs, so they can ship as a single PyInstaller binary
+(one bundled runtime) instead of four. Each subcommand imports its tool only when it runs: path queries
+load just the standard library, and Selenium, requests and BeautifulSoup are imported by the scrapers alone.
+
+Usage:
+    python palworld_sidecar.py path -p1 "Pal1" -c "TargetPal" --json   # Any shortest_breeding_path.py arguments
+    python palworld_sidecar.py scrape-breeding                          # palworld_breeding_scraper.py
+    python palworld_sidecar.py scrape-images                            # palworld_image_scraper.py
+    python palworld_sidecar.py scrape-fullcalc                          # palworld_fullCalc_scraper.py
+
+Check what a subcommand imports with:
+    python -X importtime palworld_sidecar.py path -p1 Lamball -p2 Cattiva --json 2> imports.txt
+"""
+
+import sys
+
+
+def run_path():
+    """Breeding path calculator (shortest_breeding_path.py)"""
+    import shortest_breeding_path
+    shortest_breeding_path.main()
+
+
+def run_breeding_scraper():
+    """Breeding combinations scraper (palworld_breeding_scraper.py)"""
+    import palworld_breeding_scraper
+    palworld_breeding_scraper.main()
+
+
+def run_image_scraper():
+    """Pal image scraper (palworld_image_scraper.py)"""
+    import palworld_image_scraper
+    palworld_image_scraper.main()
+
+
+def run_fullcalc_scraper():
+    """Complete breeding data and image scraper (palworld_fullCalc_scraper.py)"""
+    import palworld_fullCalc_scraper
+    palworld_fullCalc_scraper.main()
+
+
+# Subcommand -> function; the imports inside each function keep PyInstaller bundling every tool
+SUBCOMMANDS = {
+    "path": run_path,
+    "scrape-breeding": run_breeding_scraper,
+    "scrape-images": run_image_scraper,
+    "scrape-fullcalc": run_fullcalc_scraper,
+}
+
+
+def print_usage():
+    print(f"Usage: {sys.argv[0]} <subcommand> [arguments]\n\nSubcommands:")
+    for name, function in SUBCOMMANDS.items():
+        print(f"  {name:<17} {function.__doc__}")
+
+
+def main():
+    """Dispatch to a subcommand, handing it the remaining arguments as its own command line"""
+    # argparse is deliberately not used here: the path subcommand parses its own arguments
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        print_usage()
+        sys.exit(0 if len(sys.argv) >= 2 else 1)
+    command = sys.argv[1]
+    if command not in SUBCOMMANDS:
+        print(f"Error: Unknown subcommand: {command}\n")
+        print_usage()
+        sys.exit(1)
+    sys.argv = [f"{sys.argv[0]} {command}"] + sys.argv[2:]
+    SUBCOMMANDS[command]()
+
+
+if __name__ == "__main__":
+    if getattr(sys, 'frozen', False):
+        # Needed for the --workers process pool inside PyInstaller binaries
+        import multiprocessing
+        multiprocessing.freeze_support()
+    main()
@@ -3,15 +3,28 @@
 """
 Palworld Breeding Path Finder
 
-This script finds the shortest breeding paths between Pals using the breeding combinations data.
-It supports two modes:
-1. Given two parents, find the child
-2. Given one parent and target child, find the 5 shortest breeding paths
+This script answers breeding queries over the breeding combinations data. Modes:
+1. Two parents: the child they breed
+2. One parent and a target child: the shortest breeding paths (--max-paths, default 20), optionally with
+   the Pareto front over steps and per-Pal costs (--costs)
+3. A child alone: every parent pair that breeds it, ranked by the Pals you own (--inventory)
+4. A child, --inventory and --plan: every breeding needed to get it from the Pals you own
+5. Several --targets, --inventory and --plan: one combined schedule for a whole collection
+6. One parent and several --targets: shortest paths to each, from a single shared search
+7. One parent and --radius: every Pal reachable within that many breedings
+8. --inventory and --breedable: every child one breeding away from the Pals you own
+9. --export-index: write the compact lookup tables the app reads instead of the CSV
+
+Path searches take --exclude, --require, --max-steps and --max-seconds, memory bounds (--beam-width,
+--max-frontier-mb), an --engine (auto picks one per query; bfs, iddfs, bidirectional or numpy) and
+--workers for large route guides. --json prints one JSON document for the app; --stats, --progress (on
+stderr), --query-log, --profile-out and --trace-memory report on the run itself.
 
 Usage:
     python shortest_breeding_path.py -p1 "Pal1" -p2 "Pal2"  # Find child from two parents
     python shortest_breeding_path.py -p1 "Pal1" -c "TargetPal"  # Find paths from parent to child
     python shortest_breeding_path.py -p2 "Pal1" -c "TargetPal"  # Find paths from parent to child
+    python shortest_breeding_path.py --help  # Every mode and option, with examples
 """
 
 import sys
@@ -23,13 +36,102 @@ if sys.platform.startswith('win'):
 
 import argparse
 import csv
+import heapq
 import sys
 import os
 from collections import defaultdict, deque
+from contextlib import contextmanager
 from typing import Dict, List, Tuple, Set, Optional
 import time
 
 
+# Rough cost of examining one breeding edge in the pure-Python engines, used to turn plan costs into seconds
+SECONDS_PER_EDGE = 2e-7
+
+# Version of the exported lookup tables read by the frontend; bump when the layout changes
+INDEX_FORMAT_VERSION = 1
+
+# Minimum seconds between two progress reports (--progress)
+PROGRESS_INTERVAL = 0.25
+
+# Environment variable that turns on the query log (--query-log) without changing the sidecar arguments
+QUERY_LOG_ENV = "BREEDING_PATH_QUERY_LOG"
+
+# Options that only control what a run reports about itself, left out of logged command lines
+# (option -> whether it takes a value; --trace-memory's value is optional)
+UNLOGGED_OPTIONS = {"--query-log": True, "--profile-out": True, "--trace-memory": None, "--stats": False,
+                    "--progress": False}
+
+# Stack depth kept per allocation and number of allocation sites reported by --trace-memory
+TRACE_MEMORY_FRAMES = 5
+TRACE_MEMORY_TOP = 25
+
+# Parallel enumeration splits the paths by their first steps, going one step deeper when that gives
+# fewer than this many branches per worker
+PARALLEL_BRANCHES_PER_WORKER = 4
+
+# How many steps beyond the shortest path a Pareto search may go when no --max-steps is given
+PARETO_EXTRA_STEPS = 2
+
+# Index tables and the method that builds them. A plain child lookup needs none of them, so each is built on
+# first use (see BreedingPathFinder.__getattr__) rather than when the CSV is loaded
+LAZY_TABLES = {
+    "child_matrix": "build_child_matrix",
+    "breeding_edges": "build_edges",
+    "reverse_edges": "build_edges",
+    "successor_masks": "build_edges",
+    "edge_count": "build_edges",
+    "parents_by_child": "build_parents_by_child",
+    "successor_count": "build_condensation",
+    "component_of": "build_condensation",
+    "components": "build_condensation",
+    "component_reach": "build_condensation",
+}
+
+
+def numpy_available() -> bool:
+    """Whether the optional NumPy engine can be used, without paying for the import"""
+    import importlib.util
+    return importlib.util.find_spec("numpy") is not None
+
+
+# Path finder shared by the processes of a parallel enumeration (set once per worker by its initializer)
+_worker_finder = None
+
+
+def _init_path_worker(finder: "BreedingPathFinder"):
+    """Process pool initializer: keep the finder for every branch this worker enumerates"""
+    global _worker_finder
+    _worker_finder = finder
+
+
+def _enumerate_branch(task: tuple) -> Tuple[List[List[str]], dict]:
+    """Enumerate the shortest paths that start with a fixed prefix of steps, with the worker's search counters
+    (runs in a worker process)"""
+    start_id, target_id, exclude_mask, depth, distances, prefix, max_paths, deadline = task
+    max_seconds = max(0.0, deadline - time.time()) if deadline is not None else None
+    _worker_finder.reset_stats()
+    paths = _worker_finder._collect_paths(_worker_finder._iter_paths_iddfs(
+        start_id, target_id, exclude_mask, 0, depth, max_seconds, distances, prefix), max_paths)
+    return paths, _worker_finder.search_stats
+
+
+class RequiredStepBounds(dict):
+    """Missing required Pals (bitmask) -> per-Pal lower bound on the steps to the target that still collect
+    them, built on first use: each step adds at most two of them, and every one needs a route through it"""
+    
+    def __init__(self, via_tables: List[Tuple[int, List[float]]]):
+        super().__init__()
+        self.via_tables = via_tables  # (bit, distances_via_required) per required Pal
+    
+    def __missing__(self, missing: int) -> List[float]:
+        tables = [via for bit, via in self.via_tables if missing & bit]
+        count_bound = (bin(missing).count("1") + 1) // 2
+        bounds = [max(count_bound, *(via[pal_id] for via in tables)) for pal_id in range(len(tables[0]))]
+        self[missing] = bounds
+        return bounds
+
+
 class BreedingPathFinder:
     def __init__(self, csv_file: str = "palworld_breeding_combinations.csv", json_mode: bool = False):
         # If csv_file is just a filename, look for it in the appropriate directory
@@ -48,6 +150,10 @@ class BreedingPathFinder:
         self.breeding_data: Dict[Tuple[str, str], str] = {}  # (parent1, parent2) -> child
         self.reverse_breeding: Dict[str, List[Tuple[str, str]]] = defaultdict(list)  # child -> [(parent1, parent2)]
         self.all_pals: Set[str] = set()
+        self.last_search_info: dict = {}  # Details about how the most recent search was bounded
+        self.progress = False  # Emit PROGRESS lines during searches (see report_progress)
+        self.cancelled: Optional[str] = None  # Why the search was cancelled (see cancel), None while it may run
+        self.reset_stats()
         self.load_breeding_data()
     
     def load_breeding_data(self):
@@ -71,6 +177,8 @@ class BreedingPathFinder:
                         # Track all Pal names
                         self.all_pals.update([child, parent1, parent2])
             
+            self.build_index()
+            
             if not self.json_mode:
                 print(f"Loaded {len(self.breeding_data)//2} breeding combinations for {len(self.all_pals)} Pals")
             
@@ -82,6 +190,360 @@ class BreedingPathFinder:
             print(f"Error loading breeding data: {e}")
             sys.exit(1)
     
+    def build_index(self):
+        """Give every Pal an integer ID; the tables indexed by it are built on first use (see LAZY_TABLES)"""
+        # Sorted names give every Pal a stable ID, so bitmasks and iteration order are deterministic
+        self.pal_names: List[str] = sorted(self.all_pals)
+        self.pal_ids: Dict[str, int] = {name: i for i, name in enumerate(self.pal_names)}
+        self._numpy_cache: Dict[int, tuple] = {}
+        self.clear_caches()
+    
+    def __getattr__(self, name: str):
+        """Build a lazy table on its first use; only called for attributes that are not set yet"""
+        builder = LAZY_TABLES.get(name)
+        if builder is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        getattr(self, builder)()
+        return self.__dict__[name]
+    
+    def build_child_matrix(self):
+        """Build the dense child lookup table"""
+        pal_count = len(self.pal_names)
+        # child_matrix[parent1_id][parent2_id] -> child_id (or -1 if the pair does not breed)
+        self.child_matrix: List[List[int]] = [[-1] * pal_count for _ in range(pal_count)]
+        for (parent1, parent2), child in self.breeding_data.items():
+            self.child_matrix[self.pal_ids[parent1]][self.pal_ids[parent2]] = self.pal_ids[child]
+    
+    def build_edges(self):
+        """Build the adjacency lists of the breeding graph from the child matrix"""
+        pal_count = len(self.pal_names)
+        # breeding_edges[pal_id] -> [(partner_id, child_id)] ordered by partner, used for BFS expansion
+        # reverse_edges[child_id] -> [(pal_id, partner_id)] that produce the child, used for distance tables
+        self.breeding_edges: List[List[Tuple[int, int]]] = [[] for _ in range(pal_count)]
+        self.reverse_edges: List[List[Tuple[int, int]]] = [[] for _ in range(pal_count)]
+        # successor_masks[pal_id] -> bitmask of every child the Pal can breed into
+        self.successor_masks: List[int] = [0] * pal_count
+        for pal_id, row in enumerate(self.child_matrix):
+            for partner_id, child_id in enumerate(row):
+                if child_id >= 0 and partner_id != pal_id:
+                    self.breeding_edges[pal_id].append((partner_id, child_id))
+                    self.reverse_edges[child_id].append((pal_id, partner_id))
+                    self.successor_masks[pal_id] |= 1 << child_id
+        self.edge_count = sum(len(edges) for edges in self.breeding_edges)
+    
+    def build_parents_by_child(self):
+        """Build the reverse lookup used to list a child's parent pairs"""
+        # parents_by_child[child_id][pal_id] -> partner_ids, both orders and same-species pairs included
+        self.parents_by_child: List[Dict[int, List[int]]] = [defaultdict(list) for _ in self.pal_names]
+        for pal_id, row in enumerate(self.child_matrix):
+            for partner_id, child_id in enumerate(row):
+                if child_id >= 0:
+                    self.parents_by_child[child_id][pal_id].append(partner_id)
+    
+    def reset_stats(self):
+        """Zero the search counters reported by --stats"""
+        self.search_stats = {
+            "nodes_expanded": 0,
+            "edges_examined": 0,
+            "peak_queue": 0,
+            "cycle_pruned": 0,
+            "time_limited": False,
+            "path_limited": False
+        }
+        self.phase_timings: Dict[str, float] = {}
+        self._start_progress()
+    
+    def _record_stats(self, nodes_expanded: int = 0, edges_examined: int = 0, peak_queue: int = 0,
+                      cycle_pruned: int = 0, time_limited: bool = False):
+        """Add one engine run's counters to search_stats"""
+        stats = self.search_stats
+        stats["nodes_expanded"] += nodes_expanded
+        stats["edges_examined"] += edges_examined
+        stats["peak_queue"] = max(stats["peak_queue"], peak_queue)
+        stats["cycle_pruned"] += cycle_pruned
+        stats["time_limited"] = stats["time_limited"] or time_limited
+    
+    def _start_progress(self):
+        """Begin a progress-reported search: nothing is settled and the first report is one interval away"""
+        self._progress_started = time.perf_counter()
+        self._progress_due = self._progress_started + PROGRESS_INTERVAL
+        self._settled_mask = 0
+    
+    def report_progress(self, depth: int, pal_id: int, paths_found: int):
+        """Mark a Pal as settled (expanded) and, at most every PROGRESS_INTERVAL seconds, print progress.
+        
+        "PROGRESS: settled/total" is the format run_sidecar_with_progress parses; the PROGRESS_DETAIL line
+        after it adds the depth, paths found and elapsed time. Both go to stderr, so stdout stays one JSON
+        document. Engines only call this when progress is on.
+        """
+        self._settled_mask |= 1 << pal_id
+        now = time.perf_counter()
+        if now < self._progress_due:
+            return
+        self._progress_due = now + PROGRESS_INTERVAL
+        self._print_progress(depth, bin(self._settled_mask).count("1"), paths_found, now)
+    
+    def _finish_progress(self, paths_found: int):
+        """Report the search as complete, so progress bars always end full (the detail keeps the real count)"""
+        total = len(self.pal_names)
+        print(f"PROGRESS: {total}/{total}", file=sys.stderr, flush=True)
+        self._print_progress_detail("done", bin(self._settled_mask).count("1"), paths_found, time.perf_counter())
+    
+    def _print_progress(self, depth: int, settled: int, paths_found: int, now: float):
+        print(f"PROGRESS: {settled}/{len(self.pal_names)}", file=sys.stderr, flush=True)
+        self._print_progress_detail(depth, settled, paths_found, now)
+    
+    def _print_progress_detail(self, depth, settled: int, paths_found: int, now: float):
+        print(f"PROGRESS_DETAIL: depth={depth} settled={settled}/{len(self.pal_names)} "
+              f"paths={paths_found} elapsed={now - self._progress_started:.2f}s", file=sys.stderr, flush=True)
+    
+    def cancel(self, reason: str = "cancelled"):
+        """Ask the running search to stop: engines return the paths found so far, and every later search of
+        this finder returns at once. Results of a cancelled finder are partial."""
+        self.cancelled = reason
+    
+    def _collect_paths(self, paths_iterator, max_paths: int) -> List[List[str]]:
+        """Take up to max_paths paths from a lazy engine, recording whether the limit cut it short"""
+        paths = []
+        for path in paths_iterator:
+            paths.append(path)
+            if max_paths and len(paths) >= max_paths:
+                self.search_stats["path_limited"] = True
+                break
+        # Closing the generator now flushes its counters before the caller reads search_stats
+        paths_iterator.close()
+        return paths
+    
+    def clear_caches(self):
+        """Drop memoized distance tables, plans and NumPy tables, so the next query runs cold"""
+        self._distance_cache: Dict[Tuple[int, int], List[float]] = {}
+        self._plan_cache: Dict[Tuple[int, int], tuple] = {}
+        # Including the unrestricted tables: a sidecar process builds them for its one query
+        self._numpy_cache: Dict[int, tuple] = {}
+    
+    def build_condensation(self):
+        """Condense the parent->child graph into strongly connected components with transitive-closure bitsets"""
+        pal_count = len(self.pal_names)
+        successors = [sorted({child_id for _, child_id in edges}) for edges in self.breeding_edges]
+        self.successor_count = sum(len(children) for children in successors)
+        
+        # Iterative Tarjan; components are completed in reverse topological order (sinks first)
+        index = [-1] * pal_count
+        lowlink = [0] * pal_count
+        on_stack = [False] * pal_count
+        stack: List[int] = []
+        self.component_of: List[int] = [-1] * pal_count
+        self.components: List[List[int]] = []
+        counter = 0
+        for root in range(pal_count):
+            if index[root] >= 0:
+                continue
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, 0)]
+            while work:
+                node, next_index = work[-1]
+                if next_index < len(successors[node]):
+                    work[-1] = (node, next_index + 1)
+                    successor = successors[node][next_index]
+                    if index[successor] < 0:
+                        index[successor] = lowlink[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = True
+                        work.append((successor, 0))
+                    elif on_stack[successor]:
+                        lowlink[node] = min(lowlink[node], index[successor])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = len(self.components)
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        self.component_of[member] = component
+                        members.append(member)
+                        if member == node:
+                            break
+                    self.components.append(sorted(members))
+        
+        # component_reach[c] has bit d set when component d is reachable from component c (including c itself).
+        # Successor components always complete first, so one pass in completion order closes the DAG.
+        self.component_reach: List[int] = []
+        for component, members in enumerate(self.components):
+            reach = 1 << component
+            for member in members:
+                for successor in successors[member]:
+                    successor_component = self.component_of[successor]
+                    if successor_component != component:
+                        reach |= self.component_reach[successor_component]
+            self.component_reach.append(reach)
+    
+    def can_reach(self, start_id: int, target_id: int) -> bool:
+        """O(1) check whether the target can ever be bred starting from the start Pal"""
+        return bool((self.component_reach[self.component_of[start_id]] >> self.component_of[target_id]) & 1)
+    
+    def pals_reaching(self, target_id: int) -> int:
+        """Bitmask of all Pals from which the target can be bred (including the target itself)"""
+        target_component = self.component_of[target_id]
+        mask = 0
+        for component, members in enumerate(self.components):
+            if (self.component_reach[component] >> target_component) & 1:
+                for member in members:
+                    mask |= 1 << member
+        return mask
+    
+    def pal_mask(self, names: List[str]) -> Tuple[int, List[str]]:
+        """Convert Pal names to a bitmask over Pal IDs, returning the mask and any unknown names"""
+        mask = 0
+        unknown = []
+        for name in names:
+            pal = self.normalize_pal_name(name)
+            if pal in self.pal_ids:
+                mask |= 1 << self.pal_ids[pal]
+            else:
+                unknown.append(name)
+        return mask, unknown
+    
+    def unknown_pal_names(self, exclude: Optional[List[str]] = None, require: Optional[List[str]] = None,
+                          **_other_options) -> Optional[dict]:
+        """The success: false result for excluded or required names that are not Pals, with suggestions per
+        name, or None when every name is known. A misspelt exclusion must not silently allow the Pal."""
+        unknown = {option: self.pal_mask(names or [])[1] for option, names in (("exclude", exclude), ("require", require))}
+        unknown = {option: names for option, names in unknown.items() if names}
+        if not unknown:
+            return None
+        labels = {"exclude": "excluded", "require": "required"}
+        message = "; ".join(f"unknown {labels[option]} Pals: {', '.join(names)}" for option, names in unknown.items())
+        return {
+            "success": False,
+            "message": message[0].upper() + message[1:],
+            "suggestions": {option: {name: self.get_similar_pal_names(name) for name in names}
+                            for option, names in unknown.items()}
+        }
+    
+    def mask_to_names(self, mask: int) -> List[str]:
+        """Convert a bitmask over Pal IDs back to a sorted list of Pal names"""
+        return [name for i, name in enumerate(self.pal_names) if (mask >> i) & 1]
+    
+    def distances_to_target(self, target_id: int, exclude_mask: int = 0) -> List[float]:
+        """Minimum number of breeding steps from every Pal to the target (reverse BFS, cached per target)"""
+        key = (target_id, exclude_mask)
+        cached = self._distance_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        distances = [float('inf')] * len(self.pal_names)
+        distances[target_id] = 0
+        queue = deque([target_id])
+        expanded = examined = peak = 0
+        report = self.report_progress if self.progress else None
+        while queue:
+            peak = max(peak, len(queue))
+            child_id = queue.popleft()
+            next_distance = distances[child_id] + 1
+            expanded += 1
+            if report:
+                report(next_distance - 1, child_id, 0)
+            examined += len(self.reverse_edges[child_id])
+            for pal_id, partner_id in self.reverse_edges[child_id]:
+                if distances[pal_id] <= next_distance:
+                    continue
+                # An excluded Pal can neither be bred through nor used as a partner
+                if (exclude_mask >> pal_id) & 1 or (exclude_mask >> partner_id) & 1:
+                    continue
+                distances[pal_id] = next_distance
+                queue.append(pal_id)
+        
+        self._record_stats(expanded, examined, peak)
+        self._distance_cache[key] = distances
+        return distances
+    
+    def distances_via_required(self, target_id: int, required_id: int, exclude_mask: int = 0) -> List[float]:
+        """Minimum number of breeding steps from every Pal to the target on a route that uses the required Pal,
+        bred or as a partner (a lower bound: revisits are allowed; cached per target and required Pal)"""
+        key = (target_id, exclude_mask, required_id)
+        cached = self._distance_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        distances = self.distances_to_target(target_id, exclude_mask)
+        pal_count = len(self.pal_names)
+        via = [float('inf')] * pal_count
+        # Seeds: one step that breeds the required Pal or uses it as the partner, then the unconstrained distance
+        for pal_id, partner_id in self.reverse_edges[required_id]:
+            if not (exclude_mask >> partner_id) & 1:
+                via[pal_id] = min(via[pal_id], 1 + distances[required_id])
+        for pal_id in range(pal_count):
+            child_id = self.child_matrix[pal_id][required_id]
+            if child_id >= 0 and pal_id != required_id:
+                via[pal_id] = min(via[pal_id], 1 + distances[child_id])
+        heap = [(steps, pal_id) for pal_id, steps in enumerate(via)
+                if steps < float('inf') and not (exclude_mask >> pal_id) & 1]
+        heapq.heapify(heap)
+        while heap:
+            steps, child_id = heapq.heappop(heap)
+            if steps > via[child_id]:
+                continue
+            for pal_id, partner_id in self.reverse_edges[child_id]:
+                if via[pal_id] <= steps + 1 or (exclude_mask >> pal_id) & 1 or (exclude_mask >> partner_id) & 1:
+                    continue
+                via[pal_id] = steps + 1
+                heapq.heappush(heap, (steps + 1, pal_id))
+        for pal_id in range(pal_count):
+            if (exclude_mask >> pal_id) & 1:
+                via[pal_id] = float('inf')
+        
+        self._distance_cache[key] = via
+        return via
+    
+    def required_step_bounds(self, target_id: int, exclude_mask: int, require_mask: int) -> RequiredStepBounds:
+        """RequiredStepBounds over the distances_via_required tables of every required Pal"""
+        return RequiredStepBounds([(1 << pal_id, self.distances_via_required(target_id, pal_id, exclude_mask))
+                                   for pal_id in range(len(self.pal_names)) if (require_mask >> pal_id) & 1])
+    
+    def dataset_hash(self) -> str:
+        """dataset_hash of the loaded breeding CSV"""
+        return dataset_hash(self.csv_file)
+    
+    def export_index(self, output_file: Optional[str] = None) -> str:
+        """Write the lookup tables the frontend needs (name table, child matrix, reverse adjacency) as compact JSON.
+        
+        "child_matrix" is row-major with -1 for pairs that do not breed, and "parents"[child] is a flat list of
+        parent ID pairs (each unordered pair once). Returns the path written, next to the CSV by default.
+        """
+        import json
+        
+        if not output_file:
+            output_file = os.path.join(os.path.dirname(self.csv_file), "palworld_breeding_index.json")
+        parents = []
+        for parent_map in self.parents_by_child:
+            flat = []
+            for pal_id in sorted(parent_map):
+                for partner_id in parent_map[pal_id]:
+                    if pal_id <= partner_id:
+                        flat.extend((pal_id, partner_id))
+            parents.append(flat)
+        index = {
+            "version": INDEX_FORMAT_VERSION,
+            "source": os.path.basename(self.csv_file),
+            "pals": self.pal_names,
+            "child_matrix": [child_id for row in self.child_matrix for child_id in row],
+            "parents": parents
+        }
+        # Write next to the destination and rename, so readers never see a half-written index
+        temp_file = output_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+        os.replace(temp_file, output_file)
+        return output_file
+    
     def find_child_from_parents(self, parent1: str, parent2: str) -> Optional[str]:
         """Find the child Pal that results from breeding two parents"""
         # Normalize case for lookup
@@ -105,77 +567,1376 @@ class BreedingPathFinder:
         
         return name  # Return original if no match found
     
-    def find_shortest_paths(self, start_parent: str, target_child: str, max_paths: int = 20, max_seconds: Optional[float] = None) -> List[List[str]]:
-        """Find the shortest breeding paths from a parent to target child using BFS, with optional time and path count limits"""
+    def find_shortest_paths(self, start_parent: str, target_child: str, max_paths: int = 20, max_seconds: Optional[float] = None,
+                            exclude: Optional[List[str]] = None, require: Optional[List[str]] = None,
+                            max_steps: Optional[int] = None, beam_width: Optional[int] = None,
+                            max_frontier_mb: Optional[float] = None, engine: str = "auto",
+                            workers: Optional[int] = None) -> List[List[str]]:
+        """Find the shortest breeding paths from a parent to target child, with optional time and path count limits.
+        
+        exclude lists Pals that may not appear anywhere in a path (neither bred nor used as a partner),
+        require lists Pals that must appear somewhere in it, and max_steps caps the number of breeding steps.
+        
+        engine selects the search: "auto" (default, chosen per query by plan_query), "bfs", "iddfs"
+        (iterative-deepening DFS, O(depth) memory, paths in deterministic depth-first order) or
+        "bidirectional" (meet-in-the-middle distances, then the same depth-first enumeration) or "numpy"
+        (vectorized forward levels, then enumeration of the shortest-route DAG; needs NumPy installed).
+        
+        workers > 1 enumerates the IDDFS/bidirectional paths in a process pool, split by their first steps; the
+        paths and their order are the same as with a single process.
+        
+        Setting beam_width and/or max_frontier_mb switches BFS to a bounded-frontier (beam) search: each level
+        is ranked by distance to the target and trimmed, so memory stays bounded but the returned paths may
+        not be all (or, with required Pals, the shortest) paths. See last_search_info for what was dropped.
+        """
+        paths = self._find_shortest_paths(start_parent, target_child, max_paths, max_seconds, exclude, require,
+                                          max_steps, beam_width, max_frontier_mb, engine, workers)
+        if self.search_stats["time_limited"]:
+            # Without this a search cut off by max_seconds reads like a complete answer
+            self.last_search_info["time_limited"] = True
+        if self.progress:
+            self._finish_progress(len(paths))
+        return paths
+    
+    def _find_shortest_paths(self, start_parent: str, target_child: str, max_paths: int, max_seconds: Optional[float],
+                             exclude: Optional[List[str]], require: Optional[List[str]], max_steps: Optional[int],
+                             beam_width: Optional[int], max_frontier_mb: Optional[float], engine: str,
+                             workers: Optional[int]) -> List[List[str]]:
+        """find_shortest_paths without the progress bookkeeping"""
+        self.last_search_info = {"engine": engine}
+        self.reset_stats()
+        query = self._resolve_query(start_parent, target_child, exclude, require)
+        if query is None:
+            return []
+        start_id, target_id, exclude_mask, require_mask = query
+        
+        if start_id == target_id:
+            return [[self.pal_names[start_id]]] if not require_mask & ~(1 << start_id) else []
+        
+        # Answer impossible queries from the condensation before any search starts
+        if not self.can_reach(start_id, target_id):
+            self.last_search_info["unreachable"] = True
+            return []
+        
+        if engine == "auto":
+            plan = self.plan_query(start_id, target_id, exclude_mask, require_mask, max_paths, max_seconds,
+                                   max_steps, beam_width, max_frontier_mb)
+            engine = plan["engine"]
+            self.last_search_info = {"engine": engine, "plan": plan}
+        
+        if engine in ("bidirectional", "numpy") and require_mask:
+            # Meeting in the middle and forward levels only yield unconstrained shortest routes
+            engine = "iddfs"
+            self.last_search_info["engine"] = engine
+            self.last_search_info["fallback"] = "required Pals need the full distance table"
+        if engine == "numpy" and not numpy_available():
+            engine = "bidirectional"
+            self.last_search_info["engine"] = engine
+            self.last_search_info["fallback"] = "NumPy is not installed"
+        if workers and workers > 1 and engine not in ("iddfs", "bidirectional"):
+            # Only the depth-first enumeration is split across processes
+            self.last_search_info["workers"] = f"ignored: the {engine} engine runs in one process"
+        if engine == "lookup":
+            return self._lookup_paths(start_id, target_id, exclude_mask, require_mask, max_paths, max_steps)
+        if engine == "numpy":
+            depths, predecessors, _ = self.expand_levels_numpy(start_id, exclude_mask, {target_id}, max_steps)
+            if depths[target_id] == float('inf'):
+                return []
+            deadline = time.time() + max_seconds if max_seconds is not None else None
+            return self._collect_paths(self._iter_dag_paths(start_id, target_id, predecessors, deadline), max_paths)
+        if engine in ("iddfs", "bidirectional"):
+            if engine == "bidirectional":
+                distances = self._meet_in_middle(start_id, target_id, exclude_mask, max_steps)
+                if distances is None:
+                    return []
+            else:
+                distances = None
+            if workers and workers > 1:
+                if not require_mask:
+                    return self._enumerate_parallel(start_id, target_id, exclude_mask, max_steps, max_paths,
+                                                    max_seconds, distances, workers)
+                self.last_search_info["workers"] = "ignored: required Pals need iterative deepening"
+            return self._collect_paths(self._iter_paths_iddfs(start_id, target_id, exclude_mask, require_mask,
+                                                              max_steps, max_seconds, distances), max_paths)
+        if engine != "bfs":
+            raise ValueError(f"Unknown search engine: {engine}")
+        
+        return self._find_paths_bfs(start_id, target_id, exclude_mask, require_mask, max_paths, max_seconds,
+                                    max_steps, beam_width, max_frontier_mb)
+    
+    def _resolve_query(self, start_parent: str, target_child: str, exclude: Optional[List[str]],
+                       require: Optional[List[str]]) -> Optional[Tuple[int, int, int, int]]:
+        """Validate a path query, returning (start_id, target_id, exclude_mask, require_mask) or None"""
         start_parent = self.normalize_pal_name(start_parent)
         target_child = self.normalize_pal_name(target_child)
         
         if start_parent not in self.all_pals:
             if not self.json_mode:
                 print(f"❌ Unknown parent Pal: {start_parent}")
-            return []
+            return None
         
         if target_child not in self.all_pals:
             if not self.json_mode:
                 print(f"❌ Unknown target Pal: {target_child}")
+            return None
+        
+        exclude_mask, unknown_excluded = self.pal_mask(exclude or [])
+        require_mask, unknown_required = self.pal_mask(require or [])
+        if unknown_excluded or unknown_required:
+            if not self.json_mode:
+                print(f"❌ {self.unknown_pal_names(exclude, require)['message']}")
+            return None
+        
+        start_id = self.pal_ids[start_parent]
+        target_id = self.pal_ids[target_child]
+        
+        if ((1 << start_id) | (1 << target_id)) & exclude_mask or require_mask & exclude_mask:
+            if not self.json_mode:
+                print("❌ A Pal cannot be both excluded and part of the path")
+            return None
+        
+        return start_id, target_id, exclude_mask, require_mask
+    
+    def _find_paths_bfs(self, start_id: int, target_id: int, exclude_mask: int, require_mask: int, max_paths: int,
+                        max_seconds: Optional[float], max_steps: Optional[int], beam_width: Optional[int],
+                        max_frontier_mb: Optional[float]) -> List[List[str]]:
+        """Breadth-first search for all shortest paths (optionally as a bounded-frontier beam search)"""
+        # Distance tables are only needed (and only paid for) when a step bound, exclusions or beam ranking are in play
+        beam_mode = beam_width is not None or max_frontier_mb is not None
+        constrained = bool(exclude_mask or require_mask or max_steps is not None or beam_mode)
+        step_bound = max_steps if max_steps is not None else float('inf')
+        distances = self.distances_to_target(target_id, exclude_mask) if constrained else None
+        if distances is not None and (distances[start_id] == float('inf') or distances[start_id] > step_bound):
             return []
+        if distances is not None and not require_mask:
+            # Every shortest path then has exactly the start's distance, the bound IDDFS deepens from
+            step_bound = distances[start_id]
+        required_bounds = self.required_step_bounds(target_id, exclude_mask, require_mask) if require_mask else None
+        # Without a distance table, the condensation still prunes every child that can never lead to the target
+        reaching_mask = self.pals_reaching(target_id) if distances is None else 0
         
-        if start_parent == target_child:
-            return [[start_parent]]
+        pal_names = self.pal_names
+        breeding_edges = self.breeding_edges
+        start_parent = pal_names[start_id]
+        target_child = pal_names[target_id]
+        start_bit = 1 << start_id
         
         # BFS to find all shortest paths
-        queue = deque([(start_parent, [start_parent])])  # (current_pal, path)
-        visited_depths = {start_parent: 0}  # Track minimum depth to reach each Pal
+        # (current_id, path, pals_on_path_mask, required_pals_seen_mask)
+        queue = deque([(start_id, [start_parent], start_bit, require_mask & start_bit)])
+        visited_depths = {(start_id, require_mask & start_bit): 0}  # Track minimum depth to reach each search state
         paths = []
         min_depth = float('inf')
         start_time = time.time()
         
-        while queue:
+        # In beam mode children are collected per level and trimmed before they are expanded
+        next_level = []
+        frontier = next_level if beam_mode else queue
+        level_limit = 1
+        dropped = 0
+        expanded = examined = peak = cycle_pruned = 0
+        time_limited = False
+        report = self.report_progress if self.progress else None
+        
+        while queue or next_level:
+            if not queue:
+                dropped += self._trim_frontier(next_level, distances, level_limit)
+                queue.extend(next_level)
+                next_level.clear()
+            if self.cancelled:
+                break
             if max_seconds is not None and (time.time() - start_time) > max_seconds:
+                time_limited = True
                 break
             if max_paths and len(paths) >= max_paths:
+                self.search_stats["path_limited"] = True
                 break
-            current_pal, path = queue.popleft()
-
+            peak = max(peak, len(queue) + len(next_level))
+            current_id, path, path_mask, seen_required = queue.popleft()
+            
             # Skip if we've found shorter paths already
             if len(path) > min_depth:
                 continue
-
-            # Prevent cycles: do not allow the start parent or target child as an intermediate step
-            # (except as the first or last node)
-            if len(path) > 1:
-                intermediates = set(path[1:])
-                if start_parent in intermediates or target_child in intermediates:
-                    continue
-
+            
+            depth = len(path)  # Breeding steps in any path extended from here
+            current_pal = pal_names[current_id]
+            expanded += 1
+            examined += len(breeding_edges[current_id])
+            if report:
+                report(depth, current_id, len(paths))
+            
             # Try all possible breeding combinations where current_pal is one parent
-            for other_parent in self.all_pals:
-                if other_parent == current_pal:
+            for partner_id, child_id in breeding_edges[current_id]:
+                if exclude_mask and ((exclude_mask >> partner_id) & 1 or (exclude_mask >> child_id) & 1):
                     continue
-
-                child = self.breeding_data.get((current_pal, other_parent))
-                if child:
-                    new_path = path + [f"{current_pal} + {other_parent} = {child}"]
-
-                    if child == target_child:
-                        # Found a path to target
-                        if len(new_path) <= min_depth:
-                            min_depth = len(new_path)
-                            # Check for cycles in the full path (including the result)
-                            intermediates = set(new_path[1:-1])
-                            if start_parent in intermediates or target_child in intermediates:
-                                continue
-                            paths.append(new_path)
-                    else:
-                        # Continue searching from this child
-                        depth = len(new_path)
-                        if child not in visited_depths or visited_depths[child] >= depth:
-                            visited_depths[child] = depth
-                            queue.append((child, new_path))
-
+                
+                child_bit = 1 << child_id
+                # Prevent cycles: a Pal already on the path (including the start parent) is never bred again
+                if path_mask & child_bit:
+                    cycle_pruned += 1
+                    continue
+                
+                new_seen = seen_required | (require_mask & ((1 << partner_id) | child_bit))
+                
+                if distances is None:
+                    if not (reaching_mask >> child_id) & 1:
+                        continue
+                else:
+                    # Prune branches that cannot reach the target (or collect the missing required Pals, see
+                    # RequiredStepBounds) within the step bound, or no longer tie the shortest path found
+                    remaining = distances[child_id]
+                    if remaining == float('inf'):
+                        continue
+                    missing = require_mask & ~new_seen
+                    if missing:
+                        remaining = max(remaining, required_bounds[missing][child_id])
+                    if depth + remaining > step_bound or depth + remaining + 1 > min_depth:
+                        continue
+                
+                if child_id == target_id:
+                    # Found a path to target
+                    if new_seen != require_mask:
+                        continue
+                    new_path = path + [f"{current_pal} + {pal_names[partner_id]} = {target_child}"]
+                    if len(new_path) <= min_depth:
+                        min_depth = len(new_path)
+                        paths.append(new_path)
+                else:
+                    # Continue searching from this child
+                    state = (child_id, new_seen)
+                    if state not in visited_depths or visited_depths[state] >= depth:
+                        visited_depths[state] = depth
+                        new_path = path + [f"{current_pal} + {pal_names[partner_id]} = {pal_names[child_id]}"]
+                        frontier.append((child_id, new_path, path_mask | child_bit, new_seen))
+                        if beam_mode:
+                            if len(next_level) == 1:
+                                level_limit = self._beam_level_limit(next_level[0], beam_width, max_frontier_mb)
+                            elif len(next_level) >= 2 * level_limit:
+                                # Trim early so the level being built never holds more than twice the limit
+                                dropped += self._trim_frontier(next_level, distances, level_limit)
+        
+        self._record_stats(expanded, examined, peak, cycle_pruned, time_limited)
+        if beam_mode:
+            shortest_possible = distances[start_id] if not require_mask else None
+            self.last_search_info.update({
+                "mode": "beam",
+                "beam_width": beam_width,
+                "max_frontier_mb": max_frontier_mb,
+                "dropped_entries": dropped,
+                "complete": dropped == 0,
+                "optimal": dropped == 0 or bool(paths) and len(paths[0]) - 1 == shortest_possible
+            })
+        
         # Always return up to max_paths, even if time was the limiting factor
         return paths[:max_paths] if max_paths else paths
     
+    def _iter_paths_iddfs(self, start_id: int, target_id: int, exclude_mask: int, require_mask: int,
+                          max_steps: Optional[int], max_seconds: Optional[float], distances: Optional[List[float]] = None,
+                          prefix: Optional[List[Tuple[int, int]]] = None):
+        """Yield all shortest paths with iterative-deepening DFS, holding only the current path in memory.
+        
+        prefix restricts the search to paths whose first (partner_id, child_id) steps are exactly those given.
+        """
+        if distances is None:
+            distances = self.distances_to_target(target_id, exclude_mask)
+        pal_names = self.pal_names
+        breeding_edges = self.breeding_edges
+        step_bound = max_steps if max_steps is not None else len(pal_names) - 1
+        deadline = time.time() + max_seconds if max_seconds is not None else None
+        required_bounds = self.required_step_bounds(target_id, exclude_mask, require_mask) if require_mask else None
+        
+        # (partner_id, child_id) of each step on the current path
+        steps: List[Tuple[int, int]] = []
+        timed_out = False
+        # Whether the depth limit cut any branch that could still reach the target; if not, deepening is pointless
+        depth_cut = False
+        expanded = examined = deepest = cycle_pruned = found_paths = 0
+        report = self.report_progress if self.progress else None
+        
+        def search(current_id: int, path_mask: int, seen_required: int, remaining: int):
+            nonlocal timed_out, depth_cut, expanded, examined, deepest, cycle_pruned, found_paths
+            if self.cancelled or deadline is not None and time.time() > deadline:
+                timed_out = True
+                return
+            expanded += 1
+            examined += len(breeding_edges[current_id])
+            deepest = max(deepest, len(steps) + 1)
+            if report:
+                report(len(steps), current_id, found_paths)
+            for partner_id, child_id in breeding_edges[current_id]:
+                # The distance table is exact for the unconstrained part, so every branch it keeps leads to the target
+                if distances[child_id] > remaining - 1:
+                    depth_cut = depth_cut or distances[child_id] < float('inf')
+                    continue
+                if prefix and len(steps) < len(prefix) and (partner_id, child_id) != prefix[len(steps)]:
+                    continue
+                if exclude_mask and (exclude_mask >> partner_id) & 1:
+                    continue
+                child_bit = 1 << child_id
+                if path_mask & child_bit:
+                    cycle_pruned += 1
+                    continue
+                new_seen = seen_required | (require_mask & ((1 << partner_id) | child_bit))
+                missing = require_mask & ~new_seen
+                if missing:
+                    needed = required_bounds[missing][child_id]
+                    if needed > remaining - 1:
+                        depth_cut = depth_cut or needed < float('inf')
+                        continue
+                
+                steps.append((partner_id, child_id))
+                if child_id == target_id:
+                    if new_seen == require_mask:
+                        found_paths += 1
+                        yield self._steps_to_path(start_id, steps)
+                elif remaining > 1:
+                    yield from search(child_id, path_mask | child_bit, new_seen, remaining - 1)
+                steps.pop()
+                if timed_out:
+                    return
+        
+        start_bit = 1 << start_id
+        depth_limit = distances[start_id]
+        if require_mask & ~start_bit:
+            # No route collecting every required Pal is shorter than the longest detour through one of them
+            depth_limit = max(depth_limit, required_bounds[require_mask & ~start_bit][start_id])
+        iterations = 0
+        try:
+            while depth_limit <= step_bound and not timed_out:
+                iterations += 1
+                self.last_search_info.update({"depth_limit": depth_limit, "iterations": iterations})
+                found = depth_cut = False
+                for path in search(start_id, start_bit, require_mask & start_bit, depth_limit):
+                    found = True
+                    yield path
+                if found or not depth_cut:
+                    return
+                depth_limit += 1
+        finally:
+            # The recursion depth is the whole "queue" of a depth-first search
+            self._record_stats(expanded, examined, deepest, cycle_pruned, timed_out and not self.cancelled)
+    
+    def _enumerate_parallel(self, start_id: int, target_id: int, exclude_mask: int, max_steps: Optional[int],
+                            max_paths: int, max_seconds: Optional[float], distances: Optional[List[float]],
+                            workers: int) -> List[List[str]]:
+        """Enumerate shortest paths across a process pool, one task per path prefix.
+        
+        Prefixes are listed in depth-first order and results are merged in that order, so the output matches
+        the single-process enumeration; every task shares the global deadline and stops at max_paths.
+        """
+        if distances is None:
+            distances = self.distances_to_target(target_id, exclude_mask)
+        depth = distances[start_id]
+        if depth == float('inf') or (max_steps is not None and depth > max_steps):
+            return []
+        deadline = time.time() + max_seconds if max_seconds is not None else None
+        
+        prefixes = self._path_prefixes(start_id, exclude_mask, distances, depth, 1)
+        if len(prefixes) < workers * PARALLEL_BRANCHES_PER_WORKER and depth > 2:
+            prefixes = self._path_prefixes(start_id, exclude_mask, distances, depth, 2)
+        self.last_search_info.update({"workers": workers, "branches": len(prefixes), "depth_limit": depth})
+        
+        tasks = [(start_id, target_id, exclude_mask, depth, distances, prefix, max_paths, deadline) for prefix in prefixes]
+        # Imported here: multiprocessing is a noticeable share of the sidecar's start-up time
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        paths: List[List[str]] = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_path_worker, initargs=(self,)) as executor:
+            try:
+                for branch_paths, branch_stats in executor.map(_enumerate_branch, tasks):
+                    paths.extend(branch_paths)
+                    self._record_stats(branch_stats["nodes_expanded"], branch_stats["edges_examined"],
+                                       branch_stats["peak_queue"], branch_stats["cycle_pruned"],
+                                       branch_stats["time_limited"])
+                    if max_paths and len(paths) >= max_paths:
+                        self.search_stats["path_limited"] = True
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+                    if self.cancelled:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+            except BrokenProcessPool:
+                # Cancelling terminates the workers (see install_cancel_handlers); keep the finished branches
+                if not self.cancelled:
+                    raise
+        return paths[:max_paths] if max_paths else paths
+    
+    def _path_prefixes(self, start_id: int, exclude_mask: int, distances: List[float], depth: int,
+                       length: int) -> List[List[Tuple[int, int]]]:
+        """Every first-`length`-steps prefix of a shortest path, in the order the depth-first search visits them"""
+        if length >= depth:
+            return [[]]
+        prefixes = [([], start_id, 1 << start_id)]
+        for level in range(length):
+            remaining = depth - level
+            next_prefixes = []
+            for steps, pal_id, path_mask in prefixes:
+                for partner_id, child_id in self.breeding_edges[pal_id]:
+                    if distances[child_id] > remaining - 1 or (exclude_mask >> partner_id) & 1 or (path_mask >> child_id) & 1:
+                        continue
+                    next_prefixes.append((steps + [(partner_id, child_id)], child_id, path_mask | (1 << child_id)))
+            prefixes = next_prefixes
+        return [steps for steps, _, _ in prefixes]
+    
+    def _meet_in_middle(self, start_id: int, target_id: int, exclude_mask: int,
+                        max_steps: Optional[int]) -> Optional[List[float]]:
+        """Bidirectional BFS from start and target, returning distances to the target that are exact on every
+        shortest path (and infinite elsewhere), or None when no path fits within max_steps"""
+        pal_count = len(self.pal_names)
+        breeding_edges = self.breeding_edges
+        reverse_edges = self.reverse_edges
+        step_bound = max_steps if max_steps is not None else pal_count - 1
+        forward = [float('inf')] * pal_count
+        backward = [float('inf')] * pal_count
+        forward[start_id] = 0
+        backward[target_id] = 0
+        forward_levels = [[start_id]]
+        backward_frontier = [target_id]
+        backward_radius = 0
+        best = float('inf')
+        
+        # Expand whole levels on the cheaper side until the two balls touch
+        while forward_levels[-1] and backward_frontier and len(forward_levels) - 1 + backward_radius < step_bound:
+            forward_work = sum(len(breeding_edges[pal_id]) for pal_id in forward_levels[-1])
+            backward_work = sum(len(reverse_edges[pal_id]) for pal_id in backward_frontier)
+            if forward_work <= backward_work:
+                self._record_stats(len(forward_levels[-1]), forward_work, len(forward_levels[-1]))
+                depth = len(forward_levels)
+                next_level = []
+                for pal_id in forward_levels[-1]:
+                    if self.progress:
+                        self.report_progress(depth - 1, pal_id, 0)
+                    for partner_id, child_id in breeding_edges[pal_id]:
+                        if forward[child_id] <= depth or (exclude_mask >> partner_id) & 1 or (exclude_mask >> child_id) & 1:
+                            continue
+                        forward[child_id] = depth
+                        next_level.append(child_id)
+                        best = min(best, depth + backward[child_id])
+                forward_levels.append(next_level)
+            else:
+                self._record_stats(len(backward_frontier), backward_work, len(backward_frontier))
+                backward_radius += 1
+                next_frontier = []
+                for child_id in backward_frontier:
+                    if self.progress:
+                        self.report_progress(backward_radius - 1, child_id, 0)
+                    for pal_id, partner_id in reverse_edges[child_id]:
+                        if backward[pal_id] <= backward_radius or (exclude_mask >> partner_id) & 1 or (exclude_mask >> pal_id) & 1:
+                            continue
+                        backward[pal_id] = backward_radius
+                        next_frontier.append(pal_id)
+                        best = min(best, backward_radius + forward[pal_id])
+                backward_frontier = next_frontier
+            if best < float('inf'):
+                # Full levels were expanded on both sides, so the first meeting is at the shortest distance
+                break
+        
+        if best > step_bound:
+            return None
+        
+        # Backward distances are exact; extend them to the forward levels that lead into the backward ball
+        distances = backward
+        for depth in range(len(forward_levels) - 2, -1, -1):
+            for pal_id in forward_levels[depth]:
+                if distances[pal_id] < float('inf'):
+                    continue
+                remaining = best - depth
+                for partner_id, child_id in breeding_edges[pal_id]:
+                    if distances[child_id] == remaining - 1 and not (exclude_mask >> partner_id) & 1:
+                        distances[pal_id] = remaining
+                        break
+        return distances
+    
+    def _lookup_paths(self, start_id: int, target_id: int, exclude_mask: int, require_mask: int,
+                      max_paths: int, max_steps: Optional[int]) -> List[List[str]]:
+        """Answer a one-step query straight from the child matrix row of the start Pal"""
+        if max_steps is not None and max_steps < 1:
+            return []
+        paths = []
+        start_bit = (1 << start_id) | (1 << target_id)
+        self._record_stats(1, len(self.breeding_edges[start_id]), 1)
+        for partner_id, child_id in self.breeding_edges[start_id]:
+            if child_id != target_id or (exclude_mask >> partner_id) & 1:
+                continue
+            if require_mask & ~(start_bit | (1 << partner_id)):
+                continue
+            paths.append(self._steps_to_path(start_id, [(partner_id, child_id)]))
+            if max_paths and len(paths) >= max_paths:
+                break
+        return paths
+    
+    def count_shortest_paths(self, start_id: int, target_id: int, distances: List[float], exclude_mask: int = 0) -> int:
+        """Count the shortest paths (each distinct partner choice counts) using a distance table to the target"""
+        breeding_edges = self.breeding_edges
+        counts: Dict[int, int] = {target_id: 1}
+        
+        def count(pal_id: int) -> int:
+            if pal_id in counts:
+                return counts[pal_id]
+            total = 0
+            for partner_id, child_id in breeding_edges[pal_id]:
+                if distances[child_id] == distances[pal_id] - 1 and not (exclude_mask >> partner_id) & 1:
+                    total += count(child_id)
+            counts[pal_id] = total
+            return total
+        
+        return count(start_id) if distances[start_id] < float('inf') else 0
+    
+    def plan_query(self, start_id: int, target_id: int, exclude_mask: int, require_mask: int, max_paths: int,
+                   max_seconds: Optional[float], max_steps: Optional[int], beam_width: Optional[int],
+                   max_frontier_mb: Optional[float]) -> dict:
+        """Pick the cheapest engine for a query from index statistics.
+        
+        Costs are estimated in edges examined: the lookup scans one child matrix row, IDDFS pays for the
+        distance table (free when cached) plus enumeration, bidirectional pays for two balls that grow until
+        they touch plus enumeration, and BFS pays for every path prefix shorter than the target distance.
+        """
+        pal_count = len(self.pal_names)
+        avg_fanout = self.edge_count / max(pal_count, 1)
+        start_fanout = len(self.breeding_edges[start_id])
+        target_fanout = len(self.reverse_edges[target_id])
+        
+        direct = [partner_id for partner_id, child_id in self.breeding_edges[start_id]
+                  if child_id == target_id and not (exclude_mask >> partner_id) & 1]
+        table = self._distance_cache.get((target_id, exclude_mask))
+        if direct:
+            distance, distance_source = 1, "lookup"
+        elif table is not None:
+            distance, distance_source = table[start_id], "table"
+        else:
+            distance, distance_source = self.bitset_distance(start_id, target_id, exclude_mask), "bitsets"
+        
+        # Exact reverse-BFS cost: every Pal that can reach the target has its reverse edges scanned once
+        reaching = self.pals_reaching(target_id)
+        table_cost = 0 if table is not None else sum(len(self.reverse_edges[pal_id]) for pal_id in range(pal_count)
+                                                     if (reaching >> pal_id) & 1)
+        bidirectional_search = self._estimate_meeting_cost(start_fanout, target_fanout, distance)
+        if distance == float('inf'):
+            # The cached table already proves there is no path under these exclusions
+            return {"engine": "iddfs", "reason": "no path under the given exclusions",
+                    "inputs": {"distance": None, "distance_source": distance_source}}
+        
+        if direct:
+            estimated_paths = len(direct)
+        elif table is not None:
+            estimated_paths = self.count_shortest_paths(start_id, target_id, table, exclude_mask)
+        else:
+            # Walks of the right length from the start, times the chance that the last edge produces the target
+            estimated_paths = max(1, round(start_fanout * avg_fanout ** (distance - 1) * target_fanout / self.edge_count))
+        paths_needed = min(estimated_paths, max_paths) if max_paths else estimated_paths
+        # Depth-first enumeration scans one row per path prefix; each row scan before the target yields
+        # as many paths as there are partners producing the target from that Pal
+        target_parents = len({pal_id for pal_id, _ in self.reverse_edges[target_id]})
+        paths_per_row = target_fanout / max(target_parents, 1)
+        enumeration = paths_needed / paths_per_row * avg_fanout + paths_needed * distance
+        
+        # BFS holds one entry per path prefix and expands every prefix up to the target depth; it can only
+        # stop early part-way through the level before the target
+        prefixes = [1] + [start_fanout * avg_fanout ** (depth - 1) for depth in range(1, int(distance) + 1)]
+        bfs_cost = avg_fanout * sum(prefixes)
+        if paths_needed < estimated_paths:
+            bfs_cost = avg_fanout * (sum(prefixes[:-2]) + prefixes[-2] * paths_needed / estimated_paths)
+        
+        costs = {
+            "bfs": bfs_cost,
+            "iddfs": table_cost + enumeration,
+        }
+        if not require_mask:
+            costs["bidirectional"] = bidirectional_search + enumeration
+            if direct:
+                costs["lookup"] = pal_count
+        
+        if beam_width is not None or max_frontier_mb is not None:
+            engine, reason = "bfs", "bounded-frontier search is only available in BFS"
+        elif require_mask:
+            # The path estimates above count unconstrained routes; BFS has to expand every prefix until one
+            # collects the required Pals, while iterative deepening prunes on the ones still missing
+            engine, reason = "iddfs", "required Pals: the cost model only covers unconstrained routes"
+        else:
+            engine = min(costs, key=costs.get)
+            reason = "lowest estimated cost"
+        
+        estimated_seconds = costs[engine] * SECONDS_PER_EDGE
+        return {
+            "engine": engine,
+            "reason": reason,
+            "inputs": {
+                "distance": distance,
+                "distance_source": distance_source,
+                "estimated_paths": estimated_paths,
+                "start_fanout": start_fanout,
+                "target_fanout": target_fanout,
+                "max_paths": max_paths,
+                "max_seconds": max_seconds
+            },
+            "estimated_cost": {name: round(cost) for name, cost in costs.items()},
+            "estimated_seconds": round(estimated_seconds, 4),
+            "within_time_budget": max_seconds is None or estimated_seconds <= max_seconds
+        }
+    
+    def bitset_distance(self, start_id: int, target_id: int, exclude_mask: int = 0) -> float:
+        """Breeding distance from reachability bitsets, O(depth x Pals) big-integer ORs (a lower bound when
+        excluded Pals are only forbidden as partners)"""
+        seen = frontier = 1 << start_id
+        target_bit = 1 << target_id
+        distance = 0
+        while frontier:
+            distance += 1
+            reached = 0
+            pal_id = 0
+            while frontier:
+                if frontier & 1:
+                    reached |= self.successor_masks[pal_id]
+                frontier >>= 1
+                pal_id += 1
+            if reached & target_bit:
+                return distance
+            frontier = reached & ~seen & ~exclude_mask
+            seen |= frontier
+        return float('inf')
+    
+    def _estimate_meeting_cost(self, start_fanout: int, target_fanout: int, distance: float) -> float:
+        """Estimate edges scanned by a bidirectional BFS over the given distance from average graph statistics"""
+        pal_count = len(self.pal_names)
+        avg_fanout = self.edge_count / max(pal_count, 1)
+        # Fraction of scanned edges that lead to a Pal not produced by another edge of the same Pal
+        distinct_ratio = self.successor_count / max(self.edge_count, 1)
+        forward_seen = backward_seen = 1
+        forward_scan, backward_scan = start_fanout, target_fanout
+        cost = 0
+        for _ in range(int(min(distance, pal_count))):
+            if forward_scan <= backward_scan:
+                cost += forward_scan
+                forward_nodes = min(pal_count - forward_seen, forward_scan * distinct_ratio)
+                forward_seen += forward_nodes
+                forward_scan = forward_nodes * avg_fanout
+            else:
+                cost += backward_scan
+                backward_nodes = min(pal_count - backward_seen, backward_scan * distinct_ratio)
+                backward_seen += backward_nodes
+                backward_scan = backward_nodes * avg_fanout
+        return cost
+    
+    def load_cost_vectors(self, cost_file: str) -> dict:
+        """Load per-Pal cost vectors for Pareto search from a JSON file.
+        
+        The file looks like {"objectives": {"rarity": "partner", "incubation": "child"},
+        "costs": {"Lamball": {"rarity": 1, "incubation": 60}, ...}}. A breeding step is charged the partner's
+        "partner" objectives and the child's "child" objectives; missing values cost 0. Raises OSError when the
+        file cannot be read and ValueError when it is not valid JSON of that shape.
+        """
+        import json
+        with open(cost_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        per_pal = data.get("costs", {}) if isinstance(data, dict) else None
+        if not isinstance(per_pal, dict) or not all(isinstance(costs, dict) for costs in per_pal.values()):
+            raise ValueError('Expected {"costs": {"<Pal>": {"<objective>": <number>, ...}, ...}}')
+        scopes = data.get("objectives")
+        if scopes is None:
+            scopes = {name: "partner" for costs in per_pal.values() for name in costs}
+        if not isinstance(scopes, dict):
+            raise ValueError('Expected "objectives" to map each objective to "partner" or "child"')
+        for name, scope in scopes.items():
+            if scope not in ("partner", "child"):
+                raise ValueError(f"Objective '{name}' must apply to 'partner' or 'child', not '{scope}'")
+        objectives = sorted(scopes)
+        
+        pal_count = len(self.pal_names)
+        partner_costs = [[0.0] * len(objectives) for _ in range(pal_count)]
+        child_costs = [[0.0] * len(objectives) for _ in range(pal_count)]
+        for name, costs in per_pal.items():
+            pal = self.normalize_pal_name(name)
+            if pal not in self.pal_ids:
+                if not self.json_mode:
+                    print(f"⚠️  Ignoring costs for unknown Pal: {name}")
+                continue
+            pal_id = self.pal_ids[pal]
+            for k, objective in enumerate(objectives):
+                target = partner_costs if scopes[objective] == "partner" else child_costs
+                value = costs.get(objective, 0)
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(f"Cost '{objective}' of {name} must be a number, not {value!r}")
+                target[pal_id][k] = float(value)
+        
+        return {
+            "objectives": objectives,
+            "partner": [tuple(costs) for costs in partner_costs],
+            "child": [tuple(costs) for costs in child_costs]
+        }
+    
+    def find_pareto_paths(self, start_parent: str, target_child: str, cost_vectors: dict,
+                          exclude: Optional[List[str]] = None, require: Optional[List[str]] = None,
+                          max_steps: Optional[int] = None, max_seconds: Optional[float] = None,
+                          max_labels: int = 100000, **_other_options) -> List[Tuple[dict, List[str]]]:
+        """Multi-objective label-setting search returning the Pareto front over steps and the given cost vectors.
+        
+        Labels are settled in lexicographic cost order, so a settled label is never improved; a label is
+        discarded when a settled label at the same Pal (and set of required Pals seen) or a path already at
+        the target dominates it. Without max_steps, paths may be up to PARETO_EXTRA_STEPS longer than the
+        shortest path.
+        """
+        query = self._resolve_query(start_parent, target_child, exclude, require)
+        if query is None:
+            return []
+        start_id, target_id, exclude_mask, require_mask = query
+        objectives = cost_vectors["objectives"]
+        partner_costs = cost_vectors["partner"]
+        child_costs = cost_vectors["child"]
+        zero = (0,) + (0.0,) * len(objectives)
+        
+        def labelled(cost: tuple) -> dict:
+            return dict(zip(["steps"] + objectives, cost))
+        
+        if start_id == target_id:
+            return [(labelled(zero), [self.pal_names[start_id]])] if not require_mask & ~(1 << start_id) else []
+        if not self.can_reach(start_id, target_id):
+            return []
+        
+        distances = self.distances_to_target(target_id, exclude_mask)
+        if distances[start_id] == float('inf'):
+            return []
+        step_bound = max_steps if max_steps is not None else distances[start_id] + PARETO_EXTRA_STEPS
+        deadline = time.time() + max_seconds if max_seconds is not None else None
+        
+        def dominates(a: tuple, b: tuple) -> bool:
+            return all(x <= y for x, y in zip(a, b))
+        
+        start_seen = require_mask & (1 << start_id)
+        # (cost, tie-breaker, pal_id, required_seen, path_mask, steps chain)
+        heap = [(zero, 0, start_id, start_seen, 1 << start_id, None)]
+        settled: Dict[Tuple[int, int], List[tuple]] = defaultdict(list)
+        front: List[Tuple[tuple, tuple]] = []
+        counter = 1
+        
+        while heap and counter < max_labels:
+            if self.cancelled or deadline is not None and time.time() > deadline:
+                break
+            cost, _, pal_id, seen, path_mask, chain = heapq.heappop(heap)
+            
+            if pal_id == target_id:
+                if not any(dominates(found, cost) for found, _ in front):
+                    front.append((cost, chain))
+                continue
+            
+            state_labels = settled[(pal_id, seen)]
+            if any(dominates(other, cost) for other in state_labels):
+                continue
+            state_labels.append(cost)
+            
+            for partner_id, child_id in self.breeding_edges[pal_id]:
+                if exclude_mask and (exclude_mask >> partner_id) & 1:
+                    continue
+                child_bit = 1 << child_id
+                if path_mask & child_bit or cost[0] + 1 + distances[child_id] > step_bound:
+                    continue
+                new_seen = seen | (require_mask & ((1 << partner_id) | child_bit))
+                if child_id == target_id and new_seen != require_mask:
+                    continue
+                partner_cost = partner_costs[partner_id]
+                child_cost = child_costs[child_id]
+                new_cost = (cost[0] + 1,) + tuple(c + p + q for c, p, q in zip(cost[1:], partner_cost, child_cost))
+                # The remaining steps are a lower bound on the target label, so use them against the front
+                bound = (new_cost[0] + distances[child_id],) + new_cost[1:]
+                if any(dominates(found, bound) for found, _ in front):
+                    continue
+                heapq.heappush(heap, (new_cost, counter, child_id, new_seen, path_mask | child_bit,
+                                      (chain, partner_id, child_id)))
+                counter += 1
+        
+        self.last_search_info["pareto"] = {"labels_created": counter, "complete": not heap}
+        
+        results = []
+        for cost, chain in front:
+            steps = []
+            while chain is not None:
+                chain, partner_id, child_id = chain
+                steps.append((partner_id, child_id))
+            steps.reverse()
+            results.append((labelled(cost), self._steps_to_path(start_id, steps)))
+        return results
+    
+    def expand_levels(self, start_id: int, exclude_mask: int = 0, stop_ids: Optional[Set[int]] = None,
+                      radius: Optional[int] = None) -> Tuple[List[float], List[List[Tuple[int, int]]], List[int]]:
+        """Level-synchronous BFS from the start Pal over the breeding graph.
+        
+        Returns the minimal depth of every Pal, its predecessors on shortest routes as (pal_id, partner_id)
+        and the number of distinct shortest routes to it (each partner choice counts). Stops after the level
+        that settles every Pal in stop_ids, or after radius levels.
+        """
+        pal_count = len(self.pal_names)
+        breeding_edges = self.breeding_edges
+        depths = [float('inf')] * pal_count
+        predecessors: List[List[Tuple[int, int]]] = [[] for _ in range(pal_count)]
+        route_counts = [0] * pal_count
+        depths[start_id] = 0
+        route_counts[start_id] = 1
+        pending = set(stop_ids or ()) - {start_id}
+        frontier = [start_id]
+        depth = 0
+        while frontier and (radius is None or depth < radius) and (stop_ids is None or pending):
+            depth += 1
+            next_frontier = []
+            self._record_stats(len(frontier), sum(len(breeding_edges[pal_id]) for pal_id in frontier), len(frontier))
+            for pal_id in frontier:
+                if self.progress:
+                    self.report_progress(depth - 1, pal_id, 0)
+                count = route_counts[pal_id]
+                for partner_id, child_id in breeding_edges[pal_id]:
+                    if exclude_mask and ((exclude_mask >> partner_id) & 1 or (exclude_mask >> child_id) & 1):
+                        continue
+                    if depths[child_id] == float('inf'):
+                        depths[child_id] = depth
+                        next_frontier.append(child_id)
+                    elif depths[child_id] != depth:
+                        continue
+                    predecessors[child_id].append((pal_id, partner_id))
+                    route_counts[child_id] += count
+            pending.difference_update(next_frontier)
+            frontier = next_frontier
+        return depths, predecessors, route_counts
+    
+    def _level_expander(self, engine: str):
+        """expand_levels_numpy when the NumPy engine is requested and installed, otherwise expand_levels"""
+        return self.expand_levels_numpy if engine == "numpy" and numpy_available() else self.expand_levels
+    
+    def _numpy_tables(self, exclude_mask: int = 0):
+        """Dense NumPy child matrix and parent->child multiplicity matrix (cached per set of exclusions)"""
+        import numpy as np
+        
+        cached = self._numpy_cache.get(exclude_mask)
+        if cached is not None:
+            return cached
+        pal_count = len(self.pal_names)
+        if exclude_mask:
+            child = self._numpy_tables(0)[0].copy()
+            excluded = np.array([(exclude_mask >> pal_id) & 1 for pal_id in range(pal_count)], dtype=bool)
+            child[:, excluded] = -1
+            child[excluded, :] = -1
+            child[np.isin(child, np.flatnonzero(excluded))] = -1
+        else:
+            child = np.array(self.child_matrix, dtype=np.int16 if pal_count < 2 ** 15 else np.int32).reshape(pal_count, pal_count)
+            # Same-species pairs are not edges of the breeding graph
+            np.fill_diagonal(child, -1)
+        
+        # multiplicity[u, v] = number of partners that breed u into v
+        multiplicity = np.zeros((pal_count, pal_count), dtype=np.uint16 if pal_count < 2 ** 16 else np.uint32)
+        rows, partners = np.nonzero(child >= 0)
+        np.add.at(multiplicity, (rows, child[rows, partners]), 1)
+        
+        tables = (child, multiplicity)
+        self._numpy_cache[exclude_mask] = tables
+        return tables
+    
+    def expand_levels_numpy(self, start_id: int, exclude_mask: int = 0, stop_ids: Optional[Set[int]] = None,
+                            radius: Optional[int] = None) -> Tuple[List[float], List[List[Tuple[int, int]]], List[int]]:
+        """Vectorized expand_levels: each level is a vector over Pal IDs advanced by one matrix product.
+        
+        Returns the same depths, predecessor DAG and route counts as expand_levels. Route counts switch
+        from int64 to Python integers if a level could overflow.
+        """
+        import numpy as np
+        
+        child, multiplicity = self._numpy_tables(exclude_mask)
+        pal_count = len(self.pal_names)
+        depths = np.full(pal_count, -1, dtype=np.int64)
+        counts = np.zeros(pal_count, dtype=np.int64)
+        visited = np.zeros(pal_count, dtype=bool)
+        depths[start_id] = 0
+        counts[start_id] = 1
+        visited[start_id] = True
+        predecessors: List[List[Tuple[int, int]]] = [[] for _ in range(pal_count)]
+        # Largest frontier count that cannot overflow int64 when multiplied into any column
+        count_limit = np.iinfo(np.int64).max // max(1, int(multiplicity.sum(axis=0, dtype=np.int64).max()))
+        
+        pending = set(stop_ids or ()) - {start_id}
+        frontier_ids = np.array([start_id])
+        depth = 0
+        while frontier_ids.size and (radius is None or depth < radius) and (stop_ids is None or pending):
+            depth += 1
+            # The dense product scans the whole row of every frontier Pal
+            self._record_stats(frontier_ids.size, frontier_ids.size * pal_count, frontier_ids.size)
+            if self.progress:
+                for pal_id in frontier_ids.tolist():
+                    self.report_progress(depth - 1, pal_id, 0)
+            frontier_counts = counts[frontier_ids]
+            if counts.dtype != object and frontier_counts.max() > count_limit:
+                counts = counts.astype(object)
+                frontier_counts = frontier_counts.astype(object)
+            level_counts = frontier_counts @ multiplicity[frontier_ids].astype(counts.dtype)
+            new = (level_counts != 0) & ~visited
+            new_ids = np.flatnonzero(new)
+            counts[new_ids] = level_counts[new_ids]
+            depths[new_ids] = depth
+            visited[new_ids] = True
+            
+            # Predecessor DAG: every (frontier Pal, partner) pair whose child was settled at this level
+            rows = child[frontier_ids]
+            hits = rows >= 0
+            hits[hits] = new[rows[hits]]
+            row_index, partner_ids = np.nonzero(hits)
+            for pal_id, partner_id, child_id in zip(frontier_ids[row_index].tolist(), partner_ids.tolist(),
+                                                    rows[row_index, partner_ids].tolist()):
+                predecessors[child_id].append((pal_id, partner_id))
+            
+            pending.difference_update(new_ids.tolist())
+            frontier_ids = new_ids
+        
+        return ([depth if depth >= 0 else float('inf') for depth in depths.tolist()], predecessors,
+                [int(count) for count in counts.tolist()])
+    
+    def _iter_dag_paths(self, start_id: int, target_id: int, predecessors: List[List[Tuple[int, int]]],
+                        deadline: Optional[float] = None):
+        """Lazily yield shortest paths to the target by walking the predecessor DAG backwards"""
+        # Stack of (pal_id, steps from this Pal to the target, reversed)
+        stack = [(target_id, [])]
+        while stack:
+            if self.cancelled:
+                return
+            if deadline is not None and time.time() > deadline:
+                self.search_stats["time_limited"] = True
+                return
+            pal_id, steps = stack.pop()
+            if pal_id == start_id:
+                yield self._steps_to_path(start_id, steps[::-1])
+                continue
+            # Reversed so the first predecessor is explored first
+            for parent_id, partner_id in reversed(predecessors[pal_id]):
+                stack.append((parent_id, steps + [(partner_id, pal_id)]))
+    
+    def find_paths_to_targets(self, start_parent: str, targets: List[str], max_paths: int = 20,
+                              max_seconds: Optional[float] = None, exclude: Optional[List[str]] = None,
+                              max_steps: Optional[int] = None, engine: str = "auto") -> Dict[str, List[List[str]]]:
+        """Shortest paths from one start Pal to several targets, sharing a single BFS across all of them"""
+        self.reset_stats()
+        start = self.normalize_pal_name(start_parent)
+        if start not in self.pal_ids:
+            if not self.json_mode:
+                print(f"❌ Unknown parent Pal: {start_parent}")
+            return {}
+        start_id = self.pal_ids[start]
+        exclude_mask, unknown_excluded = self.pal_mask(exclude or [])
+        if unknown_excluded:
+            if not self.json_mode:
+                print(f"❌ Unknown excluded Pals: {', '.join(unknown_excluded)}")
+            return {}
+        target_ids = {}
+        for name in targets:
+            target = self.normalize_pal_name(name)
+            if target in self.pal_ids:
+                target_ids[target] = self.pal_ids[target]
+            elif not self.json_mode:
+                print(f"❌ Unknown target Pal: {name}")
+        
+        # Only wait for targets the condensation says are reachable at all
+        stop_ids = {target_id for target_id in target_ids.values() if self.can_reach(start_id, target_id)}
+        depths, predecessors, _ = self._level_expander(engine)(start_id, exclude_mask, stop_ids, max_steps)
+        
+        deadline = time.time() + max_seconds if max_seconds is not None else None
+        results = {}
+        for target, target_id in target_ids.items():
+            paths = []
+            if target_id == start_id:
+                paths = [[start]]
+            elif depths[target_id] < float('inf'):
+                paths = self._collect_paths(self._iter_dag_paths(start_id, target_id, predecessors, deadline), max_paths)
+            results[target] = paths
+        return results
+    
+    def format_multi_target_paths(self, start_parent: str, targets: List[str], max_paths: int = 20,
+                                  max_seconds: Optional[float] = None, exclude: Optional[List[str]] = None,
+                                  max_steps: Optional[int] = None, engine: str = "auto") -> dict:
+        """Return per-target breeding paths from one start Pal in the expandable UI format; unknown targets get
+        an entry of their own with suggestions"""
+        if self.normalize_pal_name(start_parent) not in self.pal_ids:
+            return {
+                "success": False,
+                "message": f"Unknown parent Pal: {start_parent}",
+                "suggestions": {"start": self.get_similar_pal_names(start_parent)}
+            }
+        error = self.unknown_pal_names(exclude)
+        if error:
+            return error
+        results = self.find_paths_to_targets(start_parent, targets, max_paths, max_seconds, exclude, max_steps, engine)
+        formatted = {}
+        for target, paths in results.items():
+            if not paths:
+                formatted[target] = {
+                    "success": False,
+                    "message": f"No breeding path found from {start_parent} to {target}"
+                }
+                continue
+            structured_paths = [self.structure_path(i, path, target) for i, path in enumerate(paths)]
+            formatted[target] = {
+                "success": True,
+                "target_child": target,
+                "total_paths": len(paths),
+                "min_steps": len(paths[0]) - 1,
+                "paths": self.group_paths_with_prefixes(structured_paths)
+            }
+        for name in targets:
+            if self.normalize_pal_name(name) not in self.pal_ids:
+                formatted[name] = {
+                    "success": False,
+                    "message": f"Unknown target Pal: {name}",
+                    "suggestions": {"target": self.get_similar_pal_names(name)}
+                }
+        return {
+            "success": any(result["success"] for result in formatted.values()),
+            "start_parent": self.normalize_pal_name(start_parent),
+            "targets": formatted
+        }
+    
+    def find_neighbourhood(self, start_parent: str, radius: int, exclude: Optional[List[str]] = None,
+                           engine: str = "auto") -> dict:
+        """Every Pal reachable within radius breedings, with its minimal depth and number of shortest routes"""
+        self.reset_stats()
+        start = self.normalize_pal_name(start_parent)
+        if start not in self.pal_ids:
+            return {
+                "success": False,
+                "message": f"Unknown parent Pal: {start_parent}",
+                "suggestions": {"start": self.get_similar_pal_names(start_parent)}
+            }
+        error = self.unknown_pal_names(exclude)
+        if error:
+            return error
+        exclude_mask, _ = self.pal_mask(exclude or [])
+        depths, _, route_counts = self._level_expander(engine)(self.pal_ids[start], exclude_mask, radius=radius)
+        reachable = sorted((depth, name, route_counts[pal_id]) for pal_id, (name, depth) in enumerate(zip(self.pal_names, depths))
+                           if 0 < depth <= radius)
+        return {
+            "success": True,
+            "start_parent": start,
+            "radius": radius,
+            "total_pals": len(reachable),
+            "pals": [{"pal": name, "depth": depth, "routes": routes} for depth, name, routes in reachable]
+        }
+    
+    def solve_breeding_costs(self, inventory_mask: int, exclude_mask: int = 0) -> Tuple[List[float], List[Optional[Tuple[int, int]]]]:
+        """Minimal breedings needed to obtain every Pal from an inventory, over the AND-OR breeding graph.
+        
+        A Pal costs 0 when owned, otherwise 1 plus the cost of both parents of its cheapest pair (a single
+        parent for same-species pairs). Returns the costs and the chosen parent pair per Pal; results are
+        memoized per inventory and exclusions.
+        """
+        key = (inventory_mask, exclude_mask)
+        cached = self._plan_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        pal_count = len(self.pal_names)
+        costs = [float('inf')] * pal_count
+        best_pairs: List[Optional[Tuple[int, int]]] = [None] * pal_count
+        heap = []
+        for pal_id in range(pal_count):
+            if (inventory_mask >> pal_id) & 1:
+                costs[pal_id] = 0
+                heap.append((0, pal_id))
+        self._relax_breeding_costs(costs, best_pairs, heap, inventory_mask, exclude_mask)
+        
+        self._plan_cache[key] = (costs, best_pairs)
+        return costs, best_pairs
+    
+    def _relax_breeding_costs(self, costs: List[float], best_pairs: List[Optional[Tuple[int, int]]], heap: list,
+                              inventory_mask: int, exclude_mask: int):
+        """Best-first propagation of breeding costs from the Pals on the heap (also handles cost decreases)"""
+        heapq.heapify(heap)
+        child_matrix = self.child_matrix
+        # Pals with a known cost, i.e. the ones that can serve as the other parent
+        available: List[int] = [pal_id for pal_id, cost in enumerate(costs) if cost < float('inf')]
+        available_set = set(available)
+        while heap:
+            cost, pal_id = heapq.heappop(heap)
+            if cost > costs[pal_id]:
+                continue  # Stale entry
+            if pal_id not in available_set:
+                available_set.add(pal_id)
+                available.append(pal_id)
+            row = child_matrix[pal_id]
+            for partner_id in available:
+                child_id = row[partner_id]
+                if child_id < 0 or costs[child_id] == 0:
+                    continue
+                if (exclude_mask >> child_id) & 1 and not (inventory_mask >> child_id) & 1:
+                    continue
+                candidate = 1 + cost + (costs[partner_id] if partner_id != pal_id else 0)
+                if candidate < costs[child_id]:
+                    costs[child_id] = candidate
+                    best_pairs[child_id] = (pal_id, partner_id)
+                    heapq.heappush(heap, (candidate, child_id))
+    
+    def _schedule_breedings(self, target_id: int, best_pairs: List[Optional[Tuple[int, int]]], obtained: Set[int],
+                            schedule: List[Tuple[int, int, int]]):
+        """Append the breedings needed for the target (parents first), reusing anything already obtained"""
+        stack = [(target_id, False)]
+        while stack:
+            pal_id, parents_done = stack.pop()
+            if pal_id in obtained:
+                continue
+            parent1_id, parent2_id = best_pairs[pal_id]
+            if parents_done:
+                obtained.add(pal_id)
+                schedule.append((parent1_id, parent2_id, pal_id))
+            else:
+                stack.append((pal_id, True))
+                stack.append((parent2_id, False))
+                stack.append((parent1_id, False))
+    
+    def _format_schedule(self, schedule: List[Tuple[int, int, int]], target_ids: Set[int]) -> List[dict]:
+        """Convert (parent1, parent2, child) breedings into the step format used in JSON output"""
+        pal_names = self.pal_names
+        return [
+            {
+                "type": "breed",
+                "parents": f"{pal_names[parent1_id]} + {pal_names[parent2_id]}",
+                "parent1": pal_names[parent1_id],
+                "parent2": pal_names[parent2_id],
+                "result": pal_names[child_id],
+                "step_number": i,
+                "is_final": child_id in target_ids
+            }
+            for i, (parent1_id, parent2_id, child_id) in enumerate(schedule, 1)
+        ]
+    
+    def plan_breeding(self, target_child: str, inventory: List[str], exclude: Optional[List[str]] = None) -> dict:
+        """Plan every breeding (including breeding missing partners) needed to obtain the target from an inventory"""
+        target = self.normalize_pal_name(target_child)
+        inventory_mask, unknown_owned = self.pal_mask(inventory)
+        exclude_mask, _ = self.pal_mask(exclude or [])
+        if target not in self.pal_ids:
+            return {
+                "success": False,
+                "message": f"Unknown target Pal: {target_child}",
+                "suggestions": {"target": self.get_similar_pal_names(target_child)}
+            }
+        error = self.unknown_pal_names(exclude)
+        if error:
+            return error
+        
+        target_id = self.pal_ids[target]
+        costs, best_pairs = self.solve_breeding_costs(inventory_mask, exclude_mask)
+        result = {
+            "target_child": target,
+            "inventory": self.mask_to_names(inventory_mask)
+        }
+        if unknown_owned:
+            result["unknown_inventory"] = unknown_owned
+        if costs[target_id] == float('inf'):
+            result.update({
+                "success": False,
+                "message": f"{target} cannot be bred from the given inventory"
+            })
+            return result
+        
+        schedule: List[Tuple[int, int, int]] = []
+        self._schedule_breedings(target_id, best_pairs, {i for i in range(len(costs)) if costs[i] == 0}, schedule)
+        result.update({
+            "success": True,
+            "total_breedings": len(schedule),
+            # Tree cost counts a shared sub-plan once per use; the schedule breeds it only once
+            "tree_cost": costs[target_id],
+            "steps": self._format_schedule(schedule, {target_id})
+        })
+        return result
+    
+    def plan_collection(self, targets: List[str], inventory: List[str], exclude: Optional[List[str]] = None) -> dict:
+        """Plan one combined breeding schedule for a set of targets, reusing intermediates across targets.
+        
+        A shortest-path Steiner heuristic: repeatedly plan the target that is currently cheapest to reach,
+        then treat everything that plan breeds as owned and propagate the cost decreases incrementally,
+        so later targets are planned against the grown inventory.
+        """
+        error = self.unknown_pal_names(exclude)
+        if error:
+            return error
+        inventory_mask, unknown_owned = self.pal_mask(inventory)
+        exclude_mask, _ = self.pal_mask(exclude or [])
+        target_mask, unknown_targets = self.pal_mask(targets)
+        target_ids = [i for i in range(len(self.pal_names)) if (target_mask >> i) & 1]
+        
+        base_costs, base_pairs = self.solve_breeding_costs(inventory_mask, exclude_mask)
+        # Copies, since the memoized solution must stay untouched
+        costs = list(base_costs)
+        best_pairs = list(base_pairs)
+        obtained = {pal_id for pal_id, cost in enumerate(costs) if cost == 0}
+        
+        # Cost of planning every target on its own, for comparison
+        independent = 0
+        for target_id in target_ids:
+            if base_costs[target_id] < float('inf'):
+                independent_schedule: List[Tuple[int, int, int]] = []
+                self._schedule_breedings(target_id, base_pairs, set(obtained), independent_schedule)
+                independent += len(independent_schedule)
+        
+        schedule: List[Tuple[int, int, int]] = []
+        order = []
+        remaining = set(target_ids)
+        owned_mask = inventory_mask
+        while remaining:
+            target_id = min(remaining, key=lambda pal_id: (costs[pal_id], self.pal_names[pal_id]))
+            if costs[target_id] == float('inf'):
+                break
+            remaining.discard(target_id)
+            order.append(self.pal_names[target_id])
+            
+            first_new = len(schedule)
+            self._schedule_breedings(target_id, best_pairs, obtained, schedule)
+            
+            # Everything just bred is now owned: re-optimize the rest of the plan around it
+            heap = []
+            for _, _, child_id in schedule[first_new:]:
+                costs[child_id] = 0
+                owned_mask |= 1 << child_id
+                heap.append((0, child_id))
+            self._relax_breeding_costs(costs, best_pairs, heap, owned_mask, exclude_mask)
+        
+        result = {
+            "success": not remaining and not unknown_targets,
+            "targets": self.mask_to_names(target_mask),
+            "inventory": self.mask_to_names(inventory_mask),
+            "order": order,
+            "total_breedings": len(schedule),
+            "independent_breedings": independent,
+            "steps": self._format_schedule(schedule, set(target_ids))
+        }
+        if remaining:
+            result["unreachable"] = sorted(self.pal_names[pal_id] for pal_id in remaining)
+        if unknown_targets:
+            result["unknown_targets"] = unknown_targets
+        if unknown_owned:
+            result["unknown_inventory"] = unknown_owned
+        return result
+    
+    def breedable_from(self, inventory: List[str]) -> dict:
+        """Every child obtainable in one breeding from any pair of owned Pals.
+        
+        "matrix" holds, for each pair of inventory Pals (in "inventory" order), an index into "children" or -1.
+        """
+        inventory_mask, unknown_owned = self.pal_mask(inventory)
+        owned_ids = [i for i in range(len(self.pal_names)) if (inventory_mask >> i) & 1]
+        
+        block = [[row[j] for j in owned_ids] for row in (self.child_matrix[i] for i in owned_ids)]
+        # The child matrix is symmetric, so each unordered pair is read once from the upper triangle
+        pair_list = [(owned_ids[i], owned_ids[j], block[i][j]) for i in range(len(owned_ids))
+                     for j in range(i, len(owned_ids)) if block[i][j] >= 0]
+        child_ids = sorted({child_id for _, _, child_id in pair_list})
+        
+        child_index = {child_id: index for index, child_id in enumerate(child_ids)}
+        pairs: List[List[List[str]]] = [[] for _ in child_ids]
+        for parent1_id, parent2_id, child_id in pair_list:
+            pairs[child_index[child_id]].append([self.pal_names[parent1_id], self.pal_names[parent2_id]])
+        
+        result = {
+            "success": bool(child_ids),
+            "inventory": self.mask_to_names(inventory_mask),
+            "total_children": len(child_ids),
+            "new_children": sum(1 for child_id in child_ids if not (inventory_mask >> child_id) & 1),
+            "children": [{
+                "child": self.pal_names[child_id],
+                "owned": bool((inventory_mask >> child_id) & 1),
+                "pairs": pairs[index]
+            } for index, child_id in enumerate(child_ids)],
+            "matrix": [[child_index[child_id] if child_id >= 0 else -1 for child_id in row] for row in block]
+        }
+        if unknown_owned:
+            result["unknown_inventory"] = unknown_owned
+        return result
+    
+    def find_parent_pairs(self, target_child: str, inventory: Optional[List[str]] = None, owned_parents: str = "one",
+                          offset: int = 0, limit: Optional[int] = None) -> dict:
+        """All parent pairs that breed the child, served from parents_by_child.
+        
+        With an inventory, only pairs with at least one ("one") or two ("both") owned parents are kept, and
+        pairs with more owned parents rank first; ties are alphabetical. offset/limit page through the
+        ranked pairs (both must be 0 or more). Work is proportional to the owned parents of this child, not to
+        the dataset.
+        """
+        if offset < 0 or limit is not None and limit < 0:
+            raise ValueError(f"offset and limit must be 0 or more, got {offset} and {limit}")
+        child = self.normalize_pal_name(target_child)
+        if child not in self.pal_ids:
+            return {
+                "success": False,
+                "message": f"Unknown target Pal: {target_child}",
+                "suggestions": {"target": self.get_similar_pal_names(target_child)}
+            }
+        
+        parents = self.parents_by_child[self.pal_ids[child]]
+        inventory_mask, unknown_owned = self.pal_mask(inventory or [])
+        pairs = []
+        if inventory is None:
+            for pal_id, partner_ids in parents.items():
+                pairs.extend((0, pal_id, partner_id) for partner_id in partner_ids if pal_id <= partner_id)
+        else:
+            owned_ids = set()
+            remaining = inventory_mask
+            while remaining:
+                lowest = remaining & -remaining
+                owned_ids.add(lowest.bit_length() - 1)
+                remaining ^= lowest
+            for pal_id in parents.keys() & owned_ids:
+                for partner_id in parents[pal_id]:
+                    partner_owned = (inventory_mask >> partner_id) & 1
+                    if owned_parents == "both" and not partner_owned:
+                        continue
+                    # A pair of two owned Pals is reached from both sides; keep it once
+                    if partner_owned and partner_id < pal_id:
+                        continue
+                    pairs.append((1 + partner_owned, min(pal_id, partner_id), max(pal_id, partner_id)))
+        
+        pal_names = self.pal_names
+        pairs.sort(key=lambda pair: (-pair[0], pal_names[pair[1]], pal_names[pair[2]]))
+        page = pairs[offset:offset + limit] if limit is not None else pairs[offset:]
+        result = {
+            "success": bool(pairs),
+            "target_child": child,
+            "total_pairs": len(pairs),
+            "offset": offset,
+            "limit": limit,
+            "has_more": offset + len(page) < len(pairs),
+            "pairs": [{
+                "parent1": pal_names[pal_id],
+                "parent2": pal_names[partner_id],
+                "owned_parents": owned
+            } for owned, pal_id, partner_id in page]
+        }
+        if inventory is not None:
+            result["inventory"] = self.mask_to_names(inventory_mask)
+        if unknown_owned:
+            result["unknown_inventory"] = unknown_owned
+        return result
+    
+    def _steps_to_path(self, start_id: int, steps: List[Tuple[int, int]]) -> List[str]:
+        """Render (partner_id, child_id) steps from a start Pal as the path format used throughout this module"""
+        pal_names = self.pal_names
+        path = [pal_names[start_id]]
+        current_id = start_id
+        for partner_id, child_id in steps:
+            path.append(f"{pal_names[current_id]} + {pal_names[partner_id]} = {pal_names[child_id]}")
+            current_id = child_id
+        return path
+    
+    def _beam_level_limit(self, sample_entry: tuple, beam_width: Optional[int], max_frontier_mb: Optional[float]) -> int:
+        """Number of frontier entries a beam level may keep, from the beam width and the memory ceiling"""
+        limit = beam_width if beam_width is not None else sys.maxsize
+        if max_frontier_mb is not None:
+            # The current level, the level being built (up to twice the limit) and their paths must fit in the ceiling
+            current_id, path, path_mask, seen_required = sample_entry
+            entry_bytes = (sys.getsizeof(sample_entry) + sys.getsizeof(path) + sys.getsizeof(path_mask)
+                           + sys.getsizeof(seen_required) + sum(sys.getsizeof(step) for step in path))
+            limit = min(limit, int(max_frontier_mb * 1024 * 1024) // (3 * entry_bytes))
+        return max(limit, 1)
+    
+    def _trim_frontier(self, frontier: list, distances: List[float], limit: int) -> int:
+        """Keep the limit entries closest to the target (stable, so ties keep BFS order); returns how many were dropped"""
+        if len(frontier) <= limit:
+            return 0
+        frontier.sort(key=lambda entry: distances[entry[0]])
+        dropped = len(frontier) - limit
+        del frontier[limit:]
+        return dropped
+    
     def group_paths_by_common_prefix(self, paths: List[List[str]]) -> dict:
         """Group paths by common prefixes to create an expandable tree structure"""
         if not paths:
@@ -216,59 +1977,51 @@ class BreedingPathFinder:
         
         return build_tree(paths)
     
-    def format_expandable_paths(self, start_parent: str, target_child: str, max_paths: int = 20, max_seconds: Optional[float] = None) -> dict:
-        """Return breeding paths in an expandable format suitable for UI"""
-        paths = self.find_shortest_paths(start_parent, target_child, max_paths, max_seconds)
+    def format_expandable_paths(self, start_parent: str, target_child: str, max_paths: int = 20, max_seconds: Optional[float] = None,
+                                pareto_costs: Optional[dict] = None, **search_options) -> dict:
+        """Return breeding paths in an expandable format suitable for UI (search_options are passed to find_shortest_paths).
+        
+        When pareto_costs (see load_cost_vectors) is given, the Pareto front over steps and those costs is added
+        as "pareto_front".
+        """
+        error = self.unknown_pal_names(**search_options)
+        if error:
+            return error
+        paths = self.find_shortest_paths(start_parent, target_child, max_paths, max_seconds, **search_options)
+        constraints = self.describe_constraints(**search_options)
         
         if not paths:
-            return {
+            if self.last_search_info.get("unreachable"):
+                message = f"No breeding path exists from {start_parent} to {target_child}"
+            elif self.last_search_info.get("time_limited"):
+                message = f"Search timed out after {max_seconds:g} s before finding a path from {start_parent} to {target_child}"
+            elif constraints:
+                message = f"No breeding path found from {start_parent} to {target_child} satisfying the given constraints"
+            else:
+                message = f"No breeding path found from {start_parent} to {target_child}"
+            result = {
                 "success": False,
-                "message": f"No breeding path found from {start_parent} to {target_child}",
+                "message": message,
                 "suggestions": {
                     "start": self.get_similar_pal_names(start_parent),
                     "target": self.get_similar_pal_names(target_child)
                 }
             }
+            if constraints:
+                result["constraints"] = constraints
+            if self.last_search_info:
+                result["search"] = self.last_search_info
+            return result
         
         # Convert paths to a more structured format
-        structured_paths = []
-        
-        for i, path in enumerate(paths):
-            structured_path = {
-                "id": i,
-                "steps": [],
-                "total_steps": len(path) - 1
-            }
-            
-            for j, step in enumerate(path):
-                if j == 0:
-                    # Starting Pal
-                    structured_path["steps"].append({
-                        "type": "start",
-                        "pal": step,
-                        "step_number": 0
-                    })
-                else:
-                    # Breeding step
-                    if " + " in step and " = " in step:
-                        parts = step.split(" = ")
-                        if len(parts) == 2:
-                            breeding_pair = parts[0]
-                            result = parts[1]
-                            structured_path["steps"].append({
-                                "type": "breed",
-                                "parents": breeding_pair,
-                                "result": result,
-                                "step_number": j,
-                                "is_final": (result == target_child)
-                            })
-            
-            structured_paths.append(structured_path)
+        grouping_started = time.perf_counter()
+        structured_paths = [self.structure_path(i, path, target_child) for i, path in enumerate(paths)]
         
         # Group by common prefixes for expandable display
         grouped = self.group_paths_with_prefixes(structured_paths)
+        self.phase_timings["grouping"] = time.perf_counter() - grouping_started
         
-        return {
+        result = {
             "success": True,
             "start_parent": start_parent,
             "target_child": target_child,
@@ -276,6 +2029,82 @@ class BreedingPathFinder:
             "min_steps": len(paths[0]) - 1 if paths else 0,
             "paths": grouped
         }
+        if constraints:
+            result["constraints"] = constraints
+        if self.last_search_info:
+            result["search"] = self.last_search_info
+        if pareto_costs is not None:
+            result["pareto_front"] = [
+                {
+                    "objectives": objectives,
+                    "path": self.structure_path(i, path, target_child)
+                }
+                for i, (objectives, path) in enumerate(
+                    self.find_pareto_paths(start_parent, target_child, pareto_costs, max_seconds=max_seconds, **search_options))
+            ]
+        return result
+    
+    def structure_path(self, path_id: int, path: List[str], target_child: str) -> dict:
+        """Convert a path of "A + B = C" steps into the structured step format used by the UI"""
+        structured_path = {
+            "id": path_id,
+            "steps": [],
+            "total_steps": len(path) - 1
+        }
+        
+        for j, step in enumerate(path):
+            if j == 0:
+                # Starting Pal
+                structured_path["steps"].append({
+                    "type": "start",
+                    "pal": step,
+                    "step_number": 0
+                })
+            else:
+                # Breeding step
+                if " + " in step and " = " in step:
+                    parts = step.split(" = ")
+                    if len(parts) == 2:
+                        breeding_pair = parts[0]
+                        result = parts[1]
+                        structured_path["steps"].append({
+                            "type": "breed",
+                            "parents": breeding_pair,
+                            "result": result,
+                            "step_number": j,
+                            "is_final": (result == target_child)
+                        })
+        
+        return structured_path
+    
+    def describe_stats(self, load_seconds: float, query_seconds: float, serialization_seconds: float) -> dict:
+        """The --stats object: wall time per phase plus the engine, workers and counters of the most recent search"""
+        grouping = self.phase_timings.get("grouping", 0.0)
+        stats = {
+            "timings_ms": {
+                "load": round(load_seconds * 1000, 3),
+                "search": round((query_seconds - grouping) * 1000, 3),
+                "grouping": round(grouping * 1000, 3),
+                "serialization": round(serialization_seconds * 1000, 3)
+            },
+            "search": dict(self.search_stats)
+        }
+        for key in ("engine", "workers"):
+            if key in self.last_search_info:
+                stats[key] = self.last_search_info[key]
+        return stats
+    
+    def describe_constraints(self, exclude: Optional[List[str]] = None, require: Optional[List[str]] = None,
+                             max_steps: Optional[int] = None, **_other_options) -> dict:
+        """Summarize the active search constraints for JSON output (empty when unconstrained)"""
+        constraints = {}
+        if exclude:
+            constraints["exclude"] = [self.normalize_pal_name(name) for name in exclude]
+        if require:
+            constraints["require"] = [self.normalize_pal_name(name) for name in require]
+        if max_steps is not None:
+            constraints["max_steps"] = max_steps
+        return constraints
     
     def group_paths_with_prefixes(self, structured_paths: List[dict]) -> List[dict]:
         """Recursively group paths by all common prefixes (infinite nesting), prioritizing early differences."""
@@ -466,18 +2295,101 @@ class BreedingPathFinder:
             if suggestions2:
                 print(f"   Did you mean one of these for '{parent2}': {', '.join(suggestions2[:3])}")
     
-    def print_shortest_paths(self, start_parent: str, target_child: str):
+    def print_breeding_plan(self, target_child: str, inventory: List[str], exclude: Optional[List[str]] = None):
+        """Print the breeding plan for a target from an inventory"""
+        plan = self.plan_breeding(target_child, inventory, exclude)
+        if not plan["success"]:
+            print(plan["message"])
+            return
+        print(f"Breeding plan for {plan['target_child']}: {plan['total_breedings']} breeding(s)")
+        for step in plan["steps"]:
+            print(f"  {step['step_number']}. {step['parents']} = {step['result']}")
+    
+    def print_collection_plan(self, targets: List[str], inventory: List[str], exclude: Optional[List[str]] = None):
+        """Print the combined breeding schedule for a set of targets"""
+        plan = self.plan_collection(targets, inventory, exclude)
+        if "message" in plan:
+            print(plan["message"])
+            return
+        print(f"Collection plan: {plan['total_breedings']} breeding(s) "
+              f"({plan['independent_breedings']} if each target were planned separately)")
+        for step in plan["steps"]:
+            marker = " *" if step["is_final"] else ""
+            print(f"  {step['step_number']}. {step['parents']} = {step['result']}{marker}")
+        if plan.get("unreachable"):
+            print(f"Cannot be bred from this inventory: {', '.join(plan['unreachable'])}")
+    
+    def print_parent_pairs(self, target_child: str, inventory: Optional[List[str]] = None, owned_parents: str = "one",
+                           offset: int = 0, limit: Optional[int] = None):
+        """Print the parent pairs that breed a child"""
+        result = self.find_parent_pairs(target_child, inventory, owned_parents, offset, limit)
+        if not result["success"]:
+            print(result.get("message", f"No parent pairs found for {target_child}"))
+            return
+        shown = len(result["pairs"])
+        print(f"{result['total_pairs']} parent pair(s) for {result['target_child']}"
+              f" (showing {offset + 1}-{offset + shown}):" if shown else
+              f"{result['total_pairs']} parent pair(s) for {result['target_child']} (none at offset {offset})")
+        for pair in result["pairs"]:
+            print(f"  {pair['parent1']} + {pair['parent2']}")
+    
+    def print_breedable(self, inventory: List[str]):
+        """Print every child that can be bred right now from the owned Pals"""
+        result = self.breedable_from(inventory)
+        print(f"{result['total_children']} Pal(s) breedable from {len(result['inventory'])} owned "
+              f"({result['new_children']} not owned yet):")
+        for entry in result["children"]:
+            marker = "" if entry["owned"] else " *"
+            print(f"  {entry['child']}{marker} ({len(entry['pairs'])} pair(s))")
+        if result.get("unknown_inventory"):
+            print(f"Unknown Pals ignored: {', '.join(result['unknown_inventory'])}")
+    
+    def print_multi_target_paths(self, start_parent: str, targets: List[str], max_paths: int = 20,
+                                 max_seconds: Optional[float] = None, exclude: Optional[List[str]] = None,
+                                 max_steps: Optional[int] = None, engine: str = "auto"):
+        """Print the shortest breeding paths from one parent to each of several targets"""
+        results = self.find_paths_to_targets(start_parent, targets, max_paths, max_seconds, exclude, max_steps, engine)
+        for target, paths in results.items():
+            if not paths:
+                print(f"No breeding path found from {start_parent} to {target}")
+                continue
+            print(f"{target}: {len(paths)} path(s) of {len(paths[0]) - 1} breeding steps")
+            for path in paths:
+                print("  " + " -> ".join(path[1:]) if len(path) > 1 else f"  {path[0]}")
+    
+    def print_neighbourhood(self, start_parent: str, radius: int, exclude: Optional[List[str]] = None,
+                            engine: str = "auto"):
+        """Print every Pal reachable within radius breedings of the start Pal"""
+        result = self.find_neighbourhood(start_parent, radius, exclude, engine)
+        if not result["success"]:
+            print(result["message"])
+            return
+        print(f"{result['total_pals']} Pal(s) within {radius} breeding(s) of {result['start_parent']}:")
+        for entry in result["pals"]:
+            print(f"  {entry['depth']}  {entry['pal']} ({entry['routes']} route(s))")
+    
+    def print_shortest_paths(self, start_parent: str, target_child: str, max_paths: int = 20,
+                             max_seconds: Optional[float] = None, pareto_costs: Optional[dict] = None,
+                             **search_options):
         """Print the shortest breeding paths from parent to child"""
         # Use JSON format if in JSON mode, otherwise use simple text output
         if self.json_mode:
             import json
-            result = self.format_expandable_paths(start_parent, target_child)
+            result = self.format_expandable_paths(start_parent, target_child, max_paths, max_seconds,
+                                                  pareto_costs=pareto_costs, **search_options)
             print(json.dumps(result, indent=2))
         else:
-            paths = self.find_shortest_paths(start_parent, target_child)
+            error = self.unknown_pal_names(**search_options)
+            if error:
+                print(f"❌ {error['message']}")
+                return
+            paths = self.find_shortest_paths(start_parent, target_child, max_paths, max_seconds, **search_options)
             
             if not paths:
-                print(f"No breeding path found from {start_parent} to {target_child}")
+                if self.last_search_info.get("time_limited"):
+                    print(f"⏱️  Search timed out after {max_seconds:g} s before finding a path from {start_parent} to {target_child}")
+                else:
+                    print(f"No breeding path found from {start_parent} to {target_child}")
                 return
             
             print(f"Found {len(paths)} shortest breeding path(s) from {start_parent} to {target_child}:")
@@ -488,6 +2400,15 @@ class BreedingPathFinder:
                 print(f"  Start: {path[0]}")
                 for step in path[1:]:
                     print(f"  Step: {step}")
+            
+            if pareto_costs is not None:
+                front = self.find_pareto_paths(start_parent, target_child, pareto_costs, max_seconds=max_seconds,
+                                               **search_options)
+                print(f"\nPareto-optimal paths ({len(front)}):")
+                for objectives, path in front:
+                    print("  " + ", ".join(f"{name}={value:g}" for name, value in objectives.items()))
+                    for step in path[1:]:
+                        print(f"    Step: {step}")
     
     def get_similar_pal_names(self, name: str, max_suggestions: int = 5) -> List[str]:
         """Get Pal names that are similar to the given name (simple string matching)"""
@@ -501,6 +2422,72 @@ class BreedingPathFinder:
         return suggestions[:max_suggestions]
 
 
+def parse_pal_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated list of Pal names from the command line"""
+    if not value:
+        return []
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def dataset_hash(csv_file: str) -> str:
+    """Short SHA-256 of a breeding CSV, so results from different data are never compared silently"""
+    import hashlib
+    with open(csv_file, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def append_json_member(document: str, key: str, value, indent: Optional[int] = None) -> str:
+    """Add a member to the end of a serialized (non-empty) JSON object, laid out as json.dumps with the same
+    indent would"""
+    import json
+    if indent is None:
+        return f"{document[:-1]}, {json.dumps(key)}: {json.dumps(value)}}}"
+    padding = " " * indent
+    member = json.dumps(value, indent=indent).replace("\n", "\n" + padding)
+    return f"{document[:-2]},\n{padding}{json.dumps(key)}: {member}\n}}"
+
+
+def result_digest(result: dict) -> str:
+    """Short SHA-256 of a JSON result without its "stats", so reruns of a query can be compared"""
+    import hashlib
+    import json
+    content = {key: value for key, value in result.items() if key != "stats"}
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def loggable_argv(argv: List[str], paths: Optional[Dict[str, str]] = None) -> List[str]:
+    """The command line without UNLOGGED_OPTIONS, i.e. just what decides the result, with the value of each
+    option in paths replaced by the given (absolute) path so the query replays from any directory"""
+    paths = paths or {}
+    kept = []
+    skip_value = False
+    for i, token in enumerate(argv):
+        if skip_value:
+            skip_value = False
+            continue
+        option = token.split('=', 1)[0]
+        if option in paths:
+            kept.append(f"{option}={paths[option]}")
+            skip_value = '=' not in token
+        elif option not in UNLOGGED_OPTIONS:
+            kept.append(token)
+        elif '=' not in token:
+            takes_value = UNLOGGED_OPTIONS[option]
+            next_is_value = i + 1 < len(argv) and not argv[i + 1].startswith('-')
+            skip_value = takes_value or (takes_value is None and next_is_value)
+    return kept
+
+
+def append_query_log(log_file: str, entry: dict):
+    """Append one query as a JSON line; a log that cannot be written never fails the query itself"""
+    import json
+    try:
+        with open(log_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError as e:
+        print(f"Warning: could not write the query log {log_file}: {e}", file=sys.stderr)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Find shortest breeding paths between Palworld Pals",
@@ -513,6 +2500,53 @@ Examples:
   # Find paths from parent to target child
   python shortest_breeding_path.py -p1 "Lamball" -c "Anubis"
   python shortest_breeding_path.py -p2 "Cattiva" -c "Jetragon"
+  
+  # Constrain the paths (excluded/required Pals are comma-separated)
+  python shortest_breeding_path.py -p1 "Lamball" -c "Anubis" --exclude "Jetragon,Frostallion" --max-steps 3
+  
+  # Bound the search memory for very deep or wide queries
+  python shortest_breeding_path.py -p1 "Lamball" -c "Anubis" --beam-width 200 --max-frontier-mb 64
+  
+  # Use the iterative-deepening engine (same output, only the current path held in memory)
+  python shortest_breeding_path.py -p1 "Lamball" -c "Anubis" --engine iddfs
+  
+  # Export a large route guide using four processes
+  python shortest_breeding_path.py -p1 "Lamball" -c "Anubis" --engine iddfs --max-paths 100000 --workers 4
+  
+  # Expand whole breeding levels as NumPy vectors (optional dependency, pays off on large rosters)
+  python shortest_breeding_path.py -p1 "Lamball" -c "Anubis" --engine numpy
+  
+  # Add the Pareto front over steps and per-Pal costs, e.g.
+  # {"objectives": {"rarity": "partner", "incubation": "child"}, "costs": {"Lamball": {"rarity": 1, "incubation": 60}}}
+  python shortest_breeding_path.py -p1 "Lamball" -c "Anubis" --costs costs.json
+  
+  # Plan every breeding needed for a target (including missing partners) from the Pals you own
+  python shortest_breeding_path.py -c "Anubis" --inventory "Lamball,Cattiva,Chikipi" --plan
+  
+  # Parent pairs for a child, those using Pals you own first, 20 at a time
+  python shortest_breeding_path.py -c "Anubis" --inventory "Lamball,Cattiva" --offset 0 --limit 20
+  
+  # Capture hot spots and memory of a slow query (inspect with: python -m pstats slow.prof)
+  python shortest_breeding_path.py -p1 "Lamball" -c "Anubis" --json --profile-out slow.prof --trace-memory slow-memory.txt
+  
+  # Record queries (also via $BREEDING_PATH_QUERY_LOG) and replay them later as a benchmark
+  python shortest_breeding_path.py -p1 "Lamball" -c "Anubis" --json --query-log queries.jsonl
+  python benchmarks/replay_query_log.py queries.jsonl
+  
+  # Export the lookup tables the app reads instead of parsing the CSV
+  python shortest_breeding_path.py --export-index
+  
+  # Everything you can breed right now from the Pals you own
+  python shortest_breeding_path.py --inventory "Lamball,Cattiva,Chikipi" --breedable
+  
+  # Plan a whole collection at once, breeding shared intermediates only once
+  python shortest_breeding_path.py --targets "Anubis,Penking,Relaxaurus" --inventory "Lamball,Cattiva,Chikipi" --plan
+  
+  # Paths from one parent to several targets with a single shared search
+  python shortest_breeding_path.py -p1 "Lamball" --targets "Anubis,Penking,Relaxaurus"
+  
+  # Everything reachable from a parent within 2 breedings, with route counts
+  python shortest_breeding_path.py -p1 "Lamball" --radius 2
         """
     )
     
@@ -521,38 +2555,321 @@ Examples:
     parser.add_argument('-c', '--child', type=str, help='Target child Pal name')
     parser.add_argument('--csv', type=str, default='palworld_breeding_combinations.csv',
                        help='Path to breeding combinations CSV file')
+    parser.add_argument('--profile-out', type=str, default=None,
+                       help='Write a cProfile stats file for the whole run to this path')
+    parser.add_argument('--trace-memory', type=str, nargs='?', const='', default=None,
+                       help='Report the top tracemalloc allocation sites and peak memory (to this file, or stderr)')
+    parser.add_argument('--progress', action='store_true',
+                       help='Print "PROGRESS: settled/total" lines (plus PROGRESS_DETAIL lines) during path searches; '
+                            'they go to stderr, so the result on stdout stays parseable')
+    parser.add_argument('--stats', action='store_true',
+                       help='With --json: add phase timings and search counters to the result as "stats"')
+    parser.add_argument('--query-log', type=str, default=os.environ.get(QUERY_LOG_ENV),
+                       help=f'With --json: append mode, arguments, dataset hash, result size and timings of this '
+                            f'query to a JSONL file (default: ${QUERY_LOG_ENV}); replay it with '
+                            f'benchmarks/replay_query_log.py')
+    parser.add_argument('--export-index', type=str, nargs='?', const='', default=None,
+                       help='Write the compact lookup tables used by the frontend (default: next to the CSV) and exit')
     parser.add_argument('--json', action='store_true', 
                        help='Output results in JSON format (for UI integration)')
     parser.add_argument('--max-paths', type=int, default=20,
                        help='Maximum number of paths to find (default: 20)')
     parser.add_argument('--max-seconds', type=float, default=None,
                        help='Maximum time (in seconds) to search for paths (overrides max-paths if set)')
+    parser.add_argument('--exclude', type=str, default=None,
+                       help='Comma-separated Pals that may not appear in a path (e.g. legendaries you cannot catch)')
+    parser.add_argument('--require', type=str, default=None,
+                       help='Comma-separated Pals that must appear somewhere in a path')
+    parser.add_argument('--max-steps', type=int, default=None,
+                       help='Maximum number of breeding steps in a path')
+    parser.add_argument('--beam-width', type=int, default=None,
+                       help='Bounded-frontier search: keep only this many partial paths per step (results may not be exhaustive)')
+    parser.add_argument('--max-frontier-mb', type=float, default=None,
+                       help='Bounded-frontier search: memory ceiling (in MB) for the partial paths held by the search')
+    parser.add_argument('--radius', type=int, default=None,
+                       help='With -p1/-p2 only: list every Pal reachable within this many breedings')
+    parser.add_argument('--inventory', type=str, default=None,
+                       help='Comma-separated Pals you already own (used by --plan, --breedable and -c alone)')
+    parser.add_argument('--owned-parents', type=str, choices=['one', 'both'], default='one',
+                       help='With -c alone and --inventory: keep pairs with at least one (default) or both parents owned')
+    parser.add_argument('--offset', type=int, default=0,
+                       help='With -c alone: number of ranked parent pairs to skip')
+    parser.add_argument('--limit', type=int, default=None,
+                       help='With -c alone: maximum number of parent pairs to return (default all)')
+    parser.add_argument('--plan', action='store_true',
+                       help='With -c (or --targets) and --inventory: plan every breeding needed, including missing partners')
+    parser.add_argument('--breedable', action='store_true',
+                       help='With --inventory only: list every child one breeding away from the Pals you own')
+    parser.add_argument('--targets', type=str, default=None,
+                       help='Comma-separated target Pals: with -p1/-p2, paths to each from one shared search; '
+                            'with --plan, one combined schedule for the whole collection')
+    parser.add_argument('--costs', type=str, default=None,
+                       help='JSON file of per-Pal cost vectors; adds the Pareto front over steps and those costs')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Enumerate paths in this many processes (for large --max-paths; same paths, same order)')
+    parser.add_argument('--engine', type=str, choices=['auto', 'bfs', 'iddfs', 'bidirectional', 'numpy'], default='auto',
+                       help='Search engine: chosen per query (default), breadth-first, iterative-deepening DFS '
+                            'with O(depth) memory, bidirectional, or vectorized levels (needs NumPy)')
     
     args = parser.parse_args()
+    # Negative values would slice from the end of the ranked pairs and break paging
+    if args.offset < 0:
+        parser.error("--offset must be 0 or more")
+    if args.limit is not None and args.limit < 0:
+        parser.error("--limit must be 0 or more")
+    
+    with profiling_hooks(args.profile_out, args.trace_memory):
+        # Hold on to the finder until the block ends, so the memory report still sees its tables
+        _finder = run_query(args, parser)
+
+
+def install_cancel_handlers(finder: BreedingPathFinder):
+    """Turn SIGINT and SIGTERM (and Ctrl+Break on Windows) into a cooperative cancel of the finder's search.
+    
+    The search stops at its next node and the result is still printed, marked partial. Workers of a parallel
+    enumeration are terminated, since SIGTERM only reaches this process. A second signal exits at once.
+    """
+    import signal
+    
+    def handle(signum, frame):
+        if finder.cancelled:
+            sys.exit(128 + signum)
+        finder.cancel(signal.Signals(signum).name)
+        # A process pool can only exist once --workers has imported multiprocessing
+        if "multiprocessing" in sys.modules:
+            for worker in sys.modules["multiprocessing"].active_children():
+                worker.terminate()
     
+    for name in ("SIGINT", "SIGTERM", "SIGBREAK"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), handle)
+
+
+@contextmanager
+def profiling_hooks(profile_out: Optional[str] = None, trace_memory: Optional[str] = None):
+    """Profile everything run inside the block.
+    
+    profile_out receives a cProfile stats file (read it with `python -m pstats`). trace_memory enables
+    tracemalloc and writes the top allocation sites and the peak to that file, or to stderr when it is
+    empty, since stdout carries the JSON result. Both reports are written even when the run exits early.
+    """
+    profiler = None
+    if trace_memory is not None:
+        import tracemalloc
+        tracemalloc.start(TRACE_MEMORY_FRAMES)
+    if profile_out:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_out)
+        if trace_memory is not None:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            lines = [f"tracemalloc: current {current / 2 ** 20:.1f} MB, peak {peak / 2 ** 20:.1f} MB",
+                     f"Top {TRACE_MEMORY_TOP} allocation sites:"]
+            for stat in snapshot.statistics('lineno')[:TRACE_MEMORY_TOP]:
+                lines.append(f"  {stat.size / 1024:10.1f} KiB  {stat.count:8d} blocks  {stat.traceback}")
+            if trace_memory:
+                with open(trace_memory, 'w', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+            else:
+                print("\n".join(lines), file=sys.stderr)
+
+
+def run_query(args: argparse.Namespace, parser: argparse.ArgumentParser) -> "BreedingPathFinder":
+    """Validate the parsed command line, run the requested mode and return the finder used"""
     # Validate arguments
     provided_args = sum([bool(args.parent1), bool(args.parent2), bool(args.child)])
     
-    if provided_args != 2:
+    if args.export_index is not None:
+        if provided_args:
+            print("Error: --export-index takes no -p1/-p2/-c")
+            parser.print_help()
+            sys.exit(1)
+    elif args.plan:
+        if bool(args.child) == bool(args.targets) or args.parent1 or args.parent2 or not args.inventory:
+            print("Error: --plan needs --inventory and either -c or --targets (and no parents)")
+            parser.print_help()
+            sys.exit(1)
+    elif args.breedable:
+        if provided_args or not args.inventory:
+            print("Error: --breedable needs --inventory (and no -p1/-p2/-c)")
+            parser.print_help()
+            sys.exit(1)
+    elif args.radius is not None:
+        if args.child or bool(args.parent1) == bool(args.parent2):
+            print("Error: --radius needs exactly one of -p1/-p2 (and no -c)")
+            parser.print_help()
+            sys.exit(1)
+    elif args.targets:
+        if args.child or bool(args.parent1) == bool(args.parent2):
+            print("Error: --targets needs exactly one of -p1/-p2 (and no -c)")
+            parser.print_help()
+            sys.exit(1)
+        # The shared multi-target search only supports exclusions, a step bound and the level engines
+        unsupported = [option for option, value in (("--require", args.require), ("--beam-width", args.beam_width),
+                                                    ("--max-frontier-mb", args.max_frontier_mb),
+                                                    ("--workers", args.workers), ("--costs", args.costs))
+                       if value is not None]
+        if unsupported:
+            print(f"Error: --targets does not support {', '.join(unsupported)}")
+            sys.exit(1)
+    elif provided_args != 2 and not (provided_args == 1 and args.child):
         print("Error: Exactly two arguments must be provided")
         print("   Use -p1 and -p2 to find child from parents")
         print("   Use -p1/-p2 and -c to find breeding paths")
+        print("   Use -c alone to list the parent pairs of a child")
         parser.print_help()
         sys.exit(1)
     
     # Initialize the path finder
+    load_started = time.perf_counter()
     finder = BreedingPathFinder(args.csv, json_mode=args.json)
+    finder.progress = args.progress
+    load_seconds = time.perf_counter() - load_started
+    install_cancel_handlers(finder)
     
     if len(finder.all_pals) == 0:
         if not args.json:
             print("❌ No breeding data found. Please run the scraper first.")
         sys.exit(1)
     
+    search_options = {
+        "exclude": parse_pal_list(args.exclude),
+        "require": parse_pal_list(args.require),
+        "max_steps": args.max_steps,
+        "beam_width": args.beam_width,
+        "max_frontier_mb": args.max_frontier_mb,
+        "engine": args.engine,
+        "workers": args.workers
+    }
+    
+    pareto_costs = None
+    if args.costs:
+        try:
+            pareto_costs = finder.load_cost_vectors(args.costs)
+        except (OSError, ValueError) as e:
+            # json.JSONDecodeError is a ValueError, so a malformed file lands here too
+            message = f"Could not load the cost file {args.costs}: {e}"
+            if args.json:
+                import json
+                print(json.dumps({"success": False, "message": message}, indent=2))
+            else:
+                print(f"Error: {message}")
+            sys.exit(1)
+    
+    def print_json(result: dict, mode: str):
+        """Print a JSON result, adding the --stats object when requested and marking cancelled results partial,
+        and record the query in the --query-log file"""
+        query_seconds = time.perf_counter() - query_started
+        import json
+        # A cancelled run prints compact JSON: indent makes json use its pure-Python encoder, about 10x slower
+        indent = 2
+        if finder.cancelled:
+            result["partial"] = True
+            result["cancelled_by"] = finder.cancelled
+            indent = None
+        serialization_started = time.perf_counter()
+        output = json.dumps(result, indent=indent)
+        serialization_seconds = time.perf_counter() - serialization_started
+        if args.stats:
+            # Appended to the serialized result, which can be megabytes of paths, instead of serializing it again
+            result["stats"] = finder.describe_stats(load_seconds, query_seconds, serialization_seconds)
+            output = append_json_member(output, "stats", result["stats"], indent)
+        print(output)
+        if args.query_log:
+            # Hand the result over before touching the log file
+            sys.stdout.flush()
+            logged_paths = {"--csv": os.path.abspath(finder.csv_file)}
+            if args.costs:
+                logged_paths["--costs"] = os.path.abspath(args.costs)
+            append_query_log(args.query_log, {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "mode": mode,
+                "argv": loggable_argv(sys.argv[1:], logged_paths),
+                "dataset_hash": finder.dataset_hash(),
+                "result_bytes": len(output.encode('utf-8')),
+                "result_digest": result_digest(result),
+                "total_paths": result.get("total_paths"),
+                "partial": bool(finder.cancelled),
+                "stats": finder.describe_stats(load_seconds, query_seconds, serialization_seconds)
+            })
+    
     # Execute the appropriate function based on provided arguments
-    if args.parent1 and args.parent2:
+    query_started = time.perf_counter()
+    if args.export_index is not None:
+        # Mode 9: Export the lookup tables for the frontend
+        output_file = finder.export_index(args.export_index)
+        if args.json:
+            print_json({"success": True, "output_file": output_file}, "export")
+        else:
+            print(f"Wrote lookup tables for {len(finder.pal_names)} Pals to {output_file}")
+        
+    elif args.plan and args.targets:
+        # Mode 5: Plan one combined schedule for a collection of targets
+        if args.json:
+            result = finder.plan_collection(parse_pal_list(args.targets), parse_pal_list(args.inventory),
+                                            search_options["exclude"])
+            print_json(result, "plan-collection")
+        else:
+            finder.print_collection_plan(parse_pal_list(args.targets), parse_pal_list(args.inventory),
+                                         search_options["exclude"])
+        
+    elif args.breedable:
+        # Mode 8: Everything breedable in one step from an inventory
+        if args.json:
+            result = finder.breedable_from(parse_pal_list(args.inventory))
+            print_json(result, "breedable")
+        else:
+            finder.print_breedable(parse_pal_list(args.inventory))
+        
+    elif args.radius is not None:
+        # Mode 7: Everything reachable from one parent within a number of breedings
+        start = args.parent1 or args.parent2
+        if args.json:
+            result = finder.find_neighbourhood(start, args.radius, search_options["exclude"], args.engine)
+            print_json(result, "radius")
+        else:
+            finder.print_neighbourhood(start, args.radius, search_options["exclude"], args.engine)
+        
+    elif args.targets:
+        # Mode 6: Paths from one parent to several targets, sharing one search
+        start = args.parent1 or args.parent2
+        if args.json:
+            result = finder.format_multi_target_paths(start, parse_pal_list(args.targets), args.max_paths,
+                                                      args.max_seconds, search_options["exclude"], args.max_steps,
+                                                      args.engine)
+            print_json(result, "targets")
+        else:
+            finder.print_multi_target_paths(start, parse_pal_list(args.targets), args.max_paths,
+                                            args.max_seconds, search_options["exclude"], args.max_steps, args.engine)
+        
+    elif args.plan:
+        # Mode 4: Plan every breeding needed for the target from an inventory
+        if args.json:
+            result = finder.plan_breeding(args.child, parse_pal_list(args.inventory), search_options["exclude"])
+            print_json(result, "plan")
+        else:
+            finder.print_breeding_plan(args.child, parse_pal_list(args.inventory), search_options["exclude"])
+        
+    elif provided_args == 1 and args.child:
+        # Mode 3: Every parent pair that breeds the child
+        inventory = parse_pal_list(args.inventory) if args.inventory else None
+        if args.json:
+            result = finder.find_parent_pairs(args.child, inventory, args.owned_parents, args.offset, args.limit)
+            print_json(result, "parent-pairs")
+        else:
+            finder.print_parent_pairs(args.child, inventory, args.owned_parents, args.offset, args.limit)
+        
+    elif args.parent1 and args.parent2:
         # Mode 1: Find child from two parents
         if args.json:
-            import json
             child = finder.find_child_from_parents(args.parent1, args.parent2)
             result = {
                 "success": bool(child),
@@ -560,28 +2877,38 @@ Examples:
                 "parent2": args.parent2,
                 "child": child if child else None
             }
-            print(json.dumps(result, indent=2))
+            print_json(result, "child")
         else:
             finder.print_breeding_result(args.parent1, args.parent2)
         
     elif args.parent1 and args.child:
         # Mode 2: Find paths from parent1 to child
         if args.json:
-            import json
-            result = finder.format_expandable_paths(args.parent1, args.child, args.max_paths, args.max_seconds)
-            print(json.dumps(result, indent=2))
+            result = finder.format_expandable_paths(args.parent1, args.child, args.max_paths, args.max_seconds,
+                                                    pareto_costs=pareto_costs, **search_options)
+            print_json(result, "paths")
         else:
-            finder.print_shortest_paths(args.parent1, args.child)
+            finder.print_shortest_paths(args.parent1, args.child, args.max_paths, args.max_seconds,
+                                        pareto_costs=pareto_costs, **search_options)
         
     elif args.parent2 and args.child:
-        # Mode 3: Find paths from parent2 to child  
+        # Mode 2: Find paths from parent2 to child
         if args.json:
-            import json
-            result = finder.format_expandable_paths(args.parent2, args.child, args.max_paths, args.max_seconds)
-            print(json.dumps(result, indent=2))
+            result = finder.format_expandable_paths(args.parent2, args.child, args.max_paths, args.max_seconds,
+                                                    pareto_costs=pareto_costs, **search_options)
+            print_json(result, "paths")
         else:
-            finder.print_shortest_paths(args.parent2, args.child)
+            finder.print_shortest_paths(args.parent2, args.child, args.max_paths, args.max_seconds,
+                                        pareto_costs=pareto_costs, **search_options)
+    
+    if finder.cancelled and not args.json:
+        print(f"\n⚠️  Search cancelled ({finder.cancelled}); the results above are partial")
+    return finder
 
 
 if __name__ == "__main__":
+    if getattr(sys, 'frozen', False):
+        # Needed for the --workers process pool inside PyInstaller binaries
+        import multiprocessing
+        multiprocessing.freeze_support()
     main()
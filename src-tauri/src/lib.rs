@@ -28,6 +28,50 @@ fn read_breeding_csv() -> Result<String, String> {
         .map_err(|e| format!("Failed to read CSV file: {}", e))
 }
 
+#[tauri::command]
+fn read_breeding_index() -> Result<String, String> {
+    use std::fs;
+    use std::path::Path;
+    
+    // Written by `shortest_breeding_path.py --export-index`; a missing or stale index makes the
+    // frontend fall back to parsing the CSV
+    let index_path = Path::new("palworld_breeding_index.json");
+    if !index_path.exists() {
+        return Err("Breeding index file not found".to_string());
+    }
+    
+    let csv_path = Path::new("palworld_breeding_combinations.csv");
+    if let (Ok(index_meta), Ok(csv_meta)) = (fs::metadata(index_path), fs::metadata(csv_path)) {
+        if let (Ok(index_time), Ok(csv_time)) = (index_meta.modified(), csv_meta.modified()) {
+            if index_time < csv_time {
+                return Err("Breeding index is older than the CSV file".to_string());
+            }
+        }
+    }
+    
+    fs::read_to_string(index_path)
+        .map_err(|e| format!("Failed to read index file: {}", e))
+}
+
+// Parse a progress update in format "PROGRESS: current/total" and emit it to the frontend;
+// returns whether the line was one
+fn emit_progress(app: &tauri::AppHandle, script: &str, label: &str, output: &str) -> Result<bool, String> {
+    if let Some(captures) = output.strip_prefix("PROGRESS: ") {
+        if let Some((current_str, max_str)) = captures.split_once('/') {
+            if let (Ok(current), Ok(max)) = (current_str.parse::<i32>(), max_str.parse::<i32>()) {
+                app.emit("sidecar-progress", serde_json::json!({
+                    "script": script,
+                    "label": label,
+                    "current": current,
+                    "max": max
+                })).map_err(|e| format!("Failed to emit progress event: {}", e))?;
+                return Ok(true);
+            }
+        }
+    }
+    Ok(false)
+}
+
 #[tauri::command]
 async fn run_sidecar_with_progress(
     app: tauri::AppHandle,
@@ -59,20 +103,7 @@ async fn run_sidecar_with_progress(
                 let line = String::from_utf8_lossy(&line_bytes);
                 let output = line.trim();
                 
-                // Parse progress updates in format "PROGRESS: current/total"
-                if let Some(captures) = output.strip_prefix("PROGRESS: ") {
-                    if let Some((current_str, max_str)) = captures.split_once('/') {
-                        if let (Ok(current), Ok(max)) = (current_str.parse::<i32>(), max_str.parse::<i32>()) {
-                            // Emit progress event to frontend
-                            app.emit("sidecar-progress", serde_json::json!({
-                                "script": script,
-                                "label": label,
-                                "current": current,
-                                "max": max
-                            })).map_err(|e| format!("Failed to emit progress event: {}", e))?;
-                        }
-                    }
-                }
+                emit_progress(&app, &script, &label, output)?;
                 
                 // Also emit raw output for debugging
                 app.emit("sidecar-output", serde_json::json!({
@@ -84,6 +115,16 @@ async fn run_sidecar_with_progress(
                 let line = String::from_utf8_lossy(&line_bytes);
                 let error = line.trim();
                 
+                // The path finder reports progress on stderr, keeping its stdout a single JSON document;
+                // those lines are output, not errors
+                if emit_progress(&app, &script, &label, error)? || error.starts_with("PROGRESS_DETAIL: ") {
+                    app.emit("sidecar-output", serde_json::json!({
+                        "script": script,
+                        "output": error
+                    })).map_err(|e| format!("Failed to emit output event: {}", e))?;
+                    continue;
+                }
+                
                 // Emit error output
                 app.emit("sidecar-error", serde_json::json!({
                     "script": script,
@@ -118,7 +159,7 @@ pub fn run() {
         .plugin(tauri_plugin_opener::init())
         .plugin(tauri_plugin_fs::init())
         .plugin(tauri_plugin_shell::init())
-        .invoke_handler(tauri::generate_handler![greet, get_pal_list, read_breeding_csv, run_sidecar_with_progress])
+        .invoke_handler(tauri::generate_handler![greet, get_pal_list, read_breeding_csv, read_breeding_index, run_sidecar_with_progress])
         .run(tauri::generate_context!())
         .expect("error while running tauri application");
 }
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regression tests for the breeding path finder
+
+Checks that every search engine returns the same shortest paths as BFS, on the real breeding CSV and on a
+synthetic roster, that excluded and required Pals are honoured, that breeding plans only use Pals that are
+owned or bred earlier, and which engine plan_query picks for characteristic queries.
+
+Usage:
+    python -m unittest discover src-tauri/tests
+    python -m pytest src-tauri/tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+SIDECAR_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SIDECAR_DIR)
+sys.path.insert(0, os.path.join(SIDECAR_DIR, "benchmarks"))
+
+from shortest_breeding_path import (LAZY_TABLES, QUERY_LOG_ENV, BreedingPathFinder, append_json_member, dataset_hash,
+                                    loggable_argv, numpy_available, result_digest)
+from generate_breeding_table import generate_breeding_table, write_breeding_csv
+
+ENGINES = ["iddfs", "bidirectional"] + (["numpy"] if numpy_available() else [])
+
+# Pairs whose full set of shortest paths BFS enumerates in well under a second
+REAL_PAIRS = [("Chikipi", "Penking"), ("Foxparks", "Relaxaurus"), ("Depresso", "Lovander"), ("Mau", "Lamball")]
+
+
+def path_pals(path):
+    """Every Pal in a path: the start, then both parents and the child of each "A + B = C" step"""
+    pals = {path[0]}
+    for step in path[1:]:
+        parents, child = step.split(" = ")
+        pals.update(parents.split(" + "))
+        pals.add(child)
+    return pals
+
+
+class FinderTestCase(unittest.TestCase):
+    finder = None
+
+    def find(self, start, target, engine, **options):
+        """All shortest paths as a sorted list of tuples, from a cold finder"""
+        self.finder.clear_caches()
+        paths = self.finder.find_shortest_paths(start, target, 0, 30, engine=engine, **options)
+        self.assertFalse(self.finder.search_stats["time_limited"], f"{engine} {start} -> {target} timed out")
+        return sorted(map(tuple, paths))
+
+
+class RealDataTests(FinderTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.finder = BreedingPathFinder(json_mode=True)
+
+    def test_index_tables_are_built_on_first_use(self):
+        finder = BreedingPathFinder(json_mode=True)
+        self.assertEqual(finder.find_child_from_parents("Lamball", "Cattiva"),
+                         self.finder.find_child_from_parents("Lamball", "Cattiva"))
+        self.assertFalse(set(LAZY_TABLES) & set(vars(finder)))
+        self.assertEqual(finder.find_parent_pairs("Anubis"), self.finder.find_parent_pairs("Anubis"))
+        self.assertNotIn("breeding_edges", vars(finder))
+        self.assertEqual(finder.find_shortest_paths("Lamball", "Anubis"),
+                         self.finder.find_shortest_paths("Lamball", "Anubis"))
+        self.assertTrue(set(LAZY_TABLES) <= set(vars(finder)))
+
+    def test_engines_match_bfs(self):
+        for start, target in REAL_PAIRS:
+            expected = self.find(start, target, "bfs")
+            self.assertTrue(expected, f"{start} -> {target} has paths")
+            for engine in ENGINES:
+                with self.subTest(start=start, target=target, engine=engine):
+                    self.assertEqual(self.find(start, target, engine), expected)
+
+    def test_excluded_pals_never_appear(self):
+        unconstrained = self.find("Lamball", "Anubis", "iddfs")
+        # Exclude a Pal used by some (not all) of the shortest paths
+        used = [pal for pal in sorted(set().union(*map(path_pals, unconstrained)) - {"Lamball", "Anubis"})
+                if not all(pal in path_pals(path) for path in unconstrained)]
+        excluded = used[0]
+        for engine in ["bfs"] + ENGINES:
+            with self.subTest(engine=engine):
+                paths = self.find("Lamball", "Anubis", engine, exclude=[excluded])
+                self.assertTrue(paths)
+                self.assertTrue(all(excluded not in path_pals(path) for path in paths))
+
+    def test_required_pals_always_appear(self):
+        expected = self.find("Lamball", "Anubis", "iddfs", require=["Jetragon"])
+        self.assertTrue(expected)
+        self.assertTrue(all("Jetragon" in path_pals(path) for path in expected))
+        self.assertEqual(self.find("Lamball", "Anubis", "bfs", require=["Jetragon"]), expected)
+
+    def test_two_required_pals_are_answered_at_once(self):
+        # Used to run for minutes: per-required-Pal distances now bound the deepening
+        started = time.perf_counter()
+        paths = self.find("Azurobe", "Jolthog Cryst", "iddfs", require=["Whalaska Ignis", "Pyrin Noct"])
+        self.assertLess(time.perf_counter() - started, 2.0)
+        self.assertTrue(paths)
+        self.assertTrue(all({"Whalaska Ignis", "Pyrin Noct"} <= path_pals(path) for path in paths))
+
+    def test_timed_out_search_is_not_reported_as_no_path(self):
+        self.finder.clear_caches()
+        result = self.finder.format_expandable_paths("Lamball", "Anubis", 20, 1e-6, require=["Jetragon"])
+        self.assertFalse(result["success"])
+        self.assertIn("timed out", result["message"])
+        self.assertTrue(result["search"]["time_limited"])
+
+    def test_excluded_route_is_answered_at_once(self):
+        # Every route runs through the excluded Pals; BFS used to search until the time limit
+        for engine in ["bfs"] + ENGINES:
+            with self.subTest(engine=engine):
+                started = time.perf_counter()
+                self.assertEqual(self.find("Anubis", "Azurobe Cryst", engine, exclude=["Azurobe", "Frostplume"]), [])
+                self.assertLess(time.perf_counter() - started, 1.0)
+
+    def test_bfs_with_exclusions_stops_at_the_shortest_distance(self):
+        # BFS used to expand every prefix up to the step limit (about 26 s)
+        started = time.perf_counter()
+        paths = self.find("Grizzbolt", "Mau Cryst", "bfs", exclude=["Lyleen"])
+        self.assertLess(time.perf_counter() - started, 2.0)
+        self.assertEqual(paths, self.find("Grizzbolt", "Mau Cryst", "iddfs", exclude=["Lyleen"]))
+
+    def test_unreachable_pairs_return_no_paths(self):
+        for engine in ["bfs"] + ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(self.find("Lamball", "Jetragon", engine), [])
+                self.assertTrue(self.finder.last_search_info.get("unreachable"))
+
+    def test_breeding_plan_only_uses_available_pals(self):
+        inventory = ["Lamball", "Cattiva", "Chikipi", "Foxparks", "Depresso", "Penking"]
+        plan = self.finder.plan_breeding("Anubis", inventory)
+        self.assertTrue(plan["success"])
+        available = set(inventory)
+        for step in plan["steps"]:
+            self.assertIn(step["parent1"], available)
+            self.assertIn(step["parent2"], available)
+            self.assertEqual(self.finder.find_child_from_parents(step["parent1"], step["parent2"]), step["result"])
+            available.add(step["result"])
+        self.assertIn("Anubis", available)
+
+    def test_text_output_honours_max_paths(self):
+        expected = len(self.find("Lamball", "Anubis", "iddfs"))
+        self.assertGreater(expected, 20)
+        output = io.StringIO()
+        self.finder.json_mode = False
+        try:
+            with contextlib.redirect_stdout(output):
+                self.finder.print_shortest_paths("Lamball", "Anubis", 0, 30, engine="iddfs")
+                self.finder.print_shortest_paths("Lamball", "Anubis", 5, 30, engine="iddfs")
+        finally:
+            self.finder.json_mode = True
+        counts = [block.count("\nPath ") + block.startswith("Path ") for block in output.getvalue().split("Found ")[1:]]
+        self.assertEqual(counts, [expected, 5])
+
+    def test_workers_return_the_serial_paths_in_order(self):
+        for engine in ("iddfs", "bidirectional"):
+            for start, target, max_paths in (("Lamball", "Anubis", 0), ("Lamball", "Anubis", 50),
+                                             ("Chikipi", "Penking", 0)):
+                with self.subTest(engine=engine, start=start, target=target, max_paths=max_paths):
+                    serial = self.finder.find_shortest_paths(start, target, max_paths=max_paths, engine=engine)
+                    parallel = self.finder.find_shortest_paths(start, target, max_paths=max_paths, engine=engine,
+                                                               workers=2)
+                    self.assertEqual(parallel, serial)
+
+    def test_ignored_workers_are_reported(self):
+        self.find("Lamball", "Anubis", "bfs", workers=2)
+        self.assertTrue(self.finder.last_search_info["workers"].startswith("ignored"))
+
+    def test_unknown_constraint_names_are_rejected(self):
+        finder = self.finder
+        results = {
+            "paths": finder.format_expandable_paths("Lamball", "Anubis", exclude=["Jetragn"]),
+            "required": finder.format_expandable_paths("Lamball", "Anubis", require=["Jetragn"]),
+            "radius": finder.find_neighbourhood("Lamball", 2, exclude=["Jetragn"]),
+            "plan": finder.plan_breeding("Anubis", ["Lamball", "Cattiva"], exclude=["Jetragn"]),
+            "collection": finder.plan_collection(["Anubis", "Penking"], ["Lamball", "Cattiva"], exclude=["Jetragn"])
+        }
+        for mode, result in results.items():
+            with self.subTest(mode=mode):
+                self.assertFalse(result["success"])
+                self.assertIn("Jetragn", result["message"])
+                self.assertIn("Jetragn", next(iter(result["suggestions"].values())))
+        self.assertEqual(finder.find_shortest_paths("Lamball", "Anubis", exclude=["Jetragn"]), [])
+
+    def test_targets_reject_unknown_exclusions(self):
+        result = self.finder.format_multi_target_paths("Lamball", ["Anubis", "Penking"], exclude=["Nosuchpal"])
+        self.assertFalse(result["success"])
+        self.assertIn("Nosuchpal", result["message"])
+        self.assertEqual(self.finder.find_paths_to_targets("Lamball", ["Anubis"], exclude=["Nosuchpal"]), {})
+
+    def test_targets_report_unknown_names(self):
+        result = self.finder.format_multi_target_paths("Lamball", ["Anubis", "Nosuchpal"])
+        self.assertTrue(result["targets"]["Anubis"]["success"])
+        self.assertFalse(result["targets"]["Nosuchpal"]["success"])
+        self.assertIn("suggestions", result["targets"]["Nosuchpal"])
+        result = self.finder.format_multi_target_paths("Lamball", ["Nosuchpal"])
+        self.assertFalse(result["success"])
+        self.assertEqual(list(result["targets"]), ["Nosuchpal"])
+        self.assertFalse(self.finder.format_multi_target_paths("Nosuchpal", ["Anubis"])["success"])
+
+    def test_parent_pairs_paging(self):
+        everything = self.finder.find_parent_pairs("Anubis")
+        total = everything["total_pairs"]
+        self.assertGreater(total, 5)
+        self.assertFalse(everything["has_more"])
+        pages, offset = [], 0
+        while True:
+            page = self.finder.find_parent_pairs("Anubis", offset=offset, limit=4)
+            self.assertEqual(page["total_pairs"], total)
+            pages.extend(page["pairs"])
+            offset += 4
+            self.assertEqual(page["has_more"], offset < total)
+            if not page["has_more"]:
+                break
+        self.assertEqual(pages, everything["pairs"])
+        past_end = self.finder.find_parent_pairs("Anubis", offset=10 ** 6, limit=4)
+        self.assertEqual(past_end["pairs"], [])
+        self.assertFalse(past_end["has_more"])
+        self.assertEqual(self.finder.find_parent_pairs("Anubis", limit=0)["pairs"], [])
+        for offset, limit in ((-3, 2), (0, -1)):
+            with self.subTest(offset=offset, limit=limit):
+                with self.assertRaises(ValueError):
+                    self.finder.find_parent_pairs("Anubis", offset=offset, limit=limit)
+
+    def test_breedable_matches_child_lookup(self):
+        inventory = ["Lamball", "Cattiva", "Penking", "Foxparks", "Chikipi", "Jetragon"]
+        result = self.finder.breedable_from(inventory + ["Nosuchpal"])
+        self.assertEqual(result["unknown_inventory"], ["Nosuchpal"])
+        owned = result["inventory"]
+        self.assertEqual(sorted(owned), sorted(inventory))
+        expected = {}
+        for i, parent1 in enumerate(owned):
+            for parent2 in owned[i:]:
+                child = self.finder.find_child_from_parents(parent1, parent2)
+                if child:
+                    expected.setdefault(child, []).append([parent1, parent2])
+        self.assertEqual({entry["child"]: entry["pairs"] for entry in result["children"]}, expected)
+        names = [entry["child"] for entry in result["children"]]
+        for i, parent1 in enumerate(owned):
+            for j, parent2 in enumerate(owned):
+                child = self.finder.find_child_from_parents(parent1, parent2)
+                self.assertEqual(result["matrix"][i][j], names.index(child) if child else -1)
+        self.assertEqual(result["new_children"], len(set(names) - set(inventory)))
+
+    def write_costs(self, contents):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cost_file = os.path.join(temp_dir.name, "costs.json")
+        with open(cost_file, "w", encoding="utf-8") as f:
+            f.write(contents)
+        return cost_file
+
+    def test_pareto_front(self):
+        rng = random.Random(5)
+        costs = {name: {"rarity": rng.randint(1, 10), "incubation": rng.randint(1, 10)}
+                 for name in self.finder.pal_names}
+        cost_file = self.write_costs(json.dumps({"objectives": {"rarity": "partner", "incubation": "child"},
+                                                 "costs": costs}))
+        cost_vectors = self.finder.load_cost_vectors(cost_file)
+        front = self.finder.find_pareto_paths("Lamball", "Anubis", cost_vectors)
+        self.assertTrue(front)
+        labels = [tuple(label[key] for key in ("steps", "incubation", "rarity")) for label, _ in front]
+        for i, label in enumerate(labels):
+            for j, other in enumerate(labels):
+                if i != j:
+                    self.assertFalse(all(a <= b for a, b in zip(other, label)), f"{other} dominates {label}")
+        shortest = len(self.finder.find_shortest_paths("Lamball", "Anubis", max_paths=1)[0]) - 1
+        self.assertEqual(min(label[0] for label in labels), shortest)
+        for label, path in front:
+            steps = [step.split(" = ") for step in path[1:]]
+            self.assertEqual(label["steps"], len(steps))
+            self.assertEqual(label["rarity"], sum(costs[parents.split(" + ")[1]]["rarity"] for parents, _ in steps))
+            self.assertEqual(label["incubation"], sum(costs[child]["incubation"] for _, child in steps))
+
+    def test_bad_cost_files_are_reported(self):
+        bad_files = {
+            "missing": os.path.join(tempfile.gettempdir(), "no-such-costs.json"),
+            "malformed": self.write_costs("{not json"),
+            "wrong shape": self.write_costs('{"costs": ["Lamball"]}'),
+            "not a number": self.write_costs('{"costs": {"Lamball": {"rarity": "high"}}}'),
+        }
+        for problem, cost_file in bad_files.items():
+            with self.subTest(problem=problem):
+                with self.assertRaises((OSError, ValueError)):
+                    self.finder.load_cost_vectors(cost_file)
+                completed = subprocess.run([sys.executable, os.path.join(SIDECAR_DIR, "shortest_breeding_path.py"),
+                                            "--csv", self.finder.csv_file, "-p1", "Lamball", "-c", "Anubis",
+                                            "--costs", cost_file, "--json"],
+                                           capture_output=True, text=True, timeout=60)
+                self.assertEqual(completed.returncode, 1)
+                result = json.loads(completed.stdout)
+                self.assertFalse(result["success"])
+                self.assertIn(cost_file, result["message"])
+
+    def plan(self, start, target, **options):
+        finder = self.finder
+        finder.clear_caches()
+        start_id, target_id = finder.pal_ids[start], finder.pal_ids[target]
+        settings = {"exclude_mask": 0, "require_mask": 0, "max_paths": 20, "max_seconds": None, "max_steps": None,
+                    "beam_width": None, "max_frontier_mb": None}
+        settings.update(options)
+        return finder.plan_query(start_id, target_id, **settings)
+
+    def test_plan_query_choices(self):
+        # One step away: answered from the child matrix row
+        self.assertEqual(self.plan("Depresso", "Lovander")["engine"], "lookup")
+        # Bounded frontiers only exist in BFS
+        self.assertEqual(self.plan("Lamball", "Anubis", beam_width=100)["engine"], "bfs")
+        # Deep route guides must not go to BFS, which holds every path prefix
+        self.assertNotEqual(self.plan("Blazamut", "Teafant", max_paths=10000)["engine"], "bfs")
+        # Required Pals: the path estimates ignore them, and BFS took seconds where IDDFS takes milliseconds
+        jetragon = 1 << self.finder.pal_ids["Jetragon"]
+        self.assertEqual(self.plan("Lamball", "Anubis", require_mask=jetragon)["engine"], "iddfs")
+
+
+class SyntheticDataTests(FinderTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        csv_file = os.path.join(cls.temp_dir.name, "synthetic.csv")
+        write_breeding_csv(generate_breeding_table(80, fanout=8, structure="clustered", seed=3), csv_file)
+        cls.finder = BreedingPathFinder(csv_file, json_mode=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_engines_match_bfs_with_constraints(self):
+        rng = random.Random(7)
+        names = self.finder.pal_names
+        for _ in range(40):
+            start, target = rng.sample(names, 2)
+            exclude = [pal for pal in rng.sample(names, rng.randint(0, 3)) if pal not in (start, target)]
+            expected = self.find(start, target, "bfs", exclude=exclude)
+            for engine in ENGINES:
+                with self.subTest(start=start, target=target, exclude=exclude, engine=engine):
+                    self.assertEqual(self.find(start, target, engine, exclude=exclude), expected)
+
+    def test_required_pals_match_bfs(self):
+        rng = random.Random(11)
+        names = self.finder.pal_names
+        for _ in range(15):
+            start, target, required = rng.sample(names, 3)
+            with self.subTest(start=start, target=target, required=required):
+                expected = self.find(start, target, "bfs", require=[required], max_steps=6)
+                self.assertEqual(self.find(start, target, "iddfs", require=[required], max_steps=6), expected)
+                self.assertTrue(all(required in path_pals(path) for path in expected))
+
+
+
+class CommandLineTests(unittest.TestCase):
+    def test_stats_are_appended_as_json_would_lay_them_out(self):
+        stats = {"timings_ms": {"load": 1.5, "search": 2}, "search": {"nodes_expanded": 3}, "empty": {}}
+        for result in ({"success": True, "paths": [["Lamball", "Lamball + Cattiva = Foxparks"]]}, {"success": False}):
+            for indent in (None, 2):
+                with self.subTest(result=result, indent=indent):
+                    self.assertEqual(append_json_member(json.dumps(result, indent=indent), "stats", stats, indent),
+                                     json.dumps(dict(result, stats=stats), indent=indent))
+
+    def test_loggable_argv_keeps_only_what_decides_the_result(self):
+        argv = ["-p1", "Lamball", "--csv", "data.csv", "-c", "Anubis", "--stats", "--query-log", "q.jsonl",
+                "--profile-out=run.prof", "--trace-memory", "--progress", "--json", "--costs=costs.json",
+                "--trace-memory", "memory.txt"]
+        self.assertEqual(loggable_argv(argv, {"--csv": "/data/data.csv", "--costs": "/data/costs.json"}),
+                         ["-p1", "Lamball", "--csv=/data/data.csv", "-c", "Anubis", "--json",
+                          "--costs=/data/costs.json"])
+
+    def test_logged_queries_replay_from_another_directory(self):
+        script = os.path.join(SIDECAR_DIR, "shortest_breeding_path.py")
+        csv_file = os.path.join(SIDECAR_DIR, "palworld_breeding_combinations.csv")
+        environment = {key: value for key, value in os.environ.items() if key != QUERY_LOG_ENV}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, "queries.jsonl")
+            queries = [["-p1", "Lamball", "-c", "Anubis", "--max-paths", "5"], ["-c", "Anubis", "--limit", "3"],
+                       ["-p1", "Lamball", "-p2", "Cattiva"]]
+            for query in queries:
+                # A relative --csv, which only resolves from the directory the query was logged in
+                subprocess.run([sys.executable, script, "--csv", os.path.relpath(csv_file, temp_dir), "--json",
+                                "--stats", "--progress", "--query-log", log_file] + query,
+                               cwd=temp_dir, env=environment, capture_output=True, check=True, timeout=60)
+            with open(log_file, encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f]
+        self.assertEqual(len(entries), len(queries))
+        for entry in entries:
+            with self.subTest(argv=entry["argv"]):
+                self.assertIn(f"--csv={csv_file}", entry["argv"])
+                self.assertFalse({"--stats", "--progress", "--query-log"} & set(entry["argv"]))
+                self.assertEqual(entry["dataset_hash"], dataset_hash(csv_file))
+                completed = subprocess.run([sys.executable, script] + entry["argv"], env=environment,
+                                           capture_output=True, text=True, check=True, timeout=60)
+                self.assertEqual(result_digest(json.loads(completed.stdout)), entry["result_digest"])
+
+
+if __name__ == "__main__":
+    unittest.main()
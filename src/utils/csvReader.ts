@@ -4,8 +4,29 @@ export interface BreedingCombination {
   parent2: string;
 }
 
+// Layout of palworld_breeding_index.json; must match INDEX_FORMAT_VERSION in shortest_breeding_path.py
+const INDEX_FORMAT_VERSION = 1;
+
+interface ExportedIndex {
+  version: number;
+  source: string;
+  pals: string[];
+  child_matrix: number[];
+  parents: number[][];
+}
+
+interface BreedingIndex {
+  pals: string[];
+  palIds: Map<string, number>;
+  // Row-major pal x pal matrix of child IDs, -1 where the pair does not breed
+  childMatrix: Int32Array;
+  // parents[childId] is a flat list of parent ID pairs, each unordered pair once
+  parents: number[][];
+}
+
 export class CSVReader {
   private static breedingData: BreedingCombination[] | null = null;
+  private static index: BreedingIndex | null = null;
 
   static async loadBreedingData(): Promise<BreedingCombination[]> {
     if (this.breedingData) {
@@ -46,39 +67,96 @@ export class CSVReader {
     }
   }
 
+  // Lookup tables exported by `shortest_breeding_path.py --export-index`, built from the CSV as a fallback
+  static async loadIndex(): Promise<BreedingIndex> {
+    if (this.index) {
+      return this.index;
+    }
+
+    try {
+      if (!window.__TAURI__) {
+        throw new Error('Tauri APIs not available');
+      }
+      const indexContent = await window.__TAURI__.invoke('read_breeding_index') as string;
+      const exported = JSON.parse(indexContent) as ExportedIndex;
+      if (exported.version !== INDEX_FORMAT_VERSION) {
+        throw new Error(`Unsupported breeding index version ${exported.version}`);
+      }
+      this.index = {
+        pals: exported.pals,
+        palIds: new Map(exported.pals.map((pal, id) => [pal, id] as [string, number])),
+        childMatrix: Int32Array.from(exported.child_matrix),
+        parents: exported.parents
+      };
+    } catch (error) {
+      console.warn('Breeding index unavailable, building it from the CSV:', error);
+      const combinations = await this.loadBreedingData();
+      const index = this.buildIndex(combinations);
+      // An empty index is not cached, so the next call retries instead of finding nothing all session
+      if (combinations.length > 0) {
+        this.index = index;
+      }
+      return index;
+    }
+    return this.index;
+  }
+
+  private static buildIndex(combinations: BreedingCombination[]): BreedingIndex {
+    const pals = Array.from(new Set(combinations.flatMap(combo => [combo.child, combo.parent1, combo.parent2]))).sort();
+    const palIds = new Map(pals.map((pal, id) => [pal, id] as [string, number]));
+    const childMatrix = new Int32Array(pals.length * pals.length).fill(-1);
+    const parents: number[][] = pals.map(() => []);
+
+    for (const combo of combinations) {
+      const childId = palIds.get(combo.child)!;
+      const parent1Id = palIds.get(combo.parent1)!;
+      const parent2Id = palIds.get(combo.parent2)!;
+      const [low, high] = parent1Id <= parent2Id ? [parent1Id, parent2Id] : [parent2Id, parent1Id];
+      // Each unordered pair is listed once, even if the CSV has both orders
+      if (childMatrix[low * pals.length + high] < 0) {
+        parents[childId].push(low, high);
+      }
+      childMatrix[parent1Id * pals.length + parent2Id] = childId;
+      childMatrix[parent2Id * pals.length + parent1Id] = childId;
+    }
+    return { pals, palIds, childMatrix, parents };
+  }
+
   static async findChild(parent1: string, parent2: string): Promise<string | null> {
-    const combinations = await this.loadBreedingData();
-    
-    // Check both parent1+parent2 and parent2+parent1 combinations
-    const combination = combinations.find(
-      combo => 
-        (combo.parent1 === parent1 && combo.parent2 === parent2) ||
-        (combo.parent1 === parent2 && combo.parent2 === parent1)
-    );
-    
-    return combination ? combination.child : null;
+    const index = await this.loadIndex();
+    const parent1Id = index.palIds.get(parent1);
+    const parent2Id = index.palIds.get(parent2);
+    if (parent1Id === undefined || parent2Id === undefined) {
+      return null;
+    }
+
+    const childId = index.childMatrix[parent1Id * index.pals.length + parent2Id];
+    return childId >= 0 ? index.pals[childId] : null;
   }
 
   static async findParents(child: string): Promise<{ parent1: string; parent2: string }[]> {
-    const combinations = await this.loadBreedingData();
-    
-    return combinations
-      .filter(combo => combo.child === child)
-      .map(combo => ({ parent1: combo.parent1, parent2: combo.parent2 }));
+    const index = await this.loadIndex();
+    const childId = index.palIds.get(child);
+    if (childId === undefined) {
+      return [];
+    }
+
+    const pairs = index.parents[childId];
+    const result: { parent1: string; parent2: string }[] = [];
+    for (let i = 0; i < pairs.length; i += 2) {
+      result.push({ parent1: index.pals[pairs[i]], parent2: index.pals[pairs[i + 1]] });
+    }
+    return result;
   }
 
   static async getAllChildren(): Promise<string[]> {
-    const combinations = await this.loadBreedingData();
-    const children = new Set(combinations.map(combo => combo.child));
-    return Array.from(children).sort();
+    const index = await this.loadIndex();
+    return index.pals.filter((_, id) => index.parents[id].length > 0);
   }
 
   static async getAllParents(): Promise<string[]> {
-    const combinations = await this.loadBreedingData();
-    const parents = new Set([
-      ...combinations.map(combo => combo.parent1),
-      ...combinations.map(combo => combo.parent2)
-    ]);
-    return Array.from(parents).sort();
+    const index = await this.loadIndex();
+    const parentIds = new Set(index.parents.flat());
+    return index.pals.filter((_, id) => parentIds.has(id));
   }
-} 
\ No newline at end of file
+}